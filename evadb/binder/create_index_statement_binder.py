@@ -14,7 +14,13 @@
 # limitations under the License.
 from evadb.binder.binder_utils import BinderError, create_row_num_tv_expr
 from evadb.binder.statement_binder import StatementBinder
-from evadb.catalog.catalog_type import NdArrayType, VectorStoreType
+from evadb.catalog.catalog_type import (
+    ColumnType,
+    NdArrayType,
+    ScalarIndexType,
+    TableType,
+    VectorStoreType,
+)
 from evadb.expression.function_expression import FunctionExpression
 from evadb.parser.create_index_statement import CreateIndexStatement
 from evadb.third_party.databases.interface import get_database_handler
@@ -63,6 +69,34 @@ def bind_create_index(binder: StatementBinder, node: CreateIndexStatement):
         # underlying native storage engine.
         return
 
+    if isinstance(node.vector_store_type, ScalarIndexType):
+        # Scalar indexes are built by the database that stores the table.
+        table_ref_obj = node.table_ref.table.table_obj
+        if table_ref_obj.table_type != TableType.STRUCTURED_DATA:
+            raise BinderError(
+                f"{node.vector_store_type} index can only be created on structured tables."
+            )
+        if func_project_expr is not None:
+            raise BinderError(
+                f"{node.vector_store_type} index cannot be created on a function expression."
+            )
+        col_list = [
+            col for col in table_ref_obj.columns if col.name == node.col_list[0].name
+        ]
+        assert (
+            len(col_list) == 1
+        ), f"Index is created on non-existent column {node.col_list[0].name}"
+        if col_list[0].type not in [
+            ColumnType.BOOLEAN,
+            ColumnType.INTEGER,
+            ColumnType.FLOAT,
+            ColumnType.TEXT,
+        ]:
+            raise BinderError(
+                f"{node.vector_store_type} index can only be created on scalar columns."
+            )
+        return
+
     # Index can be only created on single column.
     assert (
         len(node.col_list) == 1
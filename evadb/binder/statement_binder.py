@@ -220,9 +220,10 @@ class StatementBinder:
     @bind.register(RenameTableStatement)
     def _bind_rename_table_statement(self, node: RenameTableStatement):
         self.bind(node.old_table_ref)
-        assert (
-            node.old_table_ref.table.table_obj.table_type != TableType.STRUCTURED_DATA
-        ), "Rename not yet supported on structured data"
+        assert node.old_table_ref.table.table_obj.table_type not in [
+            TableType.STRUCTURED_DATA,
+            TableType.COLUMNAR_DATA,
+        ], "Rename not yet supported on structured data"
 
     @bind.register(TableRef)
     def _bind_tableref(self, node: TableRef):
@@ -14,24 +14,29 @@
 # limitations under the License.
 import shutil
 from pathlib import Path
-from typing import List
+from typing import List, Union
 
 from evadb.catalog.catalog_type import (
     ColumnType,
+    ScalarIndexType,
     TableType,
     VectorStoreType,
     VideoColumnName,
 )
 from evadb.catalog.catalog_utils import (
+    bump_catalog_version,
     cleanup_storage,
     construct_function_cache_catalog_entry,
     get_document_table_column_definitions,
     get_image_table_column_definitions,
+    get_media_fingerprint_column_definitions,
     get_pdf_table_column_definitions,
+    get_video_metadata_table_column_definitions,
     get_video_table_column_definitions,
     xform_column_definitions_to_catalog_entries,
 )
 from evadb.catalog.models.utils import (
+    CheckpointCatalogEntry,
     ColumnCatalogEntry,
     DatabaseCatalogEntry,
     FunctionCacheCatalogEntry,
@@ -41,10 +46,14 @@ from evadb.catalog.models.utils import (
     FunctionMetadataCatalogEntry,
     IndexCatalogEntry,
     TableCatalogEntry,
+    ZoneMapCatalogEntry,
     drop_all_tables_except_catalog,
     init_db,
     truncate_catalog_tables,
 )
+from evadb.catalog.services.checkpoint_catalog_service import (
+    CheckpointCatalogService,
+)
 from evadb.catalog.services.column_catalog_service import ColumnCatalogService
 from evadb.catalog.services.database_catalog_service import DatabaseCatalogService
 from evadb.catalog.services.function_cache_catalog_service import (
@@ -60,6 +69,7 @@ from evadb.catalog.services.function_metadata_catalog_service import (
 )
 from evadb.catalog.services.index_catalog_service import IndexCatalogService
 from evadb.catalog.services.table_catalog_service import TableCatalogService
+from evadb.catalog.services.zone_map_catalog_service import ZoneMapCatalogService
 from evadb.catalog.sql_config import IDENTIFIER_COLUMN, SQLConfig
 from evadb.configuration.configuration_manager import ConfigurationManager
 from evadb.expression.function_expression import FunctionExpression
@@ -92,6 +102,8 @@ class CatalogManager(object):
         self._function_cache_service = FunctionCacheCatalogService(
             self._sql_config.session
         )
+        self._zone_map_service = ZoneMapCatalogService(self._sql_config.session)
+        self._checkpoint_service = CheckpointCatalogService(self._sql_config.session)
 
     @property
     def sql_config(self):
@@ -132,6 +144,7 @@ class CatalogManager(object):
         drop_all_tables_except_catalog(self._sql_config.engine)
         # truncate the catalog tables
         truncate_catalog_tables(self._sql_config.engine)
+        bump_catalog_version()
         # clean up the dataset, index, and cache directories
         cleanup_storage(self._config)
 
@@ -236,6 +249,7 @@ class CatalogManager(object):
             table_type=table_type,
             column_list=column_list,
         )
+        bump_catalog_version()
 
         return table_entry
 
@@ -268,12 +282,15 @@ class CatalogManager(object):
         Returns:
            True if successfully deleted else False
         """
-        return self._table_catalog_service.delete_entry(table_entry)
+        deleted = self._table_catalog_service.delete_entry(table_entry)
+        bump_catalog_version()
+        return deleted
 
     def rename_table_catalog_entry(
         self, curr_table: TableCatalogEntry, new_name: TableInfo
     ):
-        return self._table_catalog_service.rename_entry(curr_table, new_name.table_name)
+        self._table_catalog_service.rename_entry(curr_table, new_name.table_name)
+        bump_catalog_version()
 
     def check_table_exists(self, table_name: str, database_name: str = None):
         is_native_table = database_name is not None
@@ -411,7 +428,7 @@ class CatalogManager(object):
         self,
         name: str,
         save_file_path: str,
-        vector_store_type: VectorStoreType,
+        index_type: Union[VectorStoreType, ScalarIndexType],
         feat_column: ColumnCatalogEntry,
         function_signature: str,
         index_def: str,
@@ -419,7 +436,7 @@ class CatalogManager(object):
         index_catalog_entry = self._index_service.insert_entry(
             name,
             save_file_path,
-            vector_store_type,
+            index_type,
             feat_column,
             function_signature,
             index_def,
@@ -442,6 +459,43 @@ class CatalogManager(object):
     def get_all_index_catalog_entries(self):
         return self._index_service.get_all_entries()
 
+    """ Zone map related"""
+
+    def get_zone_map_catalog_entries(
+        self, table: TableCatalogEntry, chunk_ids: List[int] = None
+    ) -> List[ZoneMapCatalogEntry]:
+        """Get the zone maps of all the columns of the table, optionally only
+        the zone maps of the given chunks"""
+        column_ids = [col.row_id for col in table.columns if col.row_id is not None]
+        if not column_ids:
+            return []
+        return self._zone_map_service.get_entries_by_column_ids(column_ids, chunk_ids)
+
+    def upsert_zone_map_catalog_entries(
+        self, entries: List[ZoneMapCatalogEntry], commit: bool = True
+    ):
+        """Insert the zone maps, replacing the existing zone maps of the same
+        column and chunk. If commit is False, the zone maps are committed with
+        the current transaction of the catalog session."""
+        if entries:
+            self._zone_map_service.upsert_entries(entries, commit=commit)
+
+    """ Checkpoint related"""
+
+    def get_checkpoint_catalog_entry(
+        self, table: TableCatalogEntry
+    ) -> CheckpointCatalogEntry:
+        """Get the checkpoint of the query populating the table, None if the
+        table has no checkpoint"""
+        return self._checkpoint_service.get_entry_by_table_id(table.row_id)
+
+    def upsert_checkpoint_catalog_entry(self, entry: CheckpointCatalogEntry):
+        """Insert the checkpoint, replacing the existing checkpoint of the table"""
+        self._checkpoint_service.upsert_entry(entry)
+
+    def delete_checkpoint_catalog_entry(self, table: TableCatalogEntry):
+        self._checkpoint_service.delete_entry_by_table_id(table.row_id)
+
     """ Function Cache related"""
 
     def insert_function_cache_catalog_entry(self, func_expr: FunctionExpression):
@@ -599,7 +653,12 @@ class CatalogManager(object):
         obj = self.get_table_catalog_entry(media_metadata_name)
         assert obj is None, "Table with name {media_metadata_name} already exists"
 
-        columns = [ColumnDefinition("file_url", ColumnType.TEXT, None, None)]
+        if input_table.table_type == TableType.VIDEO_DATA:
+            # the metadata table of videos also holds the index of every video
+            columns = get_video_metadata_table_column_definitions()
+        else:
+            columns = [ColumnDefinition("file_url", ColumnType.TEXT, None, None)]
+        columns += get_media_fingerprint_column_definitions()
         obj = self.create_and_insert_table_catalog_entry(
             TableInfo(media_metadata_name),
             columns,
@@ -35,6 +35,9 @@ class TableType(EvaDBEnum):
     # database backend.
     NATIVE_DATA  # noqa: F821
 
+    # structured tables stored in columnar (parquet) files
+    COLUMNAR_DATA  # noqa: F821
+
 
 class ColumnType(EvaDBEnum):
     BOOLEAN  # noqa: F821
@@ -119,6 +122,13 @@ class VectorStoreType(EvaDBEnum):
     CHROMADB  # noqa: F821
 
 
+class ScalarIndexType(EvaDBEnum):
+    """Indexes on scalar columns, built by the database of structured tables"""
+
+    BTREE  # noqa: F821
+    HASH  # noqa: F821
+
+
 class VideoColumnName(EvaDBEnum):
     name  # noqa: F821
     id  # noqa: F821
@@ -136,6 +146,26 @@ class VideoColumnName(EvaDBEnum):
         return False
 
 
+class VideoMetadataColumnName(EvaDBEnum):
+    """columns of the metadata table of a video table. Besides the file url,
+    it holds the index of every video built at load time"""
+
+    file_url  # noqa: F821
+    num_frames  # noqa: F821
+    fps  # noqa: F821
+    duration  # noqa: F821
+    key_indices  # noqa: F821
+    timestamps  # noqa: F821
+
+
+class MediaFingerprintColumnName(EvaDBEnum):
+    """columns of the metadata table of a media table that fingerprint the
+    loaded files, so that incremental loads skip the unchanged files"""
+
+    file_size  # noqa: F821
+    file_mtime  # noqa: F821
+
+
 class ImageColumnName(EvaDBEnum):
     name  # noqa: F821
     data  # noqa: F821
@@ -14,16 +14,19 @@
 # limitations under the License.
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List
+from threading import Lock
+from typing import Any, Dict, List, Tuple
 
 from evadb.catalog.catalog_type import (
     ColumnType,
     DocumentColumnName,
     ImageColumnName,
+    MediaFingerprintColumnName,
     NdArrayType,
     PDFColumnName,
     TableType,
     VideoColumnName,
+    VideoMetadataColumnName,
 )
 from evadb.catalog.models.utils import (
     ColumnCatalogEntry,
@@ -37,6 +40,23 @@ from evadb.expression.function_expression import FunctionExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.parser.create_statement import ColConstraintInfo, ColumnDefinition
 from evadb.utils.generic_utils import get_str_hash, remove_directory_contents
+from evadb.utils.logging_manager import logger
+
+# Version of the table schemas registered in the catalog. It is bumped whenever a
+# table is created, dropped or renamed, so that caches of table metadata (e.g.,
+# reflected sqlalchemy tables) can detect schema changes cheaply.
+_catalog_version = 0
+_catalog_version_lock = Lock()
+
+
+def get_catalog_version() -> int:
+    return _catalog_version
+
+
+def bump_catalog_version():
+    global _catalog_version
+    with _catalog_version_lock:
+        _catalog_version += 1
 
 
 def is_video_table(table: TableCatalogEntry):
@@ -82,6 +102,58 @@ def get_video_table_column_definitions() -> List[ColumnDefinition]:
     return columns
 
 
+def get_video_metadata_table_column_definitions() -> List[ColumnDefinition]:
+    """
+    file_url: video path
+    num_frames: number of frames
+    fps: average frame rate
+    duration: duration in seconds
+    key_indices: ids of the key frames
+    timestamps: start time in seconds of every frame
+    """
+    columns = [
+        ColumnDefinition(
+            VideoMetadataColumnName.file_url.name, ColumnType.TEXT, None, None
+        ),
+        ColumnDefinition(
+            VideoMetadataColumnName.num_frames.name, ColumnType.INTEGER, None, None
+        ),
+        ColumnDefinition(VideoMetadataColumnName.fps.name, ColumnType.FLOAT, None, []),
+        ColumnDefinition(
+            VideoMetadataColumnName.duration.name, ColumnType.FLOAT, None, []
+        ),
+        ColumnDefinition(
+            VideoMetadataColumnName.key_indices.name,
+            ColumnType.NDARRAY,
+            NdArrayType.INT64,
+            (None,),
+        ),
+        ColumnDefinition(
+            VideoMetadataColumnName.timestamps.name,
+            ColumnType.NDARRAY,
+            NdArrayType.FLOAT64,
+            (None,),
+        ),
+    ]
+    return columns
+
+
+def get_media_fingerprint_column_definitions() -> List[ColumnDefinition]:
+    """
+    file_size: size of the file in bytes
+    file_mtime: modification time of the file in nanoseconds
+    """
+    columns = [
+        ColumnDefinition(
+            MediaFingerprintColumnName.file_size.name, ColumnType.INTEGER, None, None
+        ),
+        ColumnDefinition(
+            MediaFingerprintColumnName.file_mtime.name, ColumnType.INTEGER, None, None
+        ),
+    ]
+    return columns
+
+
 def get_image_table_column_definitions() -> List[ColumnDefinition]:
     """
     name: image path
@@ -259,9 +331,14 @@ def construct_function_cache_catalog_entry(
 def cleanup_storage(config):
     remove_directory_contents(config.get_value("storage", "index_dir"))
     remove_directory_contents(config.get_value("storage", "cache_dir"))
+    remove_directory_contents(config.get_value("storage", "frame_cache_dir"))
     remove_directory_contents(config.get_value("core", "datasets_dir"))
 
 
+# metadata key of the resolution of the frames expected by a function, eg. 224x224
+FUNCTION_INPUT_RESOLUTION_KEY = "input_resolution"
+
+
 def get_metadata_entry_or_val(
     function_obj: FunctionCatalogEntry, key: str, default_val: Any = None
 ) -> str:
@@ -296,10 +373,42 @@ def get_metadata_properties(function_obj: FunctionCatalogEntry) -> Dict:
     """
     properties = {}
     for metadata in function_obj.metadata:
+        # the input resolution is used by the optimizer, not by the function
+        if metadata.key == FUNCTION_INPUT_RESOLUTION_KEY:
+            continue
         properties[metadata.key] = metadata.value
     return properties
 
 
+def get_function_input_resolution(
+    function_obj: FunctionCatalogEntry,
+) -> Tuple[int, int]:
+    """
+    Return the (width, height) of the frames expected by the function, declared
+    with the `input_resolution` metadata (eg. '224x224'), or None. The function
+    either requires or resizes its input frames to this resolution, so the
+    frames can be decoded at this resolution.
+
+    Args:
+        function_obj (FunctionCatalogEntry): function catalog entry
+    Returns:
+        Tuple[int, int]: declared (width, height) or None
+    """
+    value = get_metadata_entry_or_val(function_obj, FUNCTION_INPUT_RESOLUTION_KEY)
+    if value is None:
+        return None
+    try:
+        width, height = (int(dim) for dim in str(value).lower().split("x"))
+    except ValueError:
+        logger.warn(
+            f"Ignoring invalid input resolution {value} of function {function_obj.name}"
+        )
+        return None
+    if width <= 0 or height <= 0:
+        return None
+    return width, height
+
+
 #### get catalog instance
 # This function plays a crucial role in ensuring that different threads do
 # not share the same catalog object, as it can result in serialization issues and
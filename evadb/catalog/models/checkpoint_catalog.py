@@ -0,0 +1,73 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from sqlalchemy import Column, ForeignKey, Integer, Text
+from sqlalchemy.orm import relationship
+
+from evadb.catalog.models.base_model import BaseModel
+from evadb.catalog.models.utils import CheckpointCatalogEntry
+
+
+class CheckpointCatalog(BaseModel):
+    """The `CheckpointCatalog` catalog stores the progress of the unfinished
+    `CREATE TABLE AS SELECT` queries, so that a rerun of the query resumes from
+    the last committed position. It has the following columns.
+    `_row_id:` an autogenerated identifier
+    `_table_id:` the `_row_id` of the `TableCatalog` entry of the created table
+    `_query:` the select query populating the table
+    `_row_number:` the `_row_number` of the last input row whose output is
+        committed, `None` if no input row was processed
+    `_output_rows:` the number of committed output rows
+    `_last_row_id:` the `_row_id` of the last committed output row, `None` if
+        no output row was committed
+    """
+
+    __tablename__ = "checkpoint_catalog"
+
+    _table_id = Column(
+        "table_id",
+        Integer,
+        ForeignKey("table_catalog._row_id", ondelete="CASCADE"),
+        unique=True,
+    )
+    _query = Column("query", Text)
+    _row_number = Column("row_number", Integer)
+    _output_rows = Column("output_rows", Integer, default=0)
+    _last_row_id = Column("last_row_id", Integer)
+
+    _table = relationship("TableCatalog", back_populates="_checkpoint")
+
+    def __init__(
+        self,
+        table_id: int,
+        query: str,
+        row_number: int = None,
+        output_rows: int = 0,
+        last_row_id: int = None,
+    ):
+        self._table_id = table_id
+        self._query = query
+        self._row_number = row_number
+        self._output_rows = output_rows
+        self._last_row_id = last_row_id
+
+    def as_dataclass(self) -> "CheckpointCatalogEntry":
+        return CheckpointCatalogEntry(
+            row_id=self._row_id,
+            table_id=self._table_id,
+            query=self._query,
+            row_number=self._row_number,
+            output_rows=self._output_rows,
+            last_row_id=self._last_row_id,
+        )
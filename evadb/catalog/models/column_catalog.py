@@ -38,6 +38,7 @@ class ColumnCatalog(BaseModel):
     `_array_dimensions:` the dimensions of the array (if `_array_type` is not `None`)
     `_table_id:` the `_row_id` of the `TableCatalog` entry to which the column belongs
     `_dep_caches`: list of function caches associated with the column
+    `_zone_maps`: list of zone maps of the column
     """
 
     __tablename__ = "column_catalog"
@@ -67,6 +68,14 @@ class ColumnCatalog(BaseModel):
         "IndexCatalog", back_populates="_feat_column", cascade="all, delete"
     )
 
+    # Zone maps of the column, removed by the database along with the column
+    _zone_maps = relationship(
+        "ZoneMapCatalog",
+        back_populates="_column",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+
     def __init__(
         self,
         name: str,
@@ -12,14 +12,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import Union
 
 from sqlalchemy import Column, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
-from sqlalchemy.types import Enum
 
-from evadb.catalog.catalog_type import VectorStoreType
+from evadb.catalog.catalog_type import ScalarIndexType, VectorStoreType
 from evadb.catalog.models.base_model import BaseModel
-from evadb.catalog.models.utils import IndexCatalogEntry
+from evadb.catalog.models.utils import IndexCatalogEntry, IndexTypeEnum
 
 
 class IndexCatalog(BaseModel):
@@ -27,7 +27,7 @@ class IndexCatalog(BaseModel):
     `_row_id:` an autogenerated unique identifier.
     `_name:` the name of the index.
     `_save_file_path:` the path to the index file on disk
-    `_type:` the type of the index (refer to `VectorStoreType`)
+    `_type:` the type of the index (refer to `VectorStoreType` and `ScalarIndexType`)
     `_feat_column_id:` the `_row_id` of the `ColumnCatalog` entry for the column on which the index is built.
     `_function_signature:` if the index is created by running function expression on input column, this will store
                       the function signature of the used function. Otherwise, this field is None.
@@ -39,7 +39,7 @@ class IndexCatalog(BaseModel):
 
     _name = Column("name", String(100), unique=True)
     _save_file_path = Column("save_file_path", String(128))
-    _type = Column("type", Enum(VectorStoreType), default=Enum)
+    _type = Column("type", IndexTypeEnum)
     _feat_column_id = Column(
         "column_id", Integer, ForeignKey("column_catalog._row_id", ondelete="CASCADE")
     )
@@ -55,7 +55,7 @@ class IndexCatalog(BaseModel):
         self,
         name: str,
         save_file_path: str,
-        type: VectorStoreType,
+        type: Union[VectorStoreType, ScalarIndexType],
         feat_column_id: int = None,
         function_signature: str = None,
         index_def: str = None,
@@ -27,6 +27,7 @@ class TableCatalog(BaseModel):
     `_name:` the name of the table, view, etc.
     `_file_url:` the path to the data file on disk
     `_table_type:` the type of the table (refer to TableType).
+    `_checkpoint:` the progress of the query populating the table, if unfinished
     """
 
     __tablename__ = "table_catalog"
@@ -43,6 +44,15 @@ class TableCatalog(BaseModel):
         cascade="all, delete, delete-orphan",
     )
 
+    # Checkpoint of the CREATE TABLE AS SELECT populating the table, removed by
+    # the database along with the table
+    _checkpoint = relationship(
+        "CheckpointCatalog",
+        back_populates="_table",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+
     def __init__(
         self, name: str, file_url: str, table_type: int, identifier_column="id"
     ):
@@ -15,7 +15,7 @@
 import contextlib
 import json
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import Any, List, Tuple, Union
 
 import sqlalchemy
 from sqlalchemy.engine import Engine
@@ -25,6 +25,7 @@ from sqlalchemy_utils import create_database, database_exists
 from evadb.catalog.catalog_type import (
     ColumnType,
     NdArrayType,
+    ScalarIndexType,
     TableType,
     VectorStoreType,
 )
@@ -33,6 +34,26 @@ from evadb.catalog.sql_config import CATALOG_TABLES
 from evadb.utils.logging_manager import logger
 
 
+class IndexTypeEnum(TypeDecorator):
+    """Stores the type of an index, either a `VectorStoreType` or a
+    `ScalarIndexType`, by the name of the enum member"""
+
+    impl = sqlalchemy.String(16)
+
+    def process_bind_param(self, value, dialect):
+        if value is not None:
+            value = value.name
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is not None:
+            if value in ScalarIndexType.__members__:
+                value = ScalarIndexType[value]
+            else:
+                value = VectorStoreType[value]
+        return value
+
+
 class TextPickleType(TypeDecorator):
     """Used to handle serialization and deserialization to Text
     https://stackoverflow.com/questions/1378325/python-dicts-in-sqlalchemy
@@ -197,7 +218,7 @@ class IndexCatalogEntry:
 
     name: str
     save_file_path: str
-    type: VectorStoreType
+    type: Union[VectorStoreType, ScalarIndexType]
     row_id: int = None
     feat_column_id: int = None
     function_signature: str = None
@@ -205,6 +226,31 @@ class IndexCatalogEntry:
     feat_column: ColumnCatalogEntry = None
 
 
+@dataclass(unsafe_hash=True)
+class ZoneMapCatalogEntry:
+    """Dataclass representing an entry in the `ZoneMapCatalog`."""
+
+    column_id: int
+    chunk_id: int
+    min_value: Any = None
+    max_value: Any = None
+    null_count: int = 0
+    row_count: int = 0
+    row_id: int = None
+
+
+@dataclass(unsafe_hash=True)
+class CheckpointCatalogEntry:
+    """Dataclass representing an entry in the `CheckpointCatalog`."""
+
+    table_id: int
+    query: str
+    row_number: int = None
+    output_rows: int = 0
+    last_row_id: int = None
+    row_id: int = None
+
+
 @dataclass(unsafe_hash=True)
 class FunctionCatalogEntry:
     """Dataclass representing an entry in the `FunctionCatalog`.
@@ -0,0 +1,79 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Any
+
+from sqlalchemy import Column, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import relationship
+
+from evadb.catalog.models.base_model import BaseModel
+from evadb.catalog.models.utils import TextPickleType, ZoneMapCatalogEntry
+
+
+class ZoneMapCatalog(BaseModel):
+    """The `ZoneMapCatalog` catalog stores the statistics of the scalar columns of
+    structured tables. The rows of a table are split into chunks of consecutive
+    row ids (see `ZONE_MAP_CHUNK_SIZE`), and it maintains the following
+    information for every chunk of a column.
+    `_row_id:` an autogenerated identifier
+    `_column_id:` the `_row_id` of the `ColumnCatalog` entry of the column
+    `_chunk_id:` the chunk holding the row ids
+        [chunk_id * ZONE_MAP_CHUNK_SIZE + 1, (chunk_id + 1) * ZONE_MAP_CHUNK_SIZE]
+    `_min_value:` the minimum non null value of the column in the chunk
+    `_max_value:` the maximum non null value of the column in the chunk
+    `_null_count:` the number of null values of the column in the chunk
+    `_row_count:` the number of rows in the chunk
+    """
+
+    __tablename__ = "zone_map_catalog"
+
+    _column_id = Column(
+        "column_id", Integer, ForeignKey("column_catalog._row_id", ondelete="CASCADE")
+    )
+    _chunk_id = Column("chunk_id", Integer)
+    _min_value = Column("min_value", TextPickleType())
+    _max_value = Column("max_value", TextPickleType())
+    _null_count = Column("null_count", Integer, default=0)
+    _row_count = Column("row_count", Integer, default=0)
+
+    __table_args__ = (UniqueConstraint("column_id", "chunk_id"), {})
+
+    _column = relationship("ColumnCatalog", back_populates="_zone_maps")
+
+    def __init__(
+        self,
+        column_id: int,
+        chunk_id: int,
+        min_value: Any = None,
+        max_value: Any = None,
+        null_count: int = 0,
+        row_count: int = 0,
+    ):
+        self._column_id = column_id
+        self._chunk_id = chunk_id
+        self._min_value = min_value
+        self._max_value = max_value
+        self._null_count = null_count
+        self._row_count = row_count
+
+    def as_dataclass(self) -> "ZoneMapCatalogEntry":
+        return ZoneMapCatalogEntry(
+            row_id=self._row_id,
+            column_id=self._column_id,
+            chunk_id=self._chunk_id,
+            min_value=self._min_value,
+            max_value=self._max_value,
+            null_count=self._null_count,
+            row_count=self._row_count,
+        )
@@ -0,0 +1,90 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import select
+
+from evadb.catalog.models.checkpoint_catalog import (
+    CheckpointCatalog,
+    CheckpointCatalogEntry,
+)
+from evadb.catalog.services.base_service import BaseService
+from evadb.utils.errors import CatalogError
+
+
+class CheckpointCatalogService(BaseService):
+    def __init__(self, db_session: Session):
+        super().__init__(CheckpointCatalog, db_session)
+
+    def get_entry_by_table_id(self, table_id: int) -> CheckpointCatalogEntry:
+        """return the checkpoint of the table, None if there is no checkpoint
+
+        Arguments:
+            table_id (int): row id of the table catalog entry
+        """
+        try:
+            entry = self.session.execute(
+                select(self.model).filter(self.model._table_id == table_id)
+            ).scalar_one_or_none()
+            if entry is not None:
+                return entry.as_dataclass()
+            return entry
+        except Exception as e:
+            raise CatalogError(
+                f"Error while getting entry from CheckpointCatalog: {str(e)}"
+            )
+
+    def upsert_entry(self, entry: CheckpointCatalogEntry):
+        """Replace the checkpoint of the table of the entry
+
+        Arguments:
+            entry (CheckpointCatalogEntry): checkpoint to store
+        """
+        try:
+            self.session.execute(
+                delete(self.model).where(self.model._table_id == entry.table_id)
+            )
+            self.session.add(
+                self.model(
+                    entry.table_id,
+                    entry.query,
+                    entry.row_number,
+                    entry.output_rows,
+                    entry.last_row_id,
+                )
+            )
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise CatalogError(
+                f"Error while upserting entry to CheckpointCatalog: {str(e)}"
+            )
+
+    def delete_entry_by_table_id(self, table_id: int):
+        """Delete the checkpoint of the table
+
+        Arguments:
+            table_id (int): row id of the table catalog entry
+        """
+        try:
+            self.session.execute(
+                delete(self.model).where(self.model._table_id == table_id)
+            )
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise CatalogError(
+                f"Error while deleting entry from CheckpointCatalog: {str(e)}"
+            )
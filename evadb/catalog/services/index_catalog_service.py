@@ -13,11 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+from typing import Union
 
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.exc import NoResultFound
 
-from evadb.catalog.catalog_type import VectorStoreType
+from evadb.catalog.catalog_type import ScalarIndexType, VectorStoreType
 from evadb.catalog.models.index_catalog import IndexCatalog, IndexCatalogEntry
 from evadb.catalog.models.utils import ColumnCatalogEntry
 from evadb.catalog.services.base_service import BaseService
@@ -32,7 +33,7 @@ class IndexCatalogService(BaseService):
         self,
         name: str,
         save_file_path: str,
-        type: VectorStoreType,
+        type: Union[VectorStoreType, ScalarIndexType],
         feat_column: ColumnCatalogEntry,
         function_signature: str,
         index_def: str,
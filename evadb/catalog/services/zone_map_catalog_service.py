@@ -0,0 +1,89 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import select
+
+from evadb.catalog.models.zone_map_catalog import ZoneMapCatalog, ZoneMapCatalogEntry
+from evadb.catalog.services.base_service import BaseService
+from evadb.utils.errors import CatalogError
+
+
+class ZoneMapCatalogService(BaseService):
+    def __init__(self, db_session: Session):
+        super().__init__(ZoneMapCatalog, db_session)
+
+    def get_entries_by_column_ids(
+        self, column_ids: List[int], chunk_ids: List[int] = None
+    ) -> List[ZoneMapCatalogEntry]:
+        """return all the zone map entries of the columns
+
+        Arguments:
+            column_ids (List[int]): row ids of the column catalog entries
+            chunk_ids (List[int]): only return the entries of these chunks,
+                None returns the entries of all the chunks
+        """
+        try:
+            query = select(self.model).filter(self.model._column_id.in_(column_ids))
+            if chunk_ids is not None:
+                query = query.filter(self.model._chunk_id.in_(chunk_ids))
+            entries = self.session.execute(query).scalars().all()
+            return [entry.as_dataclass() for entry in entries]
+        except Exception as e:
+            raise CatalogError(
+                f"Error while getting entries from ZoneMapCatalog: {str(e)}"
+            )
+
+    def upsert_entries(self, entries: List[ZoneMapCatalogEntry], commit: bool = True):
+        """Replace the zone maps of the (column, chunk) pairs of the entries
+
+        Arguments:
+            entries (List[ZoneMapCatalogEntry]): zone maps to store
+            commit (bool): commit the session, otherwise the entries are
+                committed by the caller with its transaction
+        """
+        try:
+            chunk_ids = {}
+            for entry in entries:
+                chunk_ids.setdefault(entry.column_id, set()).add(entry.chunk_id)
+            for column_id, column_chunk_ids in chunk_ids.items():
+                self.session.execute(
+                    delete(self.model).where(
+                        self.model._column_id == column_id,
+                        self.model._chunk_id.in_(column_chunk_ids),
+                    )
+                )
+            self.session.add_all(
+                [
+                    self.model(
+                        entry.column_id,
+                        entry.chunk_id,
+                        entry.min_value,
+                        entry.max_value,
+                        entry.null_count,
+                        entry.row_count,
+                    )
+                    for entry in entries
+                ]
+            )
+            if commit:
+                self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise CatalogError(
+                f"Error while upserting entries to ZoneMapCatalog: {str(e)}"
+            )
@@ -40,6 +40,8 @@ CATALOG_TABLES = [
     "functionio_catalog",
     "function_cost_catalog",
     "function_metadata_catalog",
+    "zone_map_catalog",
+    "checkpoint_catalog",
 ]
 
 
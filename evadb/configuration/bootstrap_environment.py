@@ -22,6 +22,7 @@ import yaml
 from evadb.configuration.constants import (
     CACHE_DIR,
     DB_DEFAULT_NAME,
+    FRAME_CACHE_DIR,
     FUNCTION_DIR,
     INDEX_DIR,
     MODEL_DIR,
@@ -101,6 +102,7 @@ def create_directories_and_get_default_config_values(
     dataset_location = evadb_dir / EvaDB_DATASET_DIR
     index_dir = evadb_dir / INDEX_DIR
     cache_dir = evadb_dir / CACHE_DIR
+    frame_cache_dir = evadb_dir / FRAME_CACHE_DIR
     s3_dir = evadb_dir / S3_DOWNLOAD_DIR
     tmp_dir = evadb_dir / TMP_DIR
     function_dir = evadb_dir / FUNCTION_DIR
@@ -114,6 +116,8 @@ def create_directories_and_get_default_config_values(
         index_dir.mkdir(parents=True, exist_ok=True)
     if not cache_dir.exists():
         cache_dir.mkdir(parents=True, exist_ok=True)
+    if not frame_cache_dir.exists():
+        frame_cache_dir.mkdir(parents=True, exist_ok=True)
     if not s3_dir.exists():
         s3_dir.mkdir(parents=True, exist_ok=True)
     if not tmp_dir.exists():
@@ -131,6 +135,7 @@ def create_directories_and_get_default_config_values(
     config_obj["core"]["catalog_database_uri"] = get_default_db_uri(evadb_dir)
     config_obj["storage"]["index_dir"] = str(index_dir.resolve())
     config_obj["storage"]["cache_dir"] = str(cache_dir.resolve())
+    config_obj["storage"]["frame_cache_dir"] = str(frame_cache_dir.resolve())
     config_obj["storage"]["s3_download_dir"] = str(s3_dir.resolve())
     config_obj["storage"]["tmp_dir"] = str(tmp_dir.resolve())
     config_obj["storage"]["function_dir"] = str(function_dir.resolve())
@@ -147,8 +152,9 @@ def merge_dict_of_dicts(dict1, dict2):
     merged_dict = dict1.copy()
 
     for key, value in dict2.items():
-        # Overwrite only if some value is specified.
-        if value:
+        # Overwrite only if some value is specified. Empty strings are not
+        # specified, while False and 0 are.
+        if value is not None and value != "":
             if (
                 key in merged_dict
                 and isinstance(merged_dict[key], dict)
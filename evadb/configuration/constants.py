@@ -27,6 +27,7 @@ MODEL_DIR = "models"
 CATALOG_DIR = "catalog"
 INDEX_DIR = "index"
 CACHE_DIR = "cache"
+FRAME_CACHE_DIR = "frame_cache"
 DATASET_DATAFRAME_NAME = "dataset"
 DB_DEFAULT_NAME = "evadb.db"
 S3_DOWNLOAD_DIR = "s3_downloads"
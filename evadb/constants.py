@@ -21,3 +21,27 @@ CACHEABLE_FUNCTIONS = ["Yolo", "FaceDetector", "OCRExtractor", "HFObjectDetector
 IFRAMES = "IFRAMES"
 AUDIORATE = "AUDIORATE"
 DEFAULT_FUNCTION_EXPRESSION_COST = 100
+# number of rows sent to the database in every executemany call of a bulk insert
+BULK_INSERT_CHUNK_SIZE = 10000
+# number of rows in every row group of the parquet files of columnar tables
+COLUMNAR_ROW_GROUP_SIZE = 65536
+# number of consecutive row ids summarized by every zone map of a structured table
+ZONE_MAP_CHUNK_SIZE = 4096
+# maximum number of row id ranges skipped by a single scan using zone maps
+ZONE_MAP_MAX_SKIPPED_RANGES = 64
+# number of idle connected handlers kept for every native database
+NATIVE_HANDLER_POOL_SIZE = 4
+# idle handlers are disconnected after this many seconds
+NATIVE_HANDLER_POOL_IDLE_TIMEOUT = 300
+# number of videos decoded concurrently by a scan of a video table
+VIDEO_SCAN_WORKERS = 1
+# number of decoded batches buffered by every video scan worker
+VIDEO_SCAN_PREFETCH = 2
+# number of consecutive frames in every segment of the decoded frame cache
+FRAME_CACHE_SEGMENT_SIZE = 64
+# number of threads decoding the images of a scan of an image table
+IMAGE_SCAN_WORKERS = 4
+# number of processes parsing the files of a scan of a document or pdf table
+DOCUMENT_SCAN_WORKERS = 1
+# number of parsed batches buffered ahead of the writes of LOAD CSV
+CSV_LOAD_PREFETCH = 2
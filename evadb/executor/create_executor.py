@@ -16,18 +16,69 @@ import contextlib
 
 import pandas as pd
 
+from evadb.catalog.catalog_type import TableType
+from evadb.catalog.models.utils import CheckpointCatalogEntry, TableCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
+from evadb.executor.apply_and_merge_executor import ApplyAndMergeExecutor
 from evadb.executor.executor_utils import (
+    ExecutorError,
     create_table_catalog_entry_for_native_table,
     handle_if_not_exists,
 )
+from evadb.executor.function_scan_executor import FunctionScanExecutor
+from evadb.executor.nested_loop_join_executor import NestedLoopJoinExecutor
+from evadb.executor.predicate_executor import PredicateExecutor
+from evadb.executor.project_executor import ProjectExecutor
+from evadb.executor.seq_scan_executor import SequentialScanExecutor
+from evadb.executor.storage_executor import StorageExecutor
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.create_plan import CreatePlan
+from evadb.storage.abstract_storage_engine import AbstractStorageEngine
+from evadb.storage.sqlite_storage_engine import SQLStorageEngine
 from evadb.storage.storage_engine import StorageEngine
+from evadb.storage.storage_utils import get_sqlalchemy_column
 from evadb.utils.errors import CatalogError
 from evadb.utils.logging_manager import logger
 
+# Executors that turn every input batch into at most one output batch, in
+# order. The output of a query made of them is checkpointed by the position of
+# its scan.
+_CHECKPOINTABLE_EXECUTORS = (
+    ApplyAndMergeExecutor,
+    FunctionScanExecutor,
+    NestedLoopJoinExecutor,
+    PredicateExecutor,
+    ProjectExecutor,
+    SequentialScanExecutor,
+    StorageExecutor,
+)
+
+
+def get_checkpointable_scan(executor: AbstractExecutor) -> StorageExecutor:
+    """Return the scan of the query if its output can be checkpointed by the
+    `_row_number` of the scanned rows, None otherwise"""
+    scans = []
+
+    def is_checkpointable(node: AbstractExecutor) -> bool:
+        if not isinstance(node, _CHECKPOINTABLE_EXECUTORS):
+            return False
+        # only lateral joins with a function
+        if isinstance(node, NestedLoopJoinExecutor) and not isinstance(
+            node.children[1], FunctionScanExecutor
+        ):
+            return False
+        if isinstance(node, StorageExecutor):
+            scans.append(node)
+        return all(is_checkpointable(child) for child in node.children)
+
+    if not is_checkpointable(executor) or len(scans) != 1:
+        return None
+    if not scans[0].reads_in_order():
+        return None
+    return scans[0]
+
 
 class CreateExecutor(AbstractExecutor):
     def __init__(self, db: EvaDBDatabase, node: CreatePlan):
@@ -36,21 +87,33 @@ class CreateExecutor(AbstractExecutor):
     def exec(self, *args, **kwargs):
         # create a table in the active database if set
         is_native_table = self.node.table_info.database_name is not None
-
-        check_if_exists = handle_if_not_exists(
-            self.catalog(), self.node.table_info, self.node.if_not_exists
-        )
         name = self.node.table_info.table_name
-        if check_if_exists:
-            yield Batch(pd.DataFrame([f"Table {name} already exists"]))
-            return
+
+        # the table left by an interrupted run of the same query is resumed
+        checkpoint = self._get_unfinished_checkpoint()
+        if checkpoint is None:
+            check_if_exists = handle_if_not_exists(
+                self.catalog(), self.node.table_info, self.node.if_not_exists
+            )
+            if check_if_exists:
+                yield Batch(pd.DataFrame([f"Table {name} already exists"]))
+                return
 
         create_table_done = False
         logger.debug(f"Creating table {self.node.table_info}")
 
-        if not is_native_table:
+        if checkpoint is not None:
+            logger.info(
+                f"Resuming the creation of table {name} after "
+                f"{checkpoint.output_rows} rows"
+            )
+            catalog_entry = self.catalog().get_table_catalog_entry(name)
+            create_table_done = True
+        elif not is_native_table:
             catalog_entry = self.catalog().create_and_insert_table_catalog_entry(
-                self.node.table_info, self.node.column_list
+                self.node.table_info,
+                self.node.column_list,
+                table_type=self.node.table_type,
             )
         else:
             catalog_entry = create_table_catalog_entry_for_native_table(
@@ -59,8 +122,9 @@ class CreateExecutor(AbstractExecutor):
         storage_engine = StorageEngine.factory(self.db, catalog_entry)
 
         try:
-            storage_engine.create(table=catalog_entry)
-            create_table_done = True
+            if not create_table_done:
+                storage_engine.create(table=catalog_entry)
+                create_table_done = True
 
             msg = f"The table {name} has been successfully created"
             if self.children != []:
@@ -69,22 +133,17 @@ class CreateExecutor(AbstractExecutor):
                 ), "Create table from query expects 1 child, finds {}".format(
                     len(self.children)
                 )
-                child = self.children[0]
-
-                rows = 0
-                # Populate the table
-                for batch in child.exec():
-                    batch.drop_column_alias()
-                    storage_engine.write(catalog_entry, batch)
-                    rows += len(batch)
-
+                rows = self._populate_table(storage_engine, catalog_entry, checkpoint)
                 msg = (
                     f"The table {name} has been successfully created with {rows} rows."
                 )
 
             yield Batch(pd.DataFrame([msg]))
         except Exception as e:
-            # rollback if the create call fails
+            # rollback if the create call fails. Only an interrupted query
+            # (eg. a crash or KeyboardInterrupt) leaves its checkpointed rows
+            # behind to be resumed, the rows written by a failing query are
+            # dropped.
             with contextlib.suppress(CatalogError):
                 if create_table_done:
                     storage_engine.drop(catalog_entry)
@@ -92,3 +151,87 @@ class CreateExecutor(AbstractExecutor):
             with contextlib.suppress(CatalogError):
                 self.catalog().delete_table_catalog_entry(catalog_entry)
             raise e
+
+    def _get_checkpoint(self, catalog_entry: TableCatalogEntry):
+        if catalog_entry.row_id is None:
+            return None
+        with contextlib.suppress(CatalogError):
+            return self.catalog().get_checkpoint_catalog_entry(catalog_entry)
+        return None
+
+    def _get_unfinished_checkpoint(self) -> CheckpointCatalogEntry:
+        """Return the checkpoint of the same query populating the table, None
+        if the table does not exist or was populated by another query"""
+        if self.children == [] or self.node.table_info.database_name is not None:
+            return None
+        catalog_entry = self.catalog().get_table_catalog_entry(
+            self.node.table_info.table_name
+        )
+        if catalog_entry is None:
+            return None
+        checkpoint = self._get_checkpoint(catalog_entry)
+        if checkpoint is None or checkpoint.query != self.node.query:
+            return None
+        return checkpoint
+
+    def _populate_table(
+        self,
+        storage_engine: AbstractStorageEngine,
+        catalog_entry: TableCatalogEntry,
+        checkpoint: CheckpointCatalogEntry = None,
+    ) -> int:
+        """Write the output of the query into the table. For structured tables,
+        the `_row_number` of the last scanned row, the number of output rows and
+        the `_row_id` of the last output row are checkpointed after every write. A resumed query first drops the rows
+        written after the checkpoint, then skips the rows scanned before it, so
+        that every output row is written exactly once."""
+        child = self.children[0]
+        resumed = checkpoint is not None
+        scan = None
+        if catalog_entry.table_type == TableType.STRUCTURED_DATA:
+            scan = get_checkpointable_scan(child)
+
+        if scan is not None:
+            if resumed:
+                self._truncate_table(storage_engine, catalog_entry, checkpoint)
+            else:
+                checkpoint = CheckpointCatalogEntry(
+                    catalog_entry.row_id, self.node.query
+                )
+                self.catalog().upsert_checkpoint_catalog_entry(checkpoint)
+            scan.track_progress(checkpoint.row_number)
+        elif resumed:
+            raise ExecutorError(
+                f"Table {catalog_entry.name} cannot be resumed, drop it and run "
+                "the query again"
+            )
+
+        rows = checkpoint.output_rows if resumed else 0
+        # Populate the table
+        for batch in child.exec():
+            batch.drop_column_alias()
+            storage_engine.write(catalog_entry, batch)
+            rows += len(batch)
+
+            if scan is not None:
+                checkpoint.row_number = scan.last_row_number
+                checkpoint.output_rows = rows
+                checkpoint.last_row_id = storage_engine.get_last_row_id(catalog_entry)
+                self.catalog().upsert_checkpoint_catalog_entry(checkpoint)
+
+        if scan is not None:
+            self.catalog().delete_checkpoint_catalog_entry(catalog_entry)
+        return rows
+
+    def _truncate_table(
+        self,
+        storage_engine: SQLStorageEngine,
+        catalog_entry: TableCatalogEntry,
+        checkpoint: CheckpointCatalogEntry,
+    ):
+        # the rows with larger row ids were written after the last committed
+        # checkpoint. The row ids are not assumed to be dense, as the database
+        # may skip row ids of the rolled back writes.
+        table = storage_engine._try_loading_table_via_reflection(catalog_entry.name)
+        row_id = get_sqlalchemy_column(table, IDENTIFIER_COLUMN)
+        storage_engine.delete(catalog_entry, row_id > (checkpoint.last_row_id or 0))
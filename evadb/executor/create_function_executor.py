@@ -20,7 +20,10 @@ from typing import Dict, List
 
 import pandas as pd
 
-from evadb.catalog.catalog_utils import get_metadata_properties
+from evadb.catalog.catalog_utils import (
+    FUNCTION_INPUT_RESOLUTION_KEY,
+    get_metadata_properties,
+)
 from evadb.catalog.models.function_catalog import FunctionCatalogEntry
 from evadb.catalog.models.function_io_catalog import FunctionIOCatalogEntry
 from evadb.catalog.models.function_metadata_catalog import FunctionMetadataCatalogEntry
@@ -30,7 +33,10 @@ from evadb.configuration.constants import (
 )
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
-from evadb.functions.decorators.utils import load_io_from_function_decorators
+from evadb.functions.decorators.utils import (
+    load_input_resolution_from_function_decorators,
+    load_io_from_function_decorators,
+)
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.create_function_plan import CreateFunctionPlan
 from evadb.third_party.huggingface.create import gen_hf_io_catalog_entries
@@ -441,6 +447,18 @@ class CreateFunctionExecutor(AbstractExecutor):
         function = self._try_initializing_function(impl_path)
         io_list = self._resolve_function_io(function)
 
+        # the input resolution from the CREATE statement takes precedence
+        input_resolution = load_input_resolution_from_function_decorators(function)
+        if input_resolution is not None and all(
+            entry.key != FUNCTION_INPUT_RESOLUTION_KEY for entry in self.node.metadata
+        ):
+            width, height = input_resolution
+            self.node.metadata.append(
+                FunctionMetadataCatalogEntry(
+                    FUNCTION_INPUT_RESOLUTION_KEY, f"{width}x{height}"
+                )
+            )
+
         return (
             self.node.name,
             impl_path,
@@ -16,7 +16,7 @@ from pathlib import Path
 
 import pandas as pd
 
-from evadb.catalog.catalog_type import VectorStoreType
+from evadb.catalog.catalog_type import ScalarIndexType, VectorStoreType
 from evadb.catalog.sql_config import ROW_NUM_COLUMN
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
@@ -24,6 +24,7 @@ from evadb.executor.executor_utils import ExecutorError, handle_vector_store_par
 from evadb.expression.function_expression import FunctionExpression
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.create_index_plan import CreateIndexPlan
+from evadb.storage.storage_engine import StorageEngine
 from evadb.third_party.databases.interface import get_database_handler
 from evadb.third_party.vector_stores.types import FeaturePayload
 from evadb.third_party.vector_stores.utils import VectorStoreFactory
@@ -46,6 +47,8 @@ class CreateIndexExecutor(AbstractExecutor):
         # Vector type specific creation.
         if self.vector_store_type == VectorStoreType.PGVECTOR:
             self._create_native_index()
+        elif isinstance(self.vector_store_type, ScalarIndexType):
+            self._create_scalar_index()
         else:
             self._create_evadb_index()
 
@@ -73,6 +76,41 @@ class CreateIndexExecutor(AbstractExecutor):
                     f"Native engine create index encounters error: {resp.error}"
                 )
 
+    # Create scalar index through the storage engine of the structured table.
+    def _create_scalar_index(self):
+        table_catalog_entry = self.table_ref.table.table_obj
+        col_name = self.col_list[0].name
+        col_catalog_entry = [
+            col for col in table_catalog_entry.columns if col.name == col_name
+        ][0]
+
+        index_catalog_entry = self.catalog().get_index_catalog_entry_by_name(self.name)
+        if index_catalog_entry is not None:
+            msg = f"Index {self.name} already exists."
+            if self.if_not_exists:
+                # The database keeps the index up to date, nothing to rebuild.
+                logger.warn(msg)
+                return
+            logger.error(msg)
+            raise ExecutorError(msg)
+
+        try:
+            storage_engine = StorageEngine.factory(self.db, table_catalog_entry)
+            storage_engine.create_index(
+                table_catalog_entry, self.name, col_name, self.vector_store_type
+            )
+            # There is no index file, the index lives in the database.
+            self.catalog().insert_index_catalog_entry(
+                self.name,
+                "",
+                self.vector_store_type,
+                col_catalog_entry,
+                None,
+                self.index_def,
+            )
+        except Exception as e:
+            raise ExecutorError(str(e))
+
     # On-disk saving path for EvaDB index.
     def _get_evadb_index_save_path(self) -> Path:
         index_dir = Path(self.config.get_value("storage", "index_dir"))
@@ -15,20 +15,14 @@
 from typing import Iterator
 
 import pandas as pd
-from sqlalchemy import and_, or_
 
 from evadb.catalog.catalog_type import TableType
-from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
-from evadb.expression.abstract_expression import ExpressionType
-from evadb.expression.comparison_expression import ComparisonExpression
-from evadb.expression.constant_value_expression import ConstantValueExpression
-from evadb.expression.logical_expression import LogicalExpression
-from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.project_plan import ProjectPlan
 from evadb.storage.storage_engine import StorageEngine
+from evadb.storage.storage_utils import predicate_to_sqlalchemy_filter_clause
 
 
 class DeleteExecutor(AbstractExecutor):
@@ -38,58 +32,6 @@ class DeleteExecutor(AbstractExecutor):
         super().__init__(db, node)
         self.predicate = node.where_clause
 
-    def predicate_node_to_filter_clause(
-        self, table: TableCatalogEntry, predicate_node: ComparisonExpression
-    ):
-        filter_clause = None
-        left = predicate_node.get_child(0)
-        right = predicate_node.get_child(1)
-
-        if isinstance(left, TupleValueExpression):
-            column = left.name
-            x = table.columns[column]
-        elif isinstance(left, ConstantValueExpression):
-            value = left.value
-            x = value
-        else:
-            left_filter_clause = self.predicate_node_to_filter_clause(table, left)
-
-        if isinstance(right, TupleValueExpression):
-            column = right.name
-            y = table.columns[column]
-        elif isinstance(right, ConstantValueExpression):
-            value = right.value
-            y = value
-        else:
-            right_filter_clause = self.predicate_node_to_filter_clause(table, right)
-
-        if isinstance(predicate_node, LogicalExpression):
-            if predicate_node.etype == ExpressionType.LOGICAL_AND:
-                filter_clause = and_(left_filter_clause, right_filter_clause)
-            elif predicate_node.etype == ExpressionType.LOGICAL_OR:
-                filter_clause = or_(left_filter_clause, right_filter_clause)
-
-        elif isinstance(predicate_node, ComparisonExpression):
-            assert (
-                predicate_node.etype != ExpressionType.COMPARE_CONTAINS
-                and predicate_node.etype != ExpressionType.COMPARE_IS_CONTAINED
-            ), f"Predicate type {predicate_node.etype} not supported in delete"
-
-            if predicate_node.etype == ExpressionType.COMPARE_EQUAL:
-                filter_clause = x == y
-            elif predicate_node.etype == ExpressionType.COMPARE_GREATER:
-                filter_clause = x > y
-            elif predicate_node.etype == ExpressionType.COMPARE_LESSER:
-                filter_clause = x < y
-            elif predicate_node.etype == ExpressionType.COMPARE_GEQ:
-                filter_clause = x >= y
-            elif predicate_node.etype == ExpressionType.COMPARE_LEQ:
-                filter_clause = x <= y
-            elif predicate_node.etype == ExpressionType.COMPARE_NEQ:
-                filter_clause = x != y
-
-        return filter_clause
-
     def exec(self, *args, **kwargs) -> Iterator[Batch]:
         table_catalog = self.node.table_ref.table.table_obj
         storage_engine = StorageEngine.factory(self.db, table_catalog)
@@ -102,11 +44,11 @@ class DeleteExecutor(AbstractExecutor):
             table_catalog.name
         )
 
-        sqlalchemy_filter_clause = self.predicate_node_to_filter_clause(
-            table_to_delete_from, predicate_node=self.predicate
-        )
         # verify where clause and convert to sqlalchemy supported filter
         # https://stackoverflow.com/questions/34026210/where-filter-from-table-object-using-a-dictionary-or-kwargs
+        sqlalchemy_filter_clause = predicate_to_sqlalchemy_filter_clause(
+            table_to_delete_from, self.predicate
+        )
 
         storage_engine.delete(table_catalog, sqlalchemy_filter_clause)
         yield Batch(pd.DataFrame(["Deleted rows"]))
@@ -16,6 +16,7 @@
 
 import pandas as pd
 
+from evadb.catalog.catalog_type import ScalarIndexType
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
 from evadb.executor.executor_utils import ExecutorError, handle_vector_store_params
@@ -23,6 +24,7 @@ from evadb.models.storage.batch import Batch
 from evadb.parser.types import ObjectType
 from evadb.plan_nodes.drop_object_plan import DropObjectPlan
 from evadb.storage.storage_engine import StorageEngine
+from evadb.third_party.databases.interface import clear_database_handler_pool
 from evadb.third_party.vector_stores.utils import VectorStoreFactory
 from evadb.utils.logging_manager import logger
 
@@ -114,6 +116,13 @@ class DropObjectExecutor(AbstractExecutor):
                 return Batch(pd.DataFrame([err_msg]))
             else:
                 raise RuntimeError(err_msg)
+        elif isinstance(index_obj.type, ScalarIndexType):
+            # scalar indexes live in the database of the structured table
+            table_obj = self.catalog().get_table_catalog_entry(
+                index_obj.feat_column.table_name
+            )
+            storage_engine = StorageEngine.factory(self.db, table_obj)
+            storage_engine.drop_index(table_obj, index_obj.name)
         else:
             index = VectorStoreFactory.init_vector_store(
                 index_obj.type,
@@ -127,14 +136,14 @@ class DropObjectExecutor(AbstractExecutor):
             if index:
                 index.delete()
 
-            self.catalog().drop_index_catalog_entry(index_name)
+        self.catalog().drop_index_catalog_entry(index_name)
 
-            return Batch(
-                pd.DataFrame(
-                    {f"Index {index_name} successfully dropped"},
-                    index=[0],
-                )
+        return Batch(
+            pd.DataFrame(
+                {f"Index {index_name} successfully dropped"},
+                index=[0],
             )
+        )
 
     def _handle_drop_database(self, database_name: str, if_exists: bool):
         db_catalog_entry = self.catalog().get_database_catalog_entry(database_name)
@@ -150,6 +159,7 @@ class DropObjectExecutor(AbstractExecutor):
 
         logger.debug(f"Dropping database {database_name}")
 
+        clear_database_handler_pool(db_catalog_entry.engine, **db_catalog_entry.params)
         self.catalog().drop_database_catalog_entry(db_catalog_entry)
 
         return Batch(
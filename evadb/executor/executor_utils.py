@@ -15,7 +15,7 @@
 import glob
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Generator, List, Union
+from typing import TYPE_CHECKING, Generator, List, Tuple, Union
 
 from evadb.catalog.catalog_utils import xform_column_definitions_to_catalog_entries
 from evadb.catalog.models.utils import TableCatalogEntry
@@ -31,7 +31,7 @@ from evadb.models.storage.batch import Batch
 from evadb.parser.table_ref import TableInfo
 from evadb.parser.types import FileFormatType
 from evadb.readers.document.registry import SUPPORTED_TYPES
-from evadb.utils.generic_utils import try_to_import_cv2
+from evadb.utils.generic_utils import try_to_import_cv2, try_to_import_decord
 from evadb.utils.logging_manager import logger
 
 
@@ -106,8 +106,8 @@ def validate_image(image_path: Path) -> bool:
         try_to_import_cv2()
         import cv2
 
-        data = cv2.imread(str(image_path))
-        return data is not None
+        # only reads the header of the file to find a decoder
+        return cv2.haveImageReader(str(image_path))
     except Exception as e:
         logger.warning(
             f"Unexpected Exception {e} occurred while reading image file {image_path}"
@@ -119,19 +119,55 @@ def iter_path_regex(path_regex: Path) -> Generator[str, None, None]:
     return glob.iglob(os.path.expanduser(path_regex), recursive=True)
 
 
+# number of bytes read from the start of a video file to sniff the container
+_VIDEO_HEADER_SIZE = 512
+
+
+def _has_video_container_signature(header: bytes) -> bool:
+    return (
+        # ISO base media (mp4, mov, m4v, 3gp)
+        header[4:8] in (b"ftyp", b"moov", b"mdat", b"free", b"wide", b"skip")
+        or (header[:4] == b"RIFF" and header[8:12] == b"AVI ")
+        # matroska, webm
+        or header[:4] == b"\x1a\x45\xdf\xa3"
+        or header[:3] == b"FLV"
+        or header[:4] == b"OggS"
+        # mpeg program stream
+        or header[:4] == b"\x00\x00\x01\xba"
+        # asf, wmv
+        or header[:4] == b"\x30\x26\xb2\x75"
+        # mpeg transport stream, 188 byte packets starting with a sync byte
+        or (len(header) > 188 and header[0] == 0x47 and header[188] == 0x47)
+    )
+
+
 def validate_video(video_path: Path) -> bool:
     try:
-        try_to_import_cv2()
-        import cv2
-
-        vid = cv2.VideoCapture(str(video_path))
-        if not vid.isOpened():
-            return False
+        with open(video_path, "rb") as f:
+            header = f.read(_VIDEO_HEADER_SIZE)
+        if not _has_video_container_signature(header):
+            # fall back to opening the file for the containers we do not sniff
+            try_to_import_cv2()
+            import cv2
+
+            vid = cv2.VideoCapture(str(video_path))
+            if not vid.isOpened():
+                return False
+
+        # a container signature does not guarantee a readable video stream (eg.
+        # truncated files, mp4 files without a moov atom or audio only m4a), so
+        # the video is opened with decord, which indexes it on load. decord
+        # only parses the container, no frame is decoded.
+        try_to_import_decord()
+        import decord
+
+        decord.VideoReader(str(video_path))
         return True
     except Exception as e:
         logger.warning(
             f"Unexpected Exception {e} occurred while reading video file {video_path}"
         )
+        return False
 
 
 def validate_document(doc_path: Path) -> bool:
@@ -155,6 +191,23 @@ def validate_media(file_path: Path, media_type: FileFormatType) -> bool:
         raise ValueError(f"Unsupported Media type {str(media_type)}")
 
 
+def get_file_fingerprint(file_path: Path) -> Tuple[int, int]:
+    """Return the (size, modification time in nanoseconds) of the file. The
+    fingerprint changes if the file is replaced."""
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def get_media_validation_key(file_path: Path, media_type: FileFormatType) -> tuple:
+    """Return the key of the validation of the file. The key changes if the
+    file is replaced."""
+    return (
+        media_type.name,
+        os.path.realpath(file_path),
+        *get_file_fingerprint(file_path),
+    )
+
+
 def handle_vector_store_params(
     vector_store_type: VectorStoreType, index_path: str
 ) -> dict:
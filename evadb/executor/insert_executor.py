@@ -14,7 +14,7 @@
 # limitations under the License.
 import pandas as pd
 
-from evadb.catalog.catalog_type import TableType
+from evadb.catalog.catalog_type import ScalarIndexType, TableType
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
 from evadb.models.storage.batch import Batch
@@ -37,10 +37,11 @@ class InsertExecutor(AbstractExecutor):
             table_name, database_name
         )
 
-        # Implemented only for STRUCTURED_DATA
-        assert (
-            table_catalog_entry.table_type == TableType.STRUCTURED_DATA
-        ), "INSERT only implemented for structured data"
+        # Implemented only for STRUCTURED_DATA and COLUMNAR_DATA
+        assert table_catalog_entry.table_type in [
+            TableType.STRUCTURED_DATA,
+            TableType.COLUMNAR_DATA,
+        ], "INSERT only implemented for structured data"
 
         values_to_insert = [val_node.value for val_node in self.node.value_list]
         tuple_to_insert = tuple(values_to_insert)
@@ -55,6 +56,9 @@ class InsertExecutor(AbstractExecutor):
 
         # Index update if there is an index built on the table.
         for index in self.db.catalog().get_all_index_catalog_entries():
+            if isinstance(index.type, ScalarIndexType):
+                # scalar indexes are maintained by the database
+                continue
             is_index_on_current_table = False
             for column in table_catalog_entry.columns:
                 if column == index.feat_column:
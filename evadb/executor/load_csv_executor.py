@@ -14,6 +14,7 @@
 # limitations under the License.
 import pandas as pd
 
+from evadb.constants import CSV_LOAD_PREFETCH
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
 from evadb.executor.executor_utils import ExecutorError
@@ -22,6 +23,7 @@ from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.load_data_plan import LoadDataPlan
 from evadb.readers.csv_reader import CSVReader
 from evadb.storage.storage_engine import StorageEngine
+from evadb.storage.storage_utils import parallel_scan
 from evadb.utils.logging_manager import logger
 
 
@@ -69,9 +71,17 @@ class LoadCSVExecutor(AbstractExecutor):
         )
 
         storage_engine = StorageEngine.factory(self.db, table_obj)
-        # write with storage engine in batches
+        # write with storage engine in batches. The file is parsed on a
+        # separate thread, so that parsing the next chunks overlaps with
+        # writing the current one
         num_loaded_frames = 0
-        for batch in csv_reader.read():
+        batches = parallel_scan(
+            lambda reader: reader.read(),
+            [csv_reader],
+            num_workers=1,
+            prefetch=CSV_LOAD_PREFETCH,
+        )
+        for batch in batches:
             storage_engine.write(table_obj, batch)
             num_loaded_frames += len(batch)
 
@@ -42,6 +42,8 @@ class LoadDataExecutor(AbstractExecutor):
         ]:
             executor = LoadMultimediaExecutor(self.db, self.node)
         elif self.node.file_options["file_format"] == FileFormatType.CSV:
+            if self.node.file_options.get("incremental", False):
+                raise ExecutorError("INCREMENTAL load is not supported for CSV")
             executor = LoadCSVExecutor(self.db, self.node)
 
         # for each batch, exec the executor
@@ -12,23 +12,36 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import contextlib
 import multiprocessing as mp
 from multiprocessing import Pool
 from pathlib import Path
+from typing import List, Tuple
 
 import pandas as pd
 
+from evadb.catalog.catalog_type import MediaFingerprintColumnName
 from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
-from evadb.executor.executor_utils import ExecutorError, iter_path_regex, validate_media
+from evadb.executor.executor_utils import (
+    ExecutorError,
+    get_file_fingerprint,
+    get_media_validation_key,
+    iter_path_regex,
+    validate_media,
+)
 from evadb.models.storage.batch import Batch
 from evadb.parser.types import FileFormatType
 from evadb.plan_nodes.load_data_plan import LoadDataPlan
+from evadb.readers.decord_reader import get_video_index
+from evadb.storage.abstract_media_storage_engine import AbstractMediaStorageEngine
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
 from evadb.storage.storage_engine import StorageEngine
-from evadb.utils.errors import DatasetFileNotFoundError
+from evadb.utils.errors import CatalogError, DatasetFileNotFoundError
 from evadb.utils.generic_utils import try_to_import_cv2, try_to_import_decord
+from evadb.utils.kv_cache import DiskKVCache
 from evadb.utils.logging_manager import logger
 from evadb.utils.s3_utils import download_from_s3
 
@@ -37,6 +50,8 @@ class LoadMultimediaExecutor(AbstractExecutor):
     def __init__(self, db: EvaDBDatabase, node: LoadDataPlan):
         super().__init__(db, node)
         self.media_type = self.node.file_options["file_format"]
+        # only load the new or changed files
+        self.incremental = self.node.file_options.get("incremental", False)
         # check for appropriate packages
         if self.media_type == FileFormatType.IMAGE:
             try_to_import_cv2()
@@ -61,15 +76,32 @@ class LoadMultimediaExecutor(AbstractExecutor):
                 # Local Storage
                 video_files = list(iter_path_regex(self.node.file_path))
 
+            # Skip the files validated by a previous load, unless they changed
+            valid_files, invalid_files = [], []
+            validation_cache = self._get_validation_cache()
+            cache_keys, valid_bitmap = [], [None] * len(video_files)
+            if validation_cache is not None:
+                cache_keys = [
+                    get_media_validation_key(path, self.media_type)
+                    for path in video_files
+                ]
+                valid_bitmap = [validation_cache.get(key) for key in cache_keys]
+            unchecked = [idx for idx, valid in enumerate(valid_bitmap) if valid is None]
+            unchecked_files = [video_files[idx] for idx in unchecked]
+
             # Use parallel validation if there are many files. Otherwise, use single-thread
             # validation version.
-            valid_files, invalid_files = [], []
-            if len(video_files) < mp.cpu_count() * 2:
-                valid_bitmap = [self._is_media_valid(path) for path in video_files]
+            if len(unchecked_files) < mp.cpu_count() * 2:
+                results = [self._is_media_valid(path) for path in unchecked_files]
             else:
                 # TODO: move this to configuration file later.
                 pool = Pool(mp.cpu_count())
-                valid_bitmap = pool.map(self._is_media_valid, video_files)
+                results = pool.map(self._is_media_valid, unchecked_files)
+
+            for idx, is_valid in zip(unchecked, results):
+                valid_bitmap[idx] = is_valid
+                if validation_cache is not None:
+                    validation_cache.set(cache_keys[idx], is_valid)
 
             # Raise error if any file is invalid.
             if False in valid_bitmap:
@@ -120,10 +152,47 @@ class LoadMultimediaExecutor(AbstractExecutor):
             if do_create:
                 storage_engine.create(table_obj)
 
-            storage_engine.write(
-                table_obj,
-                Batch(pd.DataFrame({"file_path": valid_files})),
-            )
+            load_files, changed_files = valid_files, []
+            if self.incremental and not do_create:
+                load_files, changed_files = self._get_file_delta(
+                    storage_engine, table_obj, valid_files
+                )
+                # the changed files are loaded again
+                if changed_files:
+                    storage_engine.delete(
+                        table_obj, Batch(pd.DataFrame({"file_path": changed_files}))
+                    )
+
+            if load_files:
+                # the fingerprint of the files lets incremental loads skip the
+                # unchanged files
+                file_sizes, file_mtimes = zip(
+                    *[get_file_fingerprint(file_path) for file_path in load_files]
+                )
+                rows = pd.DataFrame(
+                    {
+                        "file_path": load_files,
+                        MediaFingerprintColumnName.file_size.name: file_sizes,
+                        MediaFingerprintColumnName.file_mtime.name: file_mtimes,
+                    }
+                )
+                if self.media_type == FileFormatType.VIDEO:
+                    # probe the videos once, so that queries read the frame count,
+                    # key frames and timestamps from the index instead of the files
+                    video_index = pd.DataFrame(
+                        [get_video_index(file_path) for file_path in load_files]
+                    )
+                    rows = pd.concat([rows, video_index], axis=1)
+                storage_engine.write(table_obj, Batch(rows))
+
+            if self.incremental:
+                loaded_files = self._get_loaded_files_status(
+                    storage_engine, table_obj, load_files, changed_files
+                )
+                logger.info(
+                    f"Number of loaded {self.media_type.name}: {len(load_files)}, "
+                    f"skipped unchanged: {len(valid_files) - len(load_files)}"
+                )
 
         except Exception as e:
             # If we fail to obtain the storage engine or table object,
@@ -133,13 +202,66 @@ class LoadMultimediaExecutor(AbstractExecutor):
             err_msg = f"Load {self.media_type.name} failed: {str(e)}"
             raise ExecutorError(err_msg)
         else:
-            yield Batch(
-                pd.DataFrame(
-                    [
-                        f"Number of loaded {self.media_type.name}: {str(len(valid_files))}"
-                    ]
+            if self.incremental:
+                # the row ids of the new and changed files, so that downstream
+                # queries can process only the delta
+                yield Batch(loaded_files)
+            else:
+                yield Batch(
+                    pd.DataFrame(
+                        [
+                            f"Number of loaded {self.media_type.name}: {str(len(valid_files))}"
+                        ]
+                    )
                 )
-            )
+
+    def _get_file_delta(
+        self,
+        storage_engine: AbstractMediaStorageEngine,
+        table_obj: TableCatalogEntry,
+        files: List[str],
+    ) -> Tuple[List[str], List[str]]:
+        """Return the files that are new or changed since they were loaded into
+        the table, and the subset of them that changed. The files loaded before
+        the fingerprints were recorded are considered unchanged."""
+        fingerprints = {
+            row.file_url: (row.file_size, row.file_mtime)
+            for row in storage_engine.get_loaded_files(table_obj).itertuples()
+        }
+        load_files, changed_files = [], []
+        for file_path in files:
+            if file_path not in fingerprints:
+                load_files.append(file_path)
+                continue
+            file_size, file_mtime = fingerprints[file_path]
+            if pd.isna(file_size):
+                continue
+            if (file_size, file_mtime) != get_file_fingerprint(file_path):
+                load_files.append(file_path)
+                changed_files.append(file_path)
+        return load_files, changed_files
+
+    def _get_loaded_files_status(
+        self,
+        storage_engine: AbstractMediaStorageEngine,
+        table_obj: TableCatalogEntry,
+        load_files: List[str],
+        changed_files: List[str],
+    ) -> pd.DataFrame:
+        loaded_files = storage_engine.get_loaded_files(table_obj)
+        row_ids = dict(zip(loaded_files.file_url, loaded_files[IDENTIFIER_COLUMN]))
+        changed_files = set(changed_files)
+        return pd.DataFrame(
+            {
+                "file_path": load_files,
+                IDENTIFIER_COLUMN: [row_ids[file_path] for file_path in load_files],
+                "status": [
+                    "updated" if file_path in changed_files else "added"
+                    for file_path in load_files
+                ],
+            },
+            columns=["file_path", IDENTIFIER_COLUMN, "status"],
+        )
 
     def _rollback_load(
         self,
@@ -149,6 +271,16 @@ class LoadMultimediaExecutor(AbstractExecutor):
     ):
         if do_create:
             storage_engine.drop(table_obj)
+            # rollback the catalog entry, suppress any errors raised by catalog
+            with contextlib.suppress(CatalogError):
+                self.catalog().delete_table_catalog_entry(table_obj)
+
+    def _get_validation_cache(self) -> DiskKVCache:
+        # validating documents and pdfs only checks the file suffix
+        if self.media_type not in [FileFormatType.IMAGE, FileFormatType.VIDEO]:
+            return None
+        cache_dir = Path(self.config.get_value("storage", "cache_dir"))
+        return DiskKVCache(str(cache_dir / "media_validation"))
 
     def _is_media_valid(
         self,
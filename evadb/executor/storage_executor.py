@@ -14,7 +14,10 @@
 # limitations under the License.
 from typing import Iterator
 
-from evadb.catalog.catalog_type import TableType
+import numpy as np
+
+from evadb.catalog.catalog_type import TableType, VideoColumnName
+from evadb.catalog.sql_config import ROW_NUM_COLUMN
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
 from evadb.executor.executor_utils import ExecutorError
@@ -27,12 +30,68 @@ from evadb.utils.logging_manager import logger
 class StorageExecutor(AbstractExecutor):
     def __init__(self, db: EvaDBDatabase, node: StoragePlan):
         super().__init__(db, node)
+        self._track_progress = False
+        self._resume_row_number = None
+        # `_row_number` of the last row read, if the progress is tracked
+        self.last_row_number = None
+
+    def reads_in_order(self) -> bool:
+        """Return True if the scan reads the rows in increasing `_row_number`
+        order, which `track_progress` relies on"""
+        table_type = self.node.table.table_type
+        if table_type == TableType.VIDEO_DATA:
+            # the frames of the videos decoded concurrently may interleave
+            storage_engine = StorageEngine.factory(self.db, self.node.table)
+            return storage_engine.is_scan_ordered()
+        # native tables have no row numbers
+        return table_type != TableType.NATIVE_DATA
+
+    def track_progress(self, resume_row_number: int = None):
+        """Record the `_row_number` of the last row read, to checkpoint the
+        progress of the scan. If `resume_row_number` is set, the rows up to it
+        are skipped. Only scans that `reads_in_order` can be tracked."""
+        self._track_progress = True
+        self._resume_row_number = resume_row_number
 
     def exec(self, *args, **kwargs) -> Iterator[Batch]:
+        batches = self._read()
+        if self._track_progress:
+            return self._read_with_progress(batches)
+        return batches
+
+    def _read_with_progress(self, batches: Iterator[Batch]) -> Iterator[Batch]:
+        for batch in batches:
+            if batch.empty():
+                continue
+            row_numbers = batch.column_as_numpy_array(ROW_NUM_COLUMN)
+            if (
+                self.last_row_number is not None
+                and row_numbers[0] <= self.last_row_number
+            ) or np.any(np.diff(row_numbers) <= 0):
+                # the checkpoints would skip the rows read out of order
+                raise ExecutorError(
+                    f"Rows of {self.node.table.name} are not read in order, "
+                    "the progress of the scan cannot be tracked"
+                )
+            self.last_row_number = int(row_numbers[-1])
+
+            if self._resume_row_number is not None:
+                batch = Batch(batch.frames[row_numbers > self._resume_row_number])
+                batch.reset_index()
+                if batch.empty():
+                    continue
+            yield batch
+
+    def _read(self) -> Iterator[Batch]:
         try:
             storage_engine = StorageEngine.factory(self.db, self.node.table)
 
             if self.node.table.table_type == TableType.VIDEO_DATA:
+                # frames are only decoded if the query references the data column
+                read_video = (
+                    self.node.columns is None
+                    or VideoColumnName.data.name in self.node.columns
+                )
                 return storage_engine.read(
                     self.node.table,
                     self.node.batch_mem_size,
@@ -40,18 +99,36 @@ class StorageExecutor(AbstractExecutor):
                     sampling_rate=self.node.sampling_rate,
                     sampling_type=self.node.sampling_type,
                     read_audio=self.node.table_ref.get_audio,
-                    read_video=self.node.table_ref.get_video,
+                    read_video=read_video,
+                    resolution=self.node.resolution,
                 )
             elif self.node.table.table_type == TableType.IMAGE_DATA:
-                return storage_engine.read(self.node.table)
-            elif self.node.table.table_type == TableType.DOCUMENT_DATA:
-                return storage_engine.read(self.node.table, self.node.chunk_params)
-            elif self.node.table.table_type == TableType.STRUCTURED_DATA:
                 return storage_engine.read(self.node.table, self.node.batch_mem_size)
+            elif self.node.table.table_type == TableType.DOCUMENT_DATA:
+                return storage_engine.read(
+                    self.node.table, self.node.chunk_params, self.node.batch_mem_size
+                )
+            elif self.node.table.table_type in [
+                TableType.STRUCTURED_DATA,
+                TableType.COLUMNAR_DATA,
+            ]:
+                return storage_engine.read(
+                    self.node.table,
+                    self.node.batch_mem_size,
+                    predicate=self.node.predicate,
+                    columns=self.node.columns,
+                )
             elif self.node.table.table_type == TableType.NATIVE_DATA:
-                return storage_engine.read(self.node.table)
+                return storage_engine.read(
+                    self.node.table,
+                    self.node.batch_mem_size,
+                    predicate=self.node.predicate,
+                    columns=self.node.columns,
+                    orderby_list=self.node.orderby_list,
+                    limit=self.node.limit,
+                )
             elif self.node.table.table_type == TableType.PDF_DATA:
-                return storage_engine.read(self.node.table)
+                return storage_engine.read(self.node.table, self.node.batch_mem_size)
             else:
                 raise ExecutorError(
                     f"Unsupported TableType {self.node.table.table_type} encountered"
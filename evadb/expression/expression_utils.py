@@ -13,7 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Set
+import operator
+from typing import Dict, List, Set
+
+import numpy as np
 
 from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
 from evadb.expression.comparison_expression import ComparisonExpression
@@ -226,6 +229,64 @@ def extract_range_list_from_predicate(
         raise RuntimeError(f"Contains unsupported expression {type(predicate)}")
 
 
+def extract_range_list_from_column_values(
+    predicate: AbstractExpression, column_values: Dict[str, np.ndarray]
+) -> List:
+    """The function evaluates the range predicate on the values of the columns
+        of every row, and converts the matching rows to a list of
+        [(start_1, end_1), ... ] pairs of row ids.
+
+        Unlike `extract_range_list_from_predicate`, the predicate can contain
+        conditions on columns other than the row id, eg. the timestamps of the
+        frames of a video.
+
+    Args:
+        predicate (AbstractExpression): Input predicate to extract valid ranges.
+            It should only contain LogicalExpression, ComparisonExpression,
+            TupleValueExpression or ConstantValueExpression
+        column_values (Dict[str, np.ndarray]): values of every row of the
+            columns in the predicate, keyed by the column name
+
+    Returns:
+        List[Tuple]: list of (start, end) pairs of valid ranges
+
+    Example:
+            seconds >= 0.1 with seconds [0.0, 0.05, 0.1, 0.15]: [(2, 3)]
+            id < 1 OR seconds > 0.1 with the same seconds: [(0, 0), (3, 3)]
+    """
+    comparison_operators = {
+        ExpressionType.COMPARE_EQUAL: operator.eq,
+        ExpressionType.COMPARE_GREATER: operator.gt,
+        ExpressionType.COMPARE_LESSER: operator.lt,
+        ExpressionType.COMPARE_GEQ: operator.ge,
+        ExpressionType.COMPARE_LEQ: operator.le,
+        ExpressionType.COMPARE_NEQ: operator.ne,
+    }
+
+    def evaluate(expr: AbstractExpression):
+        if isinstance(expr, TupleValueExpression):
+            return column_values[expr.name]
+        elif isinstance(expr, ConstantValueExpression):
+            return expr.value
+        elif expr.etype == ExpressionType.LOGICAL_AND:
+            return evaluate(expr.children[0]) & evaluate(expr.children[1])
+        elif expr.etype == ExpressionType.LOGICAL_OR:
+            return evaluate(expr.children[0]) | evaluate(expr.children[1])
+        elif expr.etype == ExpressionType.LOGICAL_NOT:
+            return ~evaluate(expr.children[0])
+        elif expr.etype in comparison_operators:
+            return comparison_operators[expr.etype](
+                evaluate(expr.children[0]), evaluate(expr.children[1])
+            )
+        raise RuntimeError(f"Contains unsupported expression {type(expr)}")
+
+    num_rows = len(next(iter(column_values.values())))
+    mask = np.broadcast_to(evaluate(predicate), (num_rows,)).astype(np.int8)
+    # the runs of matching rows start and end where the mask changes
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask, [0]))))
+    return [(int(begin), int(end) - 1) for begin, end in zip(edges[::2], edges[1::2])]
+
+
 def get_columns_in_predicate(predicate: AbstractExpression) -> Set[str]:
     """Get columns accessed in the predicate
 
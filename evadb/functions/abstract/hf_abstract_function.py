@@ -16,6 +16,7 @@ from typing import Any
 
 import pandas as pd
 
+from evadb.catalog.catalog_utils import FUNCTION_INPUT_RESOLUTION_KEY
 from evadb.catalog.models.function_catalog import FunctionCatalogEntry
 from evadb.functions.abstract.abstract_function import AbstractFunction
 from evadb.functions.gpu_compatible import GPUCompatible
@@ -47,6 +48,8 @@ class AbstractHFFunction(AbstractFunction, GPUCompatible):
         super().__init__(*args, **kwargs)
         pipeline_args = self.default_pipeline_args
         for entry in function_obj.metadata:
+            if entry.key == FUNCTION_INPUT_RESOLUTION_KEY:
+                continue
             if entry.value.isnumeric():
                 pipeline_args[entry.key] = int(entry.value)
             else:
@@ -14,7 +14,7 @@
 # limitations under the License.
 
 
-from typing import List
+from typing import List, Tuple
 
 from evadb.functions.decorators.io_descriptors.abstract_types import IOArgument
 
@@ -46,12 +46,17 @@ def setup(
     return inner_fn
 
 
-def forward(input_signatures: List[IOArgument], output_signatures: List[IOArgument]):
+def forward(
+    input_signatures: List[IOArgument],
+    output_signatures: List[IOArgument],
+    input_resolution: Tuple[int, int] = None,
+):
     """decorator for the forward function. It will be used to set the input and output.
 
     Args:
         input_signature (List[IOArgument]): List of input arguments for the function
         output_signature ( List[IOArgument])): List of output arguments for the function
+        input_resolution (Tuple[int, int]): (width, height) the function resizes its input frames to. The frames are decoded at this resolution if no other expression of the query needs the full frames
     """
 
     def inner_fn(arg_fn):
@@ -62,6 +67,7 @@ def forward(input_signatures: List[IOArgument], output_signatures: List[IOArgume
         tags = {}
         tags["input"] = input_signatures
         tags["output"] = output_signatures
+        tags["input_resolution"] = input_resolution
         wrapper.tags = tags
         return wrapper
 
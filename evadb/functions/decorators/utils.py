@@ -12,7 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, Type
+from typing import List, Tuple, Type
 
 from evadb.catalog.models.function_io_catalog import FunctionIOCatalogEntry
 from evadb.functions.abstract.abstract_function import AbstractFunction
@@ -51,3 +51,22 @@ def load_io_from_function_decorators(
     for io in io_signature:
         result_list.extend(io.generate_catalog_entries(is_input))
     return result_list
+
+
+def load_input_resolution_from_function_decorators(
+    function: Type[AbstractFunction],
+) -> Tuple[int, int]:
+    """Load the input resolution declared with the forward decorator of the function
+
+    Args:
+        function (Object): Function object
+
+    Returns:
+        Tuple[int, int]: (width, height) declared by the decorator or None
+    """
+    if (
+        hasattr(function.forward, "tags")
+        and "input_resolution" in function.forward.tags
+    ):
+        return function.forward.tags["input_resolution"]
+    return None
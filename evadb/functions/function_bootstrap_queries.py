@@ -186,7 +186,8 @@ mnistcnn_function_query = """CREATE FUNCTION IF NOT EXISTS MnistImageClassifier
         INPUT  (data NDARRAY (3, 28, 28))
         OUTPUT (label TEXT(2))
         TYPE  Classification
-        IMPL  '{}/functions/mnist_image_classifier.py';
+        IMPL  '{}/functions/mnist_image_classifier.py'
+        INPUT_RESOLUTION '28x28';
         """.format(
     EvaDB_INSTALLATION_DIR
 )
@@ -286,6 +286,8 @@ class EvaDBCursor(object):
             table_name (str): Name of the table.
             format (str): File format of the data.
             **kwargs: Additional keyword arguments for configuring the load operation.
+                `incremental=True` only loads the files that are new or changed
+                since the previous load into the table.
 
         Returns:
             EvaDBQuery: The EvaDBQuery object representing the load query.
@@ -297,6 +299,12 @@ class EvaDBCursor(object):
                     0
             0	Number of loaded VIDEO: 1
 
+            Load the new or changed videos, and get the row ids of the loaded videos.
+
+            >>> cursor.load(file_regex="cams/*.mp4", table_name="traffic", format="video", incremental=True).df()
+                      file_path  _row_id status
+            0	cams/cam3.mp4        3  added
+
         """
         # LOAD {FORMAT} file_regex INTO table_name
         stmt = parse_load(table_name, file_regex, format, **kwargs)
@@ -15,9 +15,9 @@
 from collections import deque
 from enum import IntEnum, auto
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple, Union
 
-from evadb.catalog.catalog_type import VectorStoreType
+from evadb.catalog.catalog_type import ScalarIndexType, TableType, VectorStoreType
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.function_io_catalog import FunctionIOCatalogEntry
 from evadb.catalog.models.function_metadata_catalog import FunctionMetadataCatalogEntry
@@ -182,6 +182,10 @@ class LogicalGet(Operator):
         sampling_rate: int = None,
         sampling_type: str = None,
         chunk_params: dict = {},
+        columns: List[str] = None,
+        orderby_list: List = None,
+        limit: int = None,
+        resolution: Tuple[int, int] = None,
         children=None,
     ):
         self._video = video
@@ -192,6 +196,10 @@ class LogicalGet(Operator):
         self._sampling_rate = sampling_rate
         self._sampling_type = sampling_type
         self.chunk_params = chunk_params
+        self.columns = columns
+        self._orderby_list = orderby_list
+        self._limit = limit
+        self.resolution = resolution
         super().__init__(OperatorType.LOGICALGET, children)
 
     @property
@@ -222,6 +230,14 @@ class LogicalGet(Operator):
     def sampling_type(self):
         return self._sampling_type
 
+    @property
+    def orderby_list(self):
+        return self._orderby_list
+
+    @property
+    def limit(self):
+        return self._limit
+
     def __eq__(self, other):
         is_subtree_equal = super().__eq__(other)
         if not isinstance(other, LogicalGet):
@@ -236,6 +252,10 @@ class LogicalGet(Operator):
             and self.sampling_rate == other.sampling_rate
             and self.sampling_type == other.sampling_type
             and self.chunk_params == other.chunk_params
+            and self.columns == other.columns
+            and self.orderby_list == other.orderby_list
+            and self.limit == other.limit
+            and self.resolution == other.resolution
         )
 
     def __hash__(self) -> int:
@@ -250,6 +270,10 @@ class LogicalGet(Operator):
                 self.sampling_rate,
                 self.sampling_type,
                 frozenset(self.chunk_params.items()),
+                tuple(self.columns or []),
+                tuple(self.orderby_list or []),
+                self.limit,
+                self.resolution,
             )
         )
 
@@ -551,6 +575,8 @@ class LogicalCreate(Operator):
         video {TableRef}: [video table that is to be created]
         column_list {List[ColumnDefinition]}:
         if_not_exists {bool}: [create table if exists]
+        table_type {TableType}: [STRUCTURED_DATA or COLUMNAR_DATA]
+        query {str}: [select query populating the table, if any]
 
     """
 
@@ -559,12 +585,16 @@ class LogicalCreate(Operator):
         video: TableInfo,
         column_list: List[ColumnDefinition],
         if_not_exists: bool = False,
+        table_type: TableType = TableType.STRUCTURED_DATA,
+        query: str = None,
         children: List = None,
     ):
         super().__init__(OperatorType.LOGICALCREATE, children)
         self._video = video
         self._column_list = column_list
         self._if_not_exists = if_not_exists
+        self._table_type = table_type
+        self._query = query
 
     @property
     def video(self):
@@ -578,6 +608,14 @@ class LogicalCreate(Operator):
     def if_not_exists(self):
         return self._if_not_exists
 
+    @property
+    def table_type(self):
+        return self._table_type
+
+    @property
+    def query(self):
+        return self._query
+
     def __eq__(self, other):
         is_subtree_equal = super().__eq__(other)
         if not isinstance(other, LogicalCreate):
@@ -587,6 +625,8 @@ class LogicalCreate(Operator):
             and self.video == other.video
             and self.column_list == other.column_list
             and self.if_not_exists == other.if_not_exists
+            and self.table_type == other.table_type
+            and self.query == other.query
         )
 
     def __hash__(self) -> int:
@@ -596,6 +636,8 @@ class LogicalCreate(Operator):
                 self.video,
                 tuple(self.column_list),
                 self.if_not_exists,
+                self.table_type,
+                self.query,
             )
         )
 
@@ -1094,7 +1136,7 @@ class LogicalCreateIndex(Operator):
         if_not_exists: bool,
         table_ref: TableRef,
         col_list: List[ColumnDefinition],
-        vector_store_type: VectorStoreType,
+        vector_store_type: Union[VectorStoreType, ScalarIndexType],
         project_expr_list: List[AbstractExpression],
         index_def: str,
         children: List = None,
@@ -18,12 +18,15 @@ from typing import List, Tuple
 if typing.TYPE_CHECKING:
     from evadb.optimizer.optimizer_context import OptimizerContext
 
+from evadb.catalog.catalog_type import ColumnType, TableType, VideoColumnName
 from evadb.catalog.catalog_utils import get_table_primary_columns
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.function_io_catalog import FunctionIOCatalogEntry
 from evadb.catalog.models.function_metadata_catalog import FunctionMetadataCatalogEntry
+from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.constants import CACHEABLE_FUNCTIONS, DEFAULT_FUNCTION_EXPRESSION_COST
 from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
 from evadb.expression.expression_utils import (
     conjunction_list_to_expression_tree,
@@ -36,9 +39,12 @@ from evadb.expression.function_expression import (
     FunctionExpression,
     FunctionExpressionCache,
 )
+from evadb.expression.logical_expression import LogicalExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.parser.alias import Alias
 from evadb.parser.create_statement import ColumnDefinition
+from evadb.storage.storage_utils import SQL_COMPARISON_OPERATORS
+from evadb.third_party.databases.interface import is_sqlalchmey_compatible_database
 from evadb.utils.kv_cache import DiskKVCache
 
 
@@ -159,6 +165,31 @@ def extract_pushdown_predicate(
     )
 
 
+def extract_pushdown_predicate_for_video(
+    predicate: AbstractExpression, video_alias: str
+) -> Tuple[AbstractExpression, AbstractExpression]:
+    """Decompose the predicate on a video table into the predicate evaluated by
+    the video reader and the remaining predicate. The reader converts the range
+    predicates on the frame id and on the timestamp of the frames into ranges of
+    frames to decode.
+
+    Args:
+        predicate (AbstractExpression): predicate that needs to be decomposed
+        video_alias (str): alias of the video table
+    Returns:
+        Tuple[AbstractExpression, AbstractExpression]: (pushdown predicate,
+        remaining predicate)
+    """
+    pushdown_preds = []
+    for column in [VideoColumnName.id.name, VideoColumnName.seconds.name]:
+        pushdown_pred, predicate = extract_pushdown_predicate(
+            predicate, f"{video_alias}.{column}"
+        )
+        if pushdown_pred:
+            pushdown_preds.append(pushdown_pred)
+    return conjunction_list_to_expression_tree(pushdown_preds), predicate
+
+
 def extract_pushdown_predicate_for_alias(
     predicate: AbstractExpression, aliases: List[Alias]
 ):
@@ -191,6 +222,93 @@ def extract_pushdown_predicate_for_alias(
     )
 
 
+def is_storage_pushdown_supported(
+    context: "OptimizerContext", table: TableCatalogEntry
+) -> bool:
+    """Checks if the storage engine of the table evaluates pushed down predicates
+
+    Structured tables are stored in the SQL catalog database, columnar tables
+    filter the row groups of their parquet files, and native tables of
+    sqlalchemy compatible data sources run the query in the data source.
+
+    Args:
+        context (OptimizerContext): optimizer context
+        table (TableCatalogEntry): table read by the storage engine
+    Returns:
+        bool: True, if predicates can be pushed into the storage engine
+    """
+    if table.table_type in [TableType.STRUCTURED_DATA, TableType.COLUMNAR_DATA]:
+        return True
+    if table.table_type == TableType.NATIVE_DATA:
+        db_catalog_entry = context.db.catalog().get_database_catalog_entry(
+            table.database_name
+        )
+        return db_catalog_entry is not None and is_sqlalchmey_compatible_database(
+            db_catalog_entry.engine, **db_catalog_entry.params
+        )
+    return False
+
+
+def is_storage_pushdown_predicate(predicate: AbstractExpression, alias: str) -> bool:
+    """Checks if the predicate can be evaluated by a SQL-backed storage engine
+
+    The predicate must only contain logical expressions and comparisons between
+    scalar columns of the table and scalar constants.
+
+    Args:
+        predicate (AbstractExpression): predicate expression to check
+        alias (str): alias of the table read by the storage engine
+    Returns:
+        bool: True, if the predicate can be pushed into the storage engine
+    """
+    if isinstance(predicate, TupleValueExpression):
+        return (
+            predicate.table_alias == alias
+            and isinstance(predicate.col_object, ColumnCatalogEntry)
+            and predicate.col_object.type != ColumnType.NDARRAY
+        )
+    if isinstance(predicate, ConstantValueExpression):
+        return isinstance(predicate.value, (int, float, str))
+    if isinstance(predicate, ComparisonExpression):
+        if predicate.etype not in SQL_COMPARISON_OPERATORS:
+            return False
+    elif not isinstance(predicate, LogicalExpression):
+        return False
+    return all(
+        is_storage_pushdown_predicate(child, alias) for child in predicate.children
+    )
+
+
+def extract_pushdown_predicate_for_storage(
+    predicate: AbstractExpression, alias: str
+) -> Tuple[AbstractExpression, AbstractExpression]:
+    """Decompose the predicate into the conjuncts that can be evaluated by a
+    SQL-backed storage engine and the remaining predicate
+
+    Args:
+        predicate (AbstractExpression): predicate that needs to be decomposed
+        alias (str): alias of the table read by the storage engine
+    Returns:
+        Tuple[AbstractExpression, AbstractExpression]: (pushdown predicate,
+        remaining predicate)
+    """
+    if predicate is None:
+        return None, None
+
+    pushdown_preds = []
+    rem_pred = []
+    for pred in to_conjunction_list(predicate):
+        if is_storage_pushdown_predicate(pred, alias):
+            pushdown_preds.append(pred)
+        else:
+            rem_pred.append(pred)
+
+    return (
+        conjunction_list_to_expression_tree(pushdown_preds),
+        conjunction_list_to_expression_tree(rem_pred),
+    )
+
+
 def optimize_cache_key_for_tuple_value_expression(
     context: "OptimizerContext", tv_expr: TupleValueExpression
 ):
@@ -32,9 +32,12 @@ from evadb.optimizer.optimizer_utils import (
     enable_cache,
     enable_cache_on_expression_tree,
     extract_equi_join_keys,
-    extract_pushdown_predicate,
     extract_pushdown_predicate_for_alias,
+    extract_pushdown_predicate_for_storage,
+    extract_pushdown_predicate_for_video,
     get_expression_execution_cost,
+    is_storage_pushdown_predicate,
+    is_storage_pushdown_supported,
 )
 from evadb.optimizer.rules.pattern import Pattern
 from evadb.optimizer.rules.rules_base import Promise, Rule, RuleType
@@ -115,14 +118,24 @@ class EmbedFilterIntoGet(Rule):
         return Promise.EMBED_FILTER_INTO_GET
 
     def check(self, before: LogicalFilter, context: OptimizerContext):
-        # System supports predicate pushdown only while reading video data
+        # System supports predicate pushdown only while reading video data and
+        # SQL-backed tables
         predicate = before.predicate
         lget: LogicalGet = before.children[0]
         if predicate and is_video_table(lget.table_obj):
-            # System only supports pushing basic range predicates on id
-            video_alias = lget.video.alias
-            col_alias = f"{video_alias}.id"
-            pushdown_pred, _ = extract_pushdown_predicate(predicate, col_alias)
+            # System only supports pushing basic range predicates on id and
+            # seconds
+            pushdown_pred, _ = extract_pushdown_predicate_for_video(
+                predicate, lget.video.alias
+            )
+            if pushdown_pred:
+                return True
+        if predicate and is_storage_pushdown_supported(context, lget.table_obj):
+            # Conjuncts without function expressions are evaluated by the
+            # database
+            pushdown_pred, _ = extract_pushdown_predicate_for_storage(
+                predicate, lget.alias.alias_name
+            )
             if pushdown_pred:
                 return True
         return False
@@ -130,12 +143,20 @@ class EmbedFilterIntoGet(Rule):
     def apply(self, before: LogicalFilter, context: OptimizerContext):
         predicate = before.predicate
         lget = before.children[0]
-        # System only supports pushing basic range predicates on id
-        video_alias = lget.video.alias
-        col_alias = f"{video_alias}.id"
-        pushdown_pred, unsupported_pred = extract_pushdown_predicate(
-            predicate, col_alias
-        )
+        if is_storage_pushdown_supported(context, lget.table_obj):
+            pushdown_pred, unsupported_pred = extract_pushdown_predicate_for_storage(
+                predicate, lget.alias.alias_name
+            )
+            if pushdown_pred and lget.predicate:
+                pushdown_pred = conjunction_list_to_expression_tree(
+                    [lget.predicate, pushdown_pred]
+                )
+        else:
+            # System only supports pushing basic range predicates on id and
+            # seconds
+            pushdown_pred, unsupported_pred = extract_pushdown_predicate_for_video(
+                predicate, lget.video.alias
+            )
         if pushdown_pred:
             new_get_opr = LogicalGet(
                 lget.video,
@@ -145,6 +166,10 @@ class EmbedFilterIntoGet(Rule):
                 target_list=lget.target_list,
                 sampling_rate=lget.sampling_rate,
                 sampling_type=lget.sampling_type,
+                columns=lget.columns,
+                orderby_list=lget.orderby_list,
+                limit=lget.limit,
+                resolution=lget.resolution,
                 children=lget.children,
             )
             if unsupported_pred:
@@ -156,6 +181,88 @@ class EmbedFilterIntoGet(Rule):
             yield before
 
 
+class EmbedOrderByIntoGet(Rule):
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICALORDERBY)
+        pattern.append_child(Pattern(OperatorType.LOGICALGET))
+        super().__init__(RuleType.EMBED_ORDERBY_INTO_GET, pattern)
+
+    def promise(self):
+        return Promise.EMBED_ORDERBY_INTO_GET
+
+    def check(self, before: LogicalOrderBy, context: OptimizerContext):
+        # System supports order by pushdown only while reading native tables
+        lget: LogicalGet = before.children[0]
+        if lget.table_obj.table_type != TableType.NATIVE_DATA:
+            return False
+        # the database cannot order the rows after applying the limit
+        if lget.limit is not None or lget.orderby_list:
+            return False
+        # order by columns of the table, not function expressions
+        for column, _ in before.orderby_list:
+            if not isinstance(
+                column, TupleValueExpression
+            ) or not is_storage_pushdown_predicate(column, lget.alias.alias_name):
+                return False
+        return is_storage_pushdown_supported(context, lget.table_obj)
+
+    def apply(self, before: LogicalOrderBy, context: OptimizerContext):
+        lget: LogicalGet = before.children[0]
+        new_get_opr = LogicalGet(
+            lget.video,
+            lget.table_obj,
+            alias=lget.alias,
+            predicate=lget.predicate,
+            target_list=lget.target_list,
+            sampling_rate=lget.sampling_rate,
+            sampling_type=lget.sampling_type,
+            columns=lget.columns,
+            orderby_list=before.orderby_list,
+            limit=lget.limit,
+            resolution=lget.resolution,
+            children=lget.children,
+        )
+        yield new_get_opr
+
+
+class EmbedLimitIntoGet(Rule):
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICALLIMIT)
+        pattern.append_child(Pattern(OperatorType.LOGICALGET))
+        super().__init__(RuleType.EMBED_LIMIT_INTO_GET, pattern)
+
+    def promise(self):
+        return Promise.EMBED_LIMIT_INTO_GET
+
+    def check(self, before: LogicalLimit, context: OptimizerContext):
+        # System supports limit pushdown only while reading native tables
+        lget: LogicalGet = before.children[0]
+        if lget.table_obj.table_type != TableType.NATIVE_DATA:
+            return False
+        return is_storage_pushdown_supported(context, lget.table_obj)
+
+    def apply(self, before: LogicalLimit, context: OptimizerContext):
+        lget: LogicalGet = before.children[0]
+        limit = before.limit_count.value
+        if lget.limit is not None:
+            limit = min(limit, lget.limit)
+        new_get_opr = LogicalGet(
+            lget.video,
+            lget.table_obj,
+            alias=lget.alias,
+            predicate=lget.predicate,
+            target_list=lget.target_list,
+            sampling_rate=lget.sampling_rate,
+            sampling_type=lget.sampling_type,
+            columns=lget.columns,
+            orderby_list=lget.orderby_list,
+            limit=limit,
+            resolution=lget.resolution,
+            children=lget.children,
+        )
+        yield new_get_opr
+
+
 class EmbedSampleIntoGet(Rule):
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALSAMPLE)
@@ -184,6 +291,10 @@ class EmbedSampleIntoGet(Rule):
             target_list=lget.target_list,
             sampling_rate=sample_freq,
             sampling_type=sample_type,
+            columns=lget.columns,
+            orderby_list=lget.orderby_list,
+            limit=lget.limit,
+            resolution=lget.resolution,
             children=lget.children,
         )
         yield new_get_opr
@@ -718,7 +829,9 @@ class LogicalCreateToPhysical(Rule):
         return True
 
     def apply(self, before: LogicalCreate, context: OptimizerContext):
-        after = CreatePlan(before.video, before.column_list, before.if_not_exists)
+        after = CreatePlan(
+            before.video, before.column_list, before.if_not_exists, before.table_type
+        )
         yield after
 
 
@@ -736,7 +849,11 @@ class LogicalCreateFromSelectToPhysical(Rule):
 
     def apply(self, before: LogicalCreate, context: OptimizerContext):
         after = CreateFromSelectPlan(
-            before.video, before.column_list, before.if_not_exists
+            before.video,
+            before.column_list,
+            before.if_not_exists,
+            before.table_type,
+            before.query,
         )
         for child in before.children:
             after.append_child(child)
@@ -943,6 +1060,10 @@ class LogicalGetToSeqScan(Rule):
                 sampling_type=before.sampling_type,
                 chunk_params=before.chunk_params,
                 batch_mem_size=batch_mem_size,
+                columns=before.columns,
+                orderby_list=before.orderby_list,
+                limit=before.limit,
+                resolution=before.resolution,
             )
         )
         yield after
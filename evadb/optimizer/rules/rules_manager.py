@@ -24,6 +24,8 @@ from evadb.optimizer.rules.rules import (
     CacheFunctionExpressionInProject,
     CombineSimilarityOrderByAndLimitToVectorIndexScan,
     EmbedFilterIntoGet,
+    EmbedLimitIntoGet,
+    EmbedOrderByIntoGet,
     EmbedSampleIntoGet,
     LogicalApplyAndMergeToPhysical,
     LogicalApplyAndMergeToRayPhysical,
@@ -84,6 +86,8 @@ class RulesManager:
             EmbedFilterIntoGet(),
             # EmbedFilterIntoDerivedGet(),
             EmbedSampleIntoGet(),
+            EmbedOrderByIntoGet(),
+            EmbedLimitIntoGet(),
             PushDownFilterThroughJoin(),
             PushDownFilterThroughApplyAndMerge(),
             CombineSimilarityOrderByAndLimitToVectorIndexScan(),
@@ -12,9 +12,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
 from evadb.binder.binder_utils import get_bound_func_expr_outputs_as_tuple_value_expr
+from evadb.catalog.catalog_type import TableType, VideoColumnName
+from evadb.catalog.catalog_utils import get_function_input_resolution
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.expression.function_expression import FunctionExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.optimizer.operators import (
     LogicalCreate,
     LogicalCreateFunction,
@@ -60,9 +67,21 @@ from evadb.parser.types import FunctionType, JoinType
 from evadb.utils.logging_manager import logger
 
 
+def _get_column_name(tv_expr: TupleValueExpression) -> str:
+    # the bound catalog column carries the canonical column name
+    if isinstance(tv_expr.col_object, ColumnCatalogEntry):
+        return tv_expr.col_object.name
+    return tv_expr.name
+
+
 class StatementToPlanConverter:
     def __init__(self):
         self._plan = None
+        # columns referenced by the select statement being converted, keyed by
+        # the table alias
+        self._required_columns = None
+        # resolution the video frames can be decoded at, keyed by the table alias
+        self._required_resolutions = None
 
     def visit_table_ref(self, table_ref: TableRef):
         """Bind table ref object and convert to LogicalGet, LogicalJoin,
@@ -75,6 +94,17 @@ class StatementToPlanConverter:
             # Table
             catalog_entry = table_ref.table.table_obj
             self._plan = LogicalGet(table_ref, catalog_entry, table_ref.alias)
+            if self._required_columns is not None:
+                self._plan.columns = sorted(
+                    self._required_columns.get(table_ref.alias.alias_name, [])
+                )
+            if (
+                self._required_resolutions is not None
+                and catalog_entry.table_type == TableType.VIDEO_DATA
+            ):
+                self._plan.resolution = self._required_resolutions.get(
+                    table_ref.alias.alias_name
+                )
 
         elif table_ref.is_table_valued_expr():
             tve = table_ref.table_valued_expr
@@ -168,7 +198,14 @@ class StatementToPlanConverter:
             statement.from_table = table_ref
 
         if table_ref is not None:
+            outer_required_columns = self._required_columns
+            outer_required_resolutions = self._required_resolutions
+            exprs = self._get_statement_expressions(statement)
+            self._required_columns = self._get_required_columns(exprs)
+            self._required_resolutions = self._get_required_resolutions(exprs)
             self.visit_table_ref(table_ref)
+            self._required_columns = outer_required_columns
+            self._required_resolutions = outer_required_resolutions
 
             # Filter Operator
             predicate = statement.where_clause
@@ -193,6 +230,88 @@ class StatementToPlanConverter:
         if statement.union_link is not None:
             self._visit_union(statement.union_link, statement.union_all)
 
+    def _get_statement_expressions(
+        self, statement: SelectStatement
+    ) -> List[AbstractExpression]:
+        """Collect the expressions of the select statement, excluding the ones
+        of nested select statements."""
+        exprs = list(statement.target_list or [])
+        exprs.append(statement.where_clause)
+        exprs.append(statement.groupby_clause)
+        exprs.extend(expr for expr, _ in statement.orderby_list or [])
+
+        table_refs = [statement.from_table]
+        while table_refs:
+            table_ref = table_refs.pop()
+            if not isinstance(table_ref, TableRef):
+                continue
+            if table_ref.is_join():
+                exprs.append(table_ref.join_node.predicate)
+                table_refs.extend([table_ref.join_node.left, table_ref.join_node.right])
+            elif table_ref.is_table_valued_expr():
+                exprs.append(table_ref.table_valued_expr.func_expr)
+        return [expr for expr in exprs if expr is not None]
+
+    def _get_required_columns(self, exprs: List[AbstractExpression]) -> Dict[str, Set]:
+        """Collect the table columns referenced by the expressions of a select
+        statement.
+
+        Returns:
+            Dict[str, Set]: referenced column names keyed by the table alias
+        """
+        required_columns = defaultdict(set)
+        for expr in exprs:
+            for tv_expr in expr.find_all(TupleValueExpression):
+                required_columns[tv_expr.table_alias].add(_get_column_name(tv_expr))
+        return required_columns
+
+    def _get_required_resolutions(
+        self, exprs: List[AbstractExpression]
+    ) -> Dict[str, Tuple[int, int]]:
+        """Collect the resolution the video frames of every table can be decoded
+        at. If every reference to the data column of a table is a direct
+        argument of a function declaring an input resolution, the frames are
+        decoded at the smallest resolution covering all the declared ones.
+
+        Returns:
+            Dict[str, Tuple[int, int]]: (width, height) keyed by the table alias
+        """
+        # data columns passed to functions declaring an input resolution
+        declared_resolutions = {}
+        for expr in exprs:
+            for func_expr in expr.find_all(FunctionExpression):
+                if func_expr.function_obj is None:
+                    continue
+                resolution = get_function_input_resolution(func_expr.function_obj)
+                if resolution is None:
+                    continue
+                for child in func_expr.children:
+                    if isinstance(child, TupleValueExpression):
+                        declared_resolutions[id(child)] = resolution
+
+        resolutions = {}
+        full_resolution_tables = set()
+        for expr in exprs:
+            for tv_expr in expr.find_all(TupleValueExpression):
+                if _get_column_name(tv_expr) != VideoColumnName.data.name:
+                    continue
+                alias = tv_expr.table_alias
+                resolution = declared_resolutions.get(id(tv_expr))
+                if resolution is None:
+                    full_resolution_tables.add(alias)
+                elif alias in resolutions:
+                    resolutions[alias] = (
+                        max(resolutions[alias][0], resolution[0]),
+                        max(resolutions[alias][1], resolution[1]),
+                    )
+                else:
+                    resolutions[alias] = resolution
+        return {
+            alias: resolution
+            for alias, resolution in resolutions.items()
+            if alias not in full_resolution_tables
+        }
+
     def _visit_sample(self, sample_freq, sample_type):
         sample_opr = LogicalSample(sample_freq, sample_type)
         sample_opr.append_child(self._plan)
@@ -281,7 +400,11 @@ class StatementToPlanConverter:
             logger.error("Missing Table Name In Create Statement")
 
         create_opr = LogicalCreate(
-            table_info, statement.column_list, statement.if_not_exists
+            table_info,
+            statement.column_list,
+            statement.if_not_exists,
+            table_type=statement.table_type,
+            query=str(statement.query) if statement.query is not None else None,
         )
 
         if statement.query is not None:
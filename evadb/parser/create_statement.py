@@ -14,7 +14,7 @@
 # limitations under the License.
 from typing import List, Tuple
 
-from evadb.catalog.catalog_type import ColumnType, NdArrayType
+from evadb.catalog.catalog_type import ColumnType, NdArrayType, TableType
 from evadb.parser.select_statement import SelectStatement
 from evadb.parser.statement import AbstractStatement
 from evadb.parser.table_ref import TableInfo
@@ -119,6 +119,7 @@ class CreateTableStatement(AbstractStatement):
     Attributes:
         TableRef: table reference in the create table statement
         ColumnList: list of columns
+        TableType: STRUCTURED_DATA, or COLUMNAR_DATA for `STORAGE COLUMNAR`
     """
 
     def __init__(
@@ -127,12 +128,14 @@ class CreateTableStatement(AbstractStatement):
         if_not_exists: bool,
         column_list: List[ColumnDefinition] = None,
         query: SelectStatement = None,
+        table_type: TableType = TableType.STRUCTURED_DATA,
     ):
         super().__init__(StatementType.CREATE)
         self._table_info = table_info
         self._if_not_exists = if_not_exists
         self._column_list = column_list
         self._query = query
+        self._table_type = table_type
 
     def __str__(self) -> str:
         print_str = "CREATE TABLE {} ({}) \n".format(
@@ -145,6 +148,9 @@ class CreateTableStatement(AbstractStatement):
         for column in self.column_list:
             print_str += str(column) + "\n"
 
+        if self._table_type == TableType.COLUMNAR_DATA:
+            print_str += "STORAGE COLUMNAR\n"
+
         return print_str
 
     @property
@@ -163,6 +169,10 @@ class CreateTableStatement(AbstractStatement):
     def query(self):
         return self._query
 
+    @property
+    def table_type(self):
+        return self._table_type
+
     @column_list.setter
     def column_list(self, value):
         self._column_list = value
@@ -175,6 +185,7 @@ class CreateTableStatement(AbstractStatement):
             and self.if_not_exists == other.if_not_exists
             and self.column_list == other.column_list
             and self.query == other.query
+            and self.table_type == other.table_type
         )
 
     def __hash__(self) -> int:
@@ -185,6 +196,7 @@ class CreateTableStatement(AbstractStatement):
                 self.if_not_exists,
                 tuple(self.column_list or []),
                 self.query,
+                self.table_type,
             )
         )
 
@@ -15,7 +15,13 @@
 
 from lark import Tree
 
-from evadb.catalog.catalog_type import ColumnType, NdArrayType, VectorStoreType
+from evadb.catalog.catalog_type import (
+    ColumnType,
+    NdArrayType,
+    ScalarIndexType,
+    TableType,
+    VectorStoreType,
+)
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.parser.create_index_statement import CreateIndexStatement
 from evadb.parser.create_statement import (
@@ -37,6 +43,7 @@ class CreateTable:
         if_not_exists = False
         create_definitions = []
         query = None
+        table_type = TableType.STRUCTURED_DATA
 
         for child in tree.children:
             if isinstance(child, Tree):
@@ -46,14 +53,26 @@ class CreateTable:
                     table_info = self.visit(child)
                 elif child.data == "create_definitions":
                     create_definitions = self.visit(child)
+                elif child.data == "table_storage_type":
+                    table_type = self.visit(child)
                 elif child.data == "simple_select":
                     query = self.visit(child)
 
         create_stmt = CreateTableStatement(
-            table_info, if_not_exists, create_definitions, query=query
+            table_info,
+            if_not_exists,
+            create_definitions,
+            query=query,
+            table_type=table_type,
         )
         return create_stmt
 
+    def table_storage_type(self, tree):
+        token = tree.children[1]
+        if str.upper(token) == "COLUMNAR":
+            return TableType.COLUMNAR_DATA
+        return TableType.STRUCTURED_DATA
+
     def create_definitions(self, tree):
         column_definitions = []
         for child in tree.children:
@@ -299,6 +318,10 @@ class CreateIndex:
             vector_store_type = VectorStoreType.PGVECTOR
         elif str.upper(token) == "CHROMADB":
             vector_store_type = VectorStoreType.CHROMADB
+        elif str.upper(token) == "BTREE":
+            vector_store_type = ScalarIndexType.BTREE
+        elif str.upper(token) == "HASH":
+            vector_store_type = ScalarIndexType.HASH
         return vector_store_type
 
 
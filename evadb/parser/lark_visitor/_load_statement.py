@@ -37,6 +37,8 @@ class Load:
             if isinstance(child, Tree):
                 if child.data == "uid_list":
                     column_list = self.visit(child)
+                elif child.data == "incremental":
+                    file_options["incremental"] = True
 
         stmt = LoadDataStatement(table, file_path, column_list, file_options)
         return stmt
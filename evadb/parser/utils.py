@@ -124,7 +124,10 @@ def parse_insert(table_name: str, columns: str, values: str, **kwargs):
 
 
 def parse_load(table_name: str, file_regex: str, format: str, **kwargs):
-    mock_query = f"LOAD {format.upper()} '{file_regex}' INTO {table_name};"
+    mock_query = f"LOAD {format.upper()} '{file_regex}' INTO {table_name}"
+    if kwargs.get("incremental", False):
+        mock_query += " INCREMENTAL"
+    mock_query += ";"
     stmt = Parser().parse(mock_query)[0]
     assert isinstance(stmt, LoadDataStatement), "Expected a load statement"
     return stmt
@@ -14,6 +14,7 @@
 # limitations under the License.
 from typing import List
 
+from evadb.catalog.catalog_type import TableType
 from evadb.parser.create_statement import ColumnDefinition
 from evadb.parser.table_ref import TableInfo
 from evadb.plan_nodes.abstract_plan import AbstractPlan
@@ -28,6 +29,9 @@ class CreateFromSelectPlan(AbstractPlan):
         table_info {TableInfo} -- table info for view to be created in storage
         col_list{List[ColumnDefinition]} -- column names in the view
         if_not_exists {bool} -- Whether to override if there is existing view
+        table_type {TableType} -- STRUCTURED_DATA or COLUMNAR_DATA
+        query {str} -- select query populating the table, identifies the
+            checkpoint of the query
     """
 
     def __init__(
@@ -35,11 +39,15 @@ class CreateFromSelectPlan(AbstractPlan):
         table_info: TableInfo,
         column_list: List[ColumnDefinition],
         if_not_exists: bool = False,
+        table_type: TableType = TableType.STRUCTURED_DATA,
+        query: str = None,
     ):
         super().__init__(PlanOprType.CREATE)
         self._table_info = table_info
         self._column_list = column_list
         self._if_not_exists = if_not_exists
+        self._table_type = table_type
+        self._query = query
 
     @property
     def table_info(self):
@@ -53,11 +61,25 @@ class CreateFromSelectPlan(AbstractPlan):
     def column_list(self):
         return self._column_list
 
+    @property
+    def table_type(self):
+        return self._table_type
+
+    @property
+    def query(self):
+        return self._query
+
     def __str__(self):
         return "CreateFromSelectPlan(table_info={}, \
             column_lists={}, \
-            if_not_exists={})".format(
-            self._table_info, self._column_list, self._if_not_exists
+            if_not_exists={}, \
+            table_type={}, \
+            query={})".format(
+            self._table_info,
+            self._column_list,
+            self._if_not_exists,
+            self._table_type,
+            self._query,
         )
 
     def __hash__(self) -> int:
@@ -67,5 +89,7 @@ class CreateFromSelectPlan(AbstractPlan):
                 self.table_info,
                 self.if_not_exists,
                 tuple(self.column_list),
+                self.table_type,
+                self.query,
             )
         )
@@ -12,9 +12,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List
+from typing import List, Union
 
-from evadb.catalog.catalog_type import VectorStoreType
+from evadb.catalog.catalog_type import ScalarIndexType, VectorStoreType
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.expression.function_expression import FunctionExpression
 from evadb.parser.create_statement import ColumnDefinition
@@ -30,7 +30,7 @@ class CreateIndexPlan(AbstractPlan):
         if_not_exists: bool,
         table_ref: TableRef,
         col_list: List[ColumnDefinition],
-        vector_store_type: VectorStoreType,
+        vector_store_type: Union[VectorStoreType, ScalarIndexType],
         project_expr_list: List[AbstractExpression],
         index_def: str,
     ):
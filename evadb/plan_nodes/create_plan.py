@@ -14,6 +14,7 @@
 # limitations under the License.
 from typing import List
 
+from evadb.catalog.catalog_type import TableType
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.parser.table_ref import TableInfo
 from evadb.plan_nodes.abstract_plan import AbstractPlan
@@ -28,6 +29,7 @@ class CreatePlan(AbstractPlan):
         video_ref {TableInfo} -- video ref for table to be created in storage
         column_list {List[ColumnCatalogEntry]} -- Columns to be added
         if_not_exists {bool} -- Whether to override if there is existing table
+        table_type {TableType} -- STRUCTURED_DATA or COLUMNAR_DATA
     """
 
     def __init__(
@@ -35,11 +37,13 @@ class CreatePlan(AbstractPlan):
         table_info: TableInfo,
         column_list: List[ColumnCatalogEntry],
         if_not_exists: bool = False,
+        table_type: TableType = TableType.STRUCTURED_DATA,
     ):
         super().__init__(PlanOprType.CREATE)
         self._table_info = table_info
         self._column_list = column_list
         self._if_not_exists = if_not_exists
+        self._table_type = table_type
 
     @property
     def table_info(self):
@@ -53,11 +57,16 @@ class CreatePlan(AbstractPlan):
     def column_list(self):
         return self._column_list
 
+    @property
+    def table_type(self):
+        return self._table_type
+
     def __str__(self):
         return "CreatePlan(table_ref={}, \
             column_list={}, \
-            if_not_exists={})".format(
-            self._table_info, self._column_list, self._if_not_exists
+            if_not_exists={}, \
+            table_type={})".format(
+            self._table_info, self._column_list, self._if_not_exists, self._table_type
         )
 
     def __hash__(self) -> int:
@@ -67,5 +76,6 @@ class CreatePlan(AbstractPlan):
                 self.table_info,
                 self.if_not_exists,
                 tuple(self.column_list),
+                self.table_type,
             )
         )
@@ -12,6 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import List, Tuple
+
 from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.parser.table_ref import TableRef
@@ -34,6 +36,10 @@ class StoragePlan(AbstractPlan):
         curr_shard (int): current curr_shard if data is sharded
         sampling_rate (int): uniform sampling rate
         sampling_type (str): special sampling type like IFRAMES
+        columns (List[str]): columns referenced by the query, None reads all
+        orderby_list (List): order by clause evaluated by the storage engine
+        resolution (Tuple[int, int]): (width, height) to decode the video frames
+            at, None decodes them at their native resolution
     """
 
     def __init__(
@@ -50,6 +56,9 @@ class StoragePlan(AbstractPlan):
         batch_mem_size: int = 30000000,
         sampling_type: str = None,
         chunk_params: dict = {},
+        columns: List[str] = None,
+        orderby_list: List = None,
+        resolution: Tuple[int, int] = None,
     ):
         super().__init__(PlanOprType.STORAGE_PLAN)
         self._table = table
@@ -64,6 +73,9 @@ class StoragePlan(AbstractPlan):
         self._sampling_rate = sampling_rate
         self._sampling_type = sampling_type
         self.chunk_params = chunk_params
+        self._columns = columns
+        self._orderby_list = orderby_list
+        self._resolution = resolution
 
     @property
     def table(self):
@@ -109,6 +121,18 @@ class StoragePlan(AbstractPlan):
     def sampling_type(self):
         return self._sampling_type
 
+    @property
+    def columns(self):
+        return self._columns
+
+    @property
+    def orderby_list(self):
+        return self._orderby_list
+
+    @property
+    def resolution(self):
+        return self._resolution
+
     def __str__(self):
         return "StoragePlan(video={}, \
             table_ref={},\
@@ -120,7 +144,10 @@ class StoragePlan(AbstractPlan):
             curr_shard={}, \
             predicate={}, \
             sampling_rate={}, \
-            sampling_type={})".format(
+            sampling_type={}, \
+            columns={}, \
+            orderby_list={}, \
+            resolution={})".format(
             self._table,
             self._table_ref,
             self._batch_mem_size,
@@ -132,6 +159,9 @@ class StoragePlan(AbstractPlan):
             self._predicate,
             self._sampling_rate,
             self._sampling_type,
+            self._columns,
+            self._orderby_list,
+            self._resolution,
         )
 
     def __hash__(self) -> int:
@@ -150,5 +180,8 @@ class StoragePlan(AbstractPlan):
                 self.sampling_rate,
                 self.sampling_type,
                 frozenset(self.chunk_params.items()),
+                tuple(self.columns or []),
+                tuple(self.orderby_list or []),
+                self.resolution,
             )
         )
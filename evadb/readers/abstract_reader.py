@@ -14,7 +14,7 @@
 # limitations under the License.
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
-from typing import Dict, Iterator
+from typing import Dict, Iterator, Union
 
 import pandas as pd
 
@@ -52,6 +52,13 @@ class AbstractReader(metaclass=ABCMeta):
         data_batch = []
         row_size = None
         for data in self._read():
+            if isinstance(data, pd.DataFrame):
+                # blocks of rows are already sized by the reader
+                if data_batch:
+                    yield Batch(pd.DataFrame(data_batch))
+                    data_batch = []
+                yield Batch(data)
+                continue
             if row_size is None:
                 row_size = 0
                 row_size = get_size(data)
@@ -63,8 +70,10 @@ class AbstractReader(metaclass=ABCMeta):
             yield Batch(pd.DataFrame(data_batch))
 
     @abstractmethod
-    def _read(self) -> Iterator[Dict]:
+    def _read(self) -> Iterator[Union[Dict, pd.DataFrame]]:
         """
         Every sub class implements it's own logic
         to read the file and yields an object iterator.
+        The reader either yields a dict per row, or a dataframe holding a block
+        of rows that is returned as one batch.
         """
@@ -12,7 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Iterator
+from typing import Iterator
 
 import numpy as np
 import pandas as pd
@@ -21,6 +21,25 @@ from evadb.catalog.sql_config import IDENTIFIER_COLUMN
 from evadb.readers.abstract_reader import AbstractReader
 from evadb.utils.logging_manager import logger
 
+# number of rows of the first chunk, used to size the other chunks
+CSV_SAMPLE_CHUNK_SIZE = 512
+
+
+def convert_csv_strings_to_ndarrays(column: pd.Series) -> list:
+    """
+    Convert a column of strings of comma separated values to numpy float
+    arrays. The whole column is parsed in one pass. If all the arrays have the
+    same length, they are views into one (N, length) array.
+    """
+    values = np.fromstring(",".join(column), dtype=np.float32, sep=",")
+    lengths = column.str.count(",").to_numpy() + 1
+    if len(values) != lengths.sum():
+        # empty or malformed cells, convert cell by cell
+        return [np.array(value.split(","), dtype=np.float32) for value in column]
+    if (lengths == lengths[0]).all():
+        return list(values.reshape(len(column), lengths[0]))
+    return np.split(values, np.cumsum(lengths)[:-1])
+
 
 class CSVReader(AbstractReader):
     def __init__(self, *args, column_list, **kwargs):
@@ -34,15 +53,7 @@ class CSVReader(AbstractReader):
         self._column_list = column_list
         super().__init__(*args, **kwargs)
 
-    def _read(self) -> Iterator[Dict]:
-        # TODO: What is a good location to put this code?
-        def convert_csv_string_to_ndarray(row_string):
-            """
-            Convert a string of comma separated values to a numpy
-            float array
-            """
-            return np.array([np.float32(val) for val in row_string.split(",")])
-
+    def _read(self) -> Iterator[pd.DataFrame]:
         logger.info("Reading CSV frames")
 
         # TODO: Need to add strong sanity checks on the columns.
@@ -54,17 +65,31 @@ class CSVReader(AbstractReader):
         ]
 
         col_map = {col.name: col for col in self._column_list}
-        for chunk in pd.read_csv(self.file_url, chunksize=512, usecols=col_list_names):
-            # apply the required conversions
-            for col in chunk.columns:
-                # TODO: Is there a better way to do this?
-                if (
-                    isinstance(chunk[col].iloc[0], str)
-                    and col_map[col].col_object.type.name == "NDARRAY"
-                ):
-                    # convert the string to a numpy array
-                    chunk[col] = chunk[col].apply(convert_csv_string_to_ndarray)
-
-            # yield the chunk
-            for chunk_index, chunk_row in chunk.iterrows():
-                yield chunk_row
+        # the chunks are yielded as blocks of rows, sized with the first chunk
+        # to fill a batch
+        chunk_size = None
+        csv_reader = pd.read_csv(self.file_url, iterator=True, usecols=col_list_names)
+        try:
+            while True:
+                try:
+                    chunk = csv_reader.get_chunk(chunk_size or CSV_SAMPLE_CHUNK_SIZE)
+                except StopIteration:
+                    break
+                if chunk.empty:
+                    break
+                if chunk_size is None:
+                    row_size = chunk.memory_usage(deep=True).sum() / len(chunk)
+                    chunk_size = max(1, int(self.batch_mem_size // row_size))
+                # apply the required conversions column-wise
+                for col in chunk.columns:
+                    if (
+                        isinstance(chunk[col].iloc[0], str)
+                        and col_map[col].col_object.type.name == "NDARRAY"
+                    ):
+                        # convert the strings to numpy arrays
+                        chunk[col] = convert_csv_strings_to_ndarrays(chunk[col])
+                # only the first chunk can hold more rows than a batch
+                for start in range(0, len(chunk), chunk_size):
+                    yield chunk.iloc[start : start + chunk_size].reset_index(drop=True)
+        finally:
+            csv_reader.close()
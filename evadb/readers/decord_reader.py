@@ -12,20 +12,51 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Iterator
+import math
+from typing import Dict, Iterator, List, Tuple, Union
 
 import numpy as np
+import pandas as pd
 
-from evadb.catalog.catalog_type import VideoColumnName
+from evadb.catalog.catalog_type import VideoColumnName, VideoMetadataColumnName
 from evadb.catalog.sql_config import ROW_NUM_COLUMN
 from evadb.constants import AUDIORATE, IFRAMES
 from evadb.expression.abstract_expression import AbstractExpression
-from evadb.expression.expression_utils import extract_range_list_from_predicate
+from evadb.expression.expression_utils import (
+    extract_range_list_from_column_values,
+    extract_range_list_from_predicate,
+)
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.readers.abstract_reader import AbstractReader
-from evadb.utils.generic_utils import try_to_import_decord
+from evadb.storage.frame_cache import FrameCache
+from evadb.utils.generic_utils import get_size, try_to_import_decord
 from evadb.utils.logging_manager import logger
 
 
+def get_video_index(file_url: str) -> Dict:
+    """Probe the video and return its index: the number of frames, the average
+    frame rate, the duration in seconds, the ids of the key frames and the start
+    time in seconds of every frame. No frame is decoded."""
+    try_to_import_decord()
+    import decord
+
+    reader = decord.VideoReader(file_url)
+    num_frames = len(reader)
+    # (start, end) time in seconds of every frame
+    timestamps = reader.get_frame_timestamp(np.arange(num_frames)).reshape(-1, 2)
+    return {
+        VideoMetadataColumnName.num_frames.name: num_frames,
+        VideoMetadataColumnName.fps.name: float(reader.get_avg_fps()),
+        VideoMetadataColumnName.duration.name: float(timestamps[-1, 1])
+        if num_frames
+        else 0.0,
+        VideoMetadataColumnName.key_indices.name: np.asarray(
+            reader.get_key_indices(), dtype=np.int64
+        ),
+        VideoMetadataColumnName.timestamps.name: timestamps[:, 0].astype(np.float64),
+    }
+
+
 class DecordReader(AbstractReader):
     def __init__(
         self,
@@ -35,42 +66,111 @@ class DecordReader(AbstractReader):
         sampling_type: str = None,
         read_audio: bool = False,
         read_video: bool = True,
+        resolution: Tuple[int, int] = None,
+        frame_cache: FrameCache = None,
+        video_index: Dict = None,
+        audio_chunk_duration: float = None,
+        audio_chunk_overlap: float = 0,
         **kwargs,
     ):
         """Read frames from the disk
 
         Args:
             predicate (AbstractExpression, optional): If only subset of frames
-            need to be read. The predicate should be only on single column and
-            can be converted to ranges. Defaults to None.
+            need to be read. The predicate should be a range predicate on the
+            frame id (id) and the timestamp of the frames (seconds). Predicates
+            on the timestamps are converted to ranges of frames with the
+            timestamps of the video. Defaults to None.
             sampling_rate (int, optional): Set if the caller wants one frame
             every `sampling_rate` number of frames. For example, if `sampling_rate = 10`, it returns every 10th frame. If both `predicate` and `sampling_rate` are specified, `sampling_rate` is given precedence.
             sampling_type (str, optional): Set as IFRAMES if caller want to sample on top on iframes only. e.g if the IFRAME frame numbers are [10,20,30,40,50] then 'SAMPLE IFRAMES 2' will return [10,30,50]
             read_audio (bool, optional): Whether to read audio stream from the video. Defaults to False
-            read_video (bool, optional): Whether to read video stream from the video. Defaults to True
+            read_video (bool, optional): Whether to read video stream from the video. If both streams are not read, only the frame ids and timestamps are returned, without decoding the frames. Defaults to True
+            resolution (Tuple[int, int], optional): (width, height) to decode the video frames at. Defaults to None, which decodes the frames at the native resolution of the video
+            frame_cache (FrameCache, optional): Cache of the decoded video frames. Segments of frames missing from the cache are decoded and added to it. Defaults to None
+            video_index (Dict, optional): Index of the video built at load time, see `get_video_index`. The frame count, key frames and timestamps are read from the index instead of the video file. If the video stream is not read either, the video file is not opened. Defaults to None
+            audio_chunk_duration (float, optional): If set, the audio stream is returned in segments of `audio_chunk_duration` seconds instead of one row per video frame. Every segment is returned in its own batch, with the segment number as id and its start time as seconds. Defaults to None
+            audio_chunk_overlap (float, optional): Number of seconds shared by consecutive audio segments. Defaults to 0
         """
         self._predicate = predicate
         self._sampling_rate = sampling_rate or 1
         self._sampling_type = sampling_type
         self._read_audio = read_audio
         self._read_video = read_video
+        self._frame_cache = frame_cache
+        self._video_index = video_index
+        self._audio_chunk_duration = audio_chunk_duration
+        self._audio_chunk_overlap = audio_chunk_overlap or 0
+        # decord decodes the frames at the native resolution of the video if
+        # the width and height are -1
+        self._width, self._height = resolution or (-1, -1)
         self._reader = None
         self._get_frame = None
+        # (height, width, 3) of the decoded frames, read lazily
+        self._frame_shape = None
         super().__init__(*args, **kwargs)
         self.initialize_reader()
 
-    def _read(self) -> Iterator[Dict]:
-        num_frames = int(len(self._reader))
+    def _read(self) -> Iterator[Union[Dict, pd.DataFrame]]:
+        if self._read_audio and self._audio_chunk_duration:
+            # one batch per segment, so that the functions start on the first
+            # segment without waiting for the rest of the audio
+            for chunk_id in self._get_audio_chunk_ids():
+                yield self.__get_audio_chunk(chunk_id)
+            return
+
+        if self._read_audio:
+            for frame_id in self._get_frame_ids():
+                yield self._get_frame(frame_id)
+            return
+
+        # decode the video frames in blocks that fill a batch. Without the
+        # video stream, only the frame ids and timestamps are read.
+        get_block = (
+            self.__get_video_frames if self._read_video else self.__get_video_metadata
+        )
+        frames_per_block = None
+        block = []
+        for frame_id in self._get_frame_ids():
+            if frames_per_block is None:
+                frames_per_block = self._get_frames_per_block(frame_id)
+            block.append(frame_id)
+            if len(block) == frames_per_block:
+                yield get_block(block)
+                block = []
+        if block:
+            yield get_block(block)
+
+    def _get_num_frames(self) -> int:
+        if self._video_index is not None:
+            return int(self._video_index[VideoMetadataColumnName.num_frames.name])
+        return len(self._reader)
+
+    def _get_key_indices(self) -> List[int]:
+        if self._video_index is not None:
+            return self._video_index[VideoMetadataColumnName.key_indices.name]
+        return self._reader.get_key_indices()
+
+    def _get_frame_timestamps(self, frame_ids: List[int]) -> np.ndarray:
+        """Return the start time in seconds of the frames"""
+        if self._video_index is not None:
+            timestamps = self._video_index[VideoMetadataColumnName.timestamps.name]
+            timestamps = timestamps[frame_ids]
+        else:
+            timestamps = self._reader.get_frame_timestamp(frame_ids)[:, 0]
+        # decord and older video indexes return float32 timestamps
+        return timestamps.astype(np.float64)
+
+    def _get_frame_ids(self) -> Iterator[int]:
+        num_frames = self._get_num_frames()
         if self._predicate:
-            range_list = extract_range_list_from_predicate(
-                self._predicate, 0, num_frames - 1
-            )
+            range_list = self._get_range_list(num_frames)
         else:
             range_list = [(0, num_frames - 1)]
         logger.debug("Reading frames")
 
         if self._sampling_type == IFRAMES:
-            iframes = self._reader.get_key_indices()
+            iframes = self._get_key_indices()
             idx = 0
             for begin, end in range_list:
                 while idx < len(iframes) and iframes[idx] < begin:
@@ -79,21 +179,90 @@ class DecordReader(AbstractReader):
                 while idx < len(iframes) and iframes[idx] <= end:
                     frame_id = iframes[idx]
                     idx += self._sampling_rate
-                    yield self._get_frame(frame_id)
+                    yield frame_id
 
         elif self._sampling_rate == 1 or self._read_audio:
             for begin, end in range_list:
-                frame_id = begin
-                while frame_id <= end:
-                    yield self._get_frame(frame_id)
-                    frame_id += 1
+                yield from range(begin, end + 1)
         else:
             for begin, end in range_list:
                 # align begin with sampling rate
                 if begin % self._sampling_rate:
                     begin += self._sampling_rate - (begin % self._sampling_rate)
-                for frame_id in range(begin, end + 1, self._sampling_rate):
-                    yield self._get_frame(frame_id)
+                yield from range(begin, end + 1, self._sampling_rate)
+
+    def _get_audio_chunk_ids(self) -> Iterator[int]:
+        num_chunks = self._get_num_audio_chunks()
+        if self._predicate:
+            range_list = self._get_range_list(
+                num_chunks, get_timestamps=self._get_audio_chunk_timestamps
+            )
+        else:
+            range_list = [(0, num_chunks - 1)]
+        for begin, end in range_list:
+            yield from range(begin, end + 1)
+
+    def _get_audio_chunk_bounds(self) -> Tuple[int, int]:
+        """Return the number of samples in a segment and between the starts of
+        consecutive segments"""
+        sample_rate = self._reader.sample_rate
+        chunk_size = max(1, round(self._audio_chunk_duration * sample_rate))
+        overlap = round(self._audio_chunk_overlap * sample_rate)
+        return chunk_size, max(1, chunk_size - overlap)
+
+    def _get_num_audio_chunks(self) -> int:
+        num_samples = self._reader.shape[1]
+        if num_samples == 0:
+            return 0
+        chunk_size, hop_size = self._get_audio_chunk_bounds()
+        # the last segment is shorter if the samples do not fill it
+        return 1 + max(0, math.ceil((num_samples - chunk_size) / hop_size))
+
+    def _get_audio_chunk_timestamps(self, chunk_ids: List[int]) -> np.ndarray:
+        """Return the start time in seconds of the audio segments"""
+        _, hop_size = self._get_audio_chunk_bounds()
+        return np.asarray(chunk_ids) * hop_size / self._reader.sample_rate
+
+    def _get_range_list(
+        self, num_frames: int, get_timestamps=None
+    ) -> List[Tuple[int, int]]:
+        columns = {
+            column.name for column in self._predicate.find_all(TupleValueExpression)
+        }
+        if VideoColumnName.seconds.name not in columns:
+            return extract_range_list_from_predicate(self._predicate, 0, num_frames - 1)
+        # the predicate is evaluated on the timestamps of all the frames, as
+        # returned in the seconds column, without decoding any frame
+        get_timestamps = get_timestamps or self._get_frame_timestamps
+        frame_ids = np.arange(num_frames)
+        column_values = {
+            VideoColumnName.id.name: frame_ids,
+            VideoColumnName.seconds.name: np.round(get_timestamps(frame_ids), 2),
+        }
+        return extract_range_list_from_column_values(self._predicate, column_values)
+
+    def _get_frames_per_block(self, frame_id: int) -> int:
+        # same number of rows as a batch built from per frame rows
+        row = self.__get_video_metadata([frame_id]).iloc[0].to_dict()
+        row_size = get_size(row)
+        if self._read_video:
+            if self._frame_cache is not None and self._sampling_type != IFRAMES:
+                # the frame is sized from its cached segment instead of being
+                # decoded again. The segment is needed by the first block anyway.
+                row_size += self.__get_cached_video_frames([frame_id])[0].nbytes
+            else:
+                # the frame is sized from the dimensions of the video, so that
+                # it is only decoded by the first block
+                row_size += self._get_frame_nbytes()
+        return max(1, math.ceil(self.batch_mem_size / row_size))
+
+    def _get_frame_nbytes(self) -> int:
+        """Return the size of a decoded frame, H x W x 3 bytes"""
+        if self._frame_shape is None:
+            # decord does not expose the dimensions of the video stream. The
+            # first frame is a key frame, decoding it does not seek.
+            self._frame_shape = self._reader[0].shape
+        return int(np.prod(self._frame_shape))
 
     def initialize_reader(self):
         try_to_import_decord()
@@ -106,24 +275,56 @@ class DecordReader(AbstractReader):
             sample_rate = 16000
             if self._sampling_type == AUDIORATE and self._sampling_rate != 1:
                 sample_rate = self._sampling_rate
+            assert (
+                not self._audio_chunk_duration
+                or self._audio_chunk_overlap < self._audio_chunk_duration
+            ), "Audio chunk overlap must be shorter than the chunk duration"
             try:
-                self._reader = decord.AVReader(
-                    self.file_url, mono=True, sample_rate=sample_rate
-                )
-                self._get_frame = self.__get_audio_frame
+                if self._audio_chunk_duration:
+                    # only the audio stream is opened, the video frames are
+                    # not needed to cut the segments
+                    self._reader = decord.AudioReader(
+                        self.file_url, mono=True, sample_rate=sample_rate
+                    )
+                else:
+                    self._reader = decord.AVReader(
+                        self.file_url, mono=True, sample_rate=sample_rate
+                    )
+                    self._get_frame = self.__get_audio_frame
             except decord._ffi.base.DECORDError as error_msg:
                 assert "Can't find audio stream" not in str(error_msg), error_msg
         else:
             assert (
                 self._sampling_type != AUDIORATE
             ), "Cannot use AUDIORATE with video streams"
-            self._reader = decord.VideoReader(self.file_url)
+            if not self._read_video and self._video_index is not None:
+                # the frame ids and timestamps are read from the index
+                return
+            self._reader = decord.VideoReader(
+                self.file_url, width=self._width, height=self._height
+            )
+            if (self._width, self._height) != (-1, -1) and len(self._reader) > 0:
+                try:
+                    self._frame_shape = self._reader[0].shape
+                except decord._ffi.base.DECORDError as error_msg:
+                    # decord fails to resize the frames of some codecs (eg.
+                    # MJPEG), decode them at their native resolution instead
+                    logger.warn(
+                        f"Failed to decode {self.file_url} at "
+                        f"{self._width}x{self._height}: {error_msg}"
+                    )
+                    self._width, self._height = -1, -1
+                    self._reader = decord.VideoReader(self.file_url)
             self._get_frame = self.__get_video_frame
+            if self._frame_cache is not None:
+                self._video_key = self._frame_cache.get_video_key(
+                    self.file_url, (self._width, self._height)
+                )
 
     def __get_video_frame(self, frame_id):
         frame_video = self._reader[frame_id]
         frame_video = frame_video.asnumpy()
-        timestamp = self._reader.get_frame_timestamp(frame_id)[0]
+        timestamp = self._get_frame_timestamps([frame_id])[0]
 
         return {
             VideoColumnName.id.name: frame_id,
@@ -132,6 +333,59 @@ class DecordReader(AbstractReader):
             VideoColumnName.seconds.name: round(timestamp, 2),
         }
 
+    def __get_video_frames(self, frame_ids: List[int]) -> pd.DataFrame:
+        if self._frame_cache is not None and self._sampling_type != IFRAMES:
+            frames = self.__get_cached_video_frames(frame_ids)
+        else:
+            # one decord call decodes the block into a contiguous (N, H, W, 3)
+            # array, the rows of the batch are views into it
+            frames = list(self._reader.get_batch(frame_ids).asnumpy())
+        timestamps = self._get_frame_timestamps(frame_ids)
+        return pd.DataFrame(
+            {
+                VideoColumnName.id.name: frame_ids,
+                ROW_NUM_COLUMN: frame_ids,
+                VideoColumnName.data.name: frames,
+                VideoColumnName.seconds.name: np.round(timestamps, 2),
+            }
+        )
+
+    def __get_cached_video_frames(self, frame_ids: List[int]) -> List[np.ndarray]:
+        # the rows are views into the memory-mapped segments of the cache
+        segment_size = self._frame_cache.segment_size
+        frames = []
+        segment_id, segment = None, None
+        for frame_id in frame_ids:
+            if frame_id // segment_size != segment_id:
+                segment_id = frame_id // segment_size
+                segment = self.__get_video_segment(segment_id)
+            frames.append(segment[frame_id - segment_id * segment_size])
+        return frames
+
+    def __get_video_segment(self, segment_id: int) -> np.ndarray:
+        segment = self._frame_cache.get_segment(self._video_key, segment_id)
+        if segment is None:
+            # decode the whole segment, so that later queries reading other
+            # frames of the segment hit the cache
+            start = segment_id * self._frame_cache.segment_size
+            end = min(start + self._frame_cache.segment_size, self._get_num_frames())
+            segment = self._reader.get_batch(list(range(start, end))).asnumpy()
+            self._frame_cache.put_segment(self._video_key, segment_id, segment)
+        return segment
+
+    def __get_video_metadata(self, frame_ids: List[int]) -> pd.DataFrame:
+        # the timestamps come from the index of the container, no frame is
+        # decoded
+        timestamps = self._get_frame_timestamps(frame_ids)
+        return pd.DataFrame(
+            {
+                VideoColumnName.id.name: frame_ids,
+                ROW_NUM_COLUMN: frame_ids,
+                VideoColumnName.data.name: [np.empty(0) for _ in frame_ids],
+                VideoColumnName.seconds.name: np.round(timestamps, 2),
+            }
+        )
+
     def __get_audio_frame(self, frame_id):
         frame_audio, _ = self._reader[frame_id]
         frame_audio = frame_audio.asnumpy()[0]
@@ -143,3 +397,21 @@ class DecordReader(AbstractReader):
             VideoColumnName.seconds.name: 0.0,
             VideoColumnName.audio.name: frame_audio,
         }
+
+    def __get_audio_chunk(self, chunk_id: int) -> pd.DataFrame:
+        chunk_size, hop_size = self._get_audio_chunk_bounds()
+        start = chunk_id * hop_size
+        end = min(start + chunk_size, self._reader.shape[1])
+        chunk_audio = self._reader[start:end].asnumpy()[0]
+
+        return pd.DataFrame(
+            {
+                VideoColumnName.id.name: [chunk_id],
+                ROW_NUM_COLUMN: [chunk_id],
+                VideoColumnName.data.name: [np.empty(0)],
+                VideoColumnName.seconds.name: [
+                    round(start / self._reader.sample_rate, 2)
+                ],
+                VideoColumnName.audio.name: [chunk_audio],
+            }
+        )
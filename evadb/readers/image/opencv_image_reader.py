@@ -14,19 +14,26 @@
 # limitations under the License.
 from typing import Dict, Iterator
 
+import numpy as np
+
 from evadb.readers.abstract_reader import AbstractReader
 from evadb.utils.generic_utils import try_to_import_cv2
 
 
+def read_image(file_url: str) -> np.ndarray:
+    """Decode the image file into an RGB array. cv2 releases the GIL while
+    decoding, so images can be decoded concurrently in threads."""
+    try_to_import_cv2()
+    import cv2
+
+    im_bgr = cv2.imread(str(file_url))
+    assert im_bgr is not None, f"Failed to read image file {file_url}"
+    return cv2.cvtColor(im_bgr, cv2.COLOR_BGR2RGB)
+
+
 class CVImageReader(AbstractReader):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
     def _read(self) -> Iterator[Dict]:
-        try_to_import_cv2()
-        import cv2
-
-        im_bgr = cv2.imread(str(self.file_url))
-        im_rgb = cv2.cvtColor(im_bgr, cv2.COLOR_BGR2RGB)
-        assert im_rgb is not None, f"Failed to read image file {self.file_url}"
-        yield {"data": im_rgb}
+        yield {"data": read_image(self.file_url)}
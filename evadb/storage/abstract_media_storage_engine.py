@@ -15,19 +15,40 @@
 import os
 import re
 import shutil
+from functools import partial
 from pathlib import Path
+from typing import Callable, Iterator, List
 
 import pandas as pd
 
+from evadb.catalog.catalog_type import MediaFingerprintColumnName
 from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN, ROW_NUM_MAGIC
 from evadb.database import EvaDBDatabase
 from evadb.models.storage.batch import Batch
 from evadb.parser.table_ref import TableInfo
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
 from evadb.storage.sqlite_storage_engine import SQLStorageEngine
+from evadb.storage.storage_utils import (
+    concat_batches,
+    get_sqlalchemy_column,
+    parallel_map,
+)
 from evadb.utils.logging_manager import logger
 
 
+def _read_small_media_file(
+    read_file: Callable[[str], Iterator[Batch]], max_file_size: int, media_file: tuple
+) -> tuple:
+    # runs in the worker processes of a scan. The larger files are left to the
+    # scan process, which streams their batches instead of buffering them.
+    file_path = media_file[2]
+    if os.path.getsize(file_path) > max_file_size:
+        return media_file, None
+    frames: List[pd.DataFrame] = [batch.frames for batch in read_file(file_path)]
+    return media_file, frames
+
+
 class AbstractMediaStorageEngine(AbstractStorageEngine):
     def __init__(self, db: EvaDBDatabase):
         super().__init__(db)
@@ -58,6 +79,78 @@ class AbstractMediaStorageEngine(AbstractStorageEngine):
         file_path = re.sub(r"[^a-zA-Z0-9 \.\n]", "_", file_path_str)
         return file_path
 
+    def _get_media_files(
+        self, table: TableCatalogEntry, metadata_columns: List[str] = ()
+    ) -> Iterator[tuple]:
+        """Yield the (row id, file url, path in the table directory, metadata)
+        of the files of the table, where metadata holds the `metadata_columns`
+        of the file in the metadata table"""
+        for media_files in self._rdb_handler.read(self._get_metadata_table(table)):
+            for _, media_file in media_files.iterrows():
+                file_name = media_file["file_url"]
+                system_file_name = self._xform_file_url_to_file_name(file_name)
+                yield (
+                    media_file[IDENTIFIER_COLUMN],
+                    str(file_name),
+                    str(Path(table.file_url) / system_file_name),
+                    {name: media_file[name] for name in metadata_columns},
+                )
+
+    def _to_table_batch(
+        self, table: TableCatalogEntry, row_id, file_name, frame: pd.DataFrame
+    ) -> Batch:
+        """Add the row id and the file url of the media file to the rows read
+        from it. The `_row_number` of a row combines the row id with the
+        position of the row in the file, the files read as a single row (eg.
+        images) are numbered by their row id. `row_id` and `file_name` may also
+        hold one value per row."""
+        batch = Batch(frame)
+        batch.frames[table.columns[0].name] = row_id
+        batch.frames[table.columns[1].name] = file_name
+        if ROW_NUM_COLUMN in batch.frames:
+            batch.frames[ROW_NUM_COLUMN] = (
+                row_id * ROW_NUM_MAGIC + batch.frames[ROW_NUM_COLUMN]
+            )
+        else:
+            batch.frames[ROW_NUM_COLUMN] = row_id
+        return batch
+
+    def _read_media_files(
+        self,
+        table: TableCatalogEntry,
+        read_file: Callable[[str], Iterator[Batch]],
+        batch_mem_size: int,
+        num_workers: int,
+    ) -> Iterator[Batch]:
+        """Read the files of the table with `read_file`, which returns the
+        batches of a file, and return them in batches of about `batch_mem_size`
+        bytes. The batches of small files are merged into one batch.
+
+        With more than one worker, the files of at most `batch_mem_size` bytes
+        are parsed in a pool of processes, so `read_file` must be picklable.
+        The larger files are streamed from the scan process, like all the files
+        with a single worker, so that a whole file is never buffered and a scan
+        closed early (eg. by a LIMIT) stops in the middle of a file.
+        """
+        media_files = self._get_media_files(table)
+        if num_workers > 1:
+            results = parallel_map(
+                partial(_read_small_media_file, read_file, batch_mem_size),
+                media_files,
+                num_workers=num_workers,
+            )
+        else:
+            results = ((media_file, None) for media_file in media_files)
+
+        def read_batches() -> Iterator[Batch]:
+            for (row_id, file_name, file_path, _), frames in results:
+                if frames is None:
+                    frames = (batch.frames for batch in read_file(file_path))
+                for frame in frames:
+                    yield self._to_table_batch(table, row_id, file_name, frame)
+
+        yield from concat_batches(read_batches(), batch_mem_size)
+
     def create(self, table: TableCatalogEntry, if_not_exists=True):
         """
         Create the directory to store the images.
@@ -95,14 +188,17 @@ class AbstractMediaStorageEngine(AbstractStorageEngine):
     def delete(self, table: TableCatalogEntry, rows: Batch):
         try:
             media_metadata_table = self._get_metadata_table(table)
+            file_url_column = get_sqlalchemy_column(
+                self._rdb_handler._try_loading_table_via_reflection(
+                    media_metadata_table.name
+                ),
+                media_metadata_table.identifier_column,
+            )
             for media_file_path in rows.file_paths():
                 dst_file_name = self._xform_file_url_to_file_name(Path(media_file_path))
                 image_file = Path(table.file_url) / dst_file_name
                 self._rdb_handler.delete(
-                    media_metadata_table,
-                    where_clause={
-                        media_metadata_table.identifier_column: str(media_file_path)
-                    },
+                    media_metadata_table, file_url_column == str(media_file_path)
                 )
                 image_file.unlink()
         except Exception as e:
@@ -126,11 +222,15 @@ class AbstractMediaStorageEngine(AbstractStorageEngine):
                 src_path = Path.cwd() / media_file
                 os.symlink(src_path, dst_path)
                 copied_files.append(dst_path)
+            metadata_table = self._get_metadata_table(table)
+            metadata = pd.DataFrame({"file_url": list(rows.file_paths())})
+            # persist the other columns of the metadata table found in the
+            # rows, eg. the index of the videos
+            for column in metadata_table.columns:
+                if column.name in rows.frames.columns:
+                    metadata[column.name] = rows.frames[column.name].to_numpy()
             # assuming sql write is an atomic operation
-            self._rdb_handler.write(
-                self._get_metadata_table(table),
-                Batch(pd.DataFrame({"file_url": list(rows.file_paths())})),
-            )
+            self._rdb_handler.write(metadata_table, Batch(metadata))
 
         except Exception as e:
             # delete the copied_files
@@ -142,6 +242,22 @@ class AbstractMediaStorageEngine(AbstractStorageEngine):
         else:
             return True
 
+    def get_loaded_files(self, table: TableCatalogEntry) -> pd.DataFrame:
+        """Return the row id, file url and fingerprint of the files loaded into
+        the table. The fingerprint is None for the files loaded before the
+        fingerprints were recorded."""
+        metadata_table = self._get_metadata_table(table)
+        columns = [IDENTIFIER_COLUMN, "file_url"]
+        columns += list(MediaFingerprintColumnName.__members__)
+        loaded_files = pd.DataFrame(columns=columns)
+        batches = [batch.frames for batch in self._rdb_handler.read(metadata_table)]
+        if batches:
+            loaded_files = pd.concat(batches, ignore_index=True)
+            for name in columns:
+                if name not in loaded_files.columns:
+                    loaded_files[name] = None
+        return loaded_files[columns]
+
     def rename(self, old_table: TableCatalogEntry, new_name: TableInfo):
         try:
             self.db.catalog().rename_table_catalog_entry(old_table, new_name)
@@ -0,0 +1,306 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Iterator, List
+
+import pandas as pd
+
+from evadb.catalog.catalog_type import ColumnType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
+from evadb.constants import COLUMNAR_ROW_GROUP_SIZE
+from evadb.database import EvaDBDatabase
+from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage.batch import Batch
+from evadb.parser.table_ref import TableInfo
+from evadb.storage.abstract_storage_engine import AbstractStorageEngine
+from evadb.storage.ndarray_codec import NdArrayCodec
+from evadb.storage.storage_utils import SQL_COMPARISON_OPERATORS
+from evadb.utils.generic_utils import PickleSerializer, try_to_import_pyarrow
+from evadb.utils.logging_manager import logger
+
+# Every write is appended as a new file named after the range of row ids it
+# holds, eg. part-00000000000000000001-00000000000000000100.parquet
+_PART_FILE_PATTERN = re.compile(r"^part-(\d+)-(\d+)\.parquet$")
+
+
+def _get_arrow_type(column: ColumnCatalogEntry):
+    import pyarrow as pa
+
+    if column.type == ColumnType.BOOLEAN:
+        return pa.bool_()
+    elif column.type == ColumnType.INTEGER:
+        return pa.int64()
+    elif column.type == ColumnType.FLOAT:
+        return pa.float64()
+    elif column.type == ColumnType.TEXT:
+        return pa.string()
+    # NDARRAY and ANY cells are stored as binary blobs
+    return pa.binary()
+
+
+def predicate_to_arrow_filter_expression(predicate: AbstractExpression):
+    """Convert a storage pushdown predicate (see
+    `extract_pushdown_predicate_for_storage`) into a pyarrow dataset expression.
+    The dataset uses the row group statistics of the expression to skip row
+    groups that cannot match."""
+    import pyarrow.dataset as ds
+
+    if isinstance(predicate, TupleValueExpression):
+        return ds.field(predicate.name)
+    elif isinstance(predicate, ConstantValueExpression):
+        return ds.scalar(predicate.value)
+    elif isinstance(predicate, LogicalExpression):
+        left = predicate_to_arrow_filter_expression(predicate.children[0])
+        if predicate.etype == ExpressionType.LOGICAL_NOT:
+            return ~left
+        right = predicate_to_arrow_filter_expression(predicate.children[1])
+        if predicate.etype == ExpressionType.LOGICAL_AND:
+            return left & right
+        elif predicate.etype == ExpressionType.LOGICAL_OR:
+            return left | right
+    elif predicate.etype in SQL_COMPARISON_OPERATORS:
+        left = predicate_to_arrow_filter_expression(predicate.children[0])
+        right = predicate_to_arrow_filter_expression(predicate.children[1])
+        return SQL_COMPARISON_OPERATORS[predicate.etype](left, right)
+
+    raise ValueError(f"Predicate type {predicate.etype} not supported in storage")
+
+
+class ColumnarStorageEngine(AbstractStorageEngine):
+    """Storage engine for structured tables created with `STORAGE COLUMNAR`.
+
+    The table is a directory of parquet files, one per write, split into row
+    groups of `columnar_row_group_size` rows. Reads only decode the requested
+    columns and skip the row groups whose statistics do not match the pushed
+    down predicate. NDARRAY columns are stored as binary blobs encoded with
+    `NdArrayCodec`.
+    """
+
+    def __init__(self, db: EvaDBDatabase):
+        super().__init__(db)
+        try_to_import_pyarrow()
+        self._ndarray_compression = db.config.get_value(
+            "storage", "ndarray_compression"
+        )
+        self._row_group_size = (
+            db.config.get_value("storage", "columnar_row_group_size")
+            or COLUMNAR_ROW_GROUP_SIZE
+        )
+
+    def _get_ndarray_codec(self, column: ColumnCatalogEntry) -> NdArrayCodec:
+        return NdArrayCodec.for_column(column, self._ndarray_compression)
+
+    def _get_data_columns(
+        self, table: TableCatalogEntry, columns: List[str] = None
+    ) -> List[ColumnCatalogEntry]:
+        return [
+            col
+            for col in table.columns
+            if col.name != ROW_NUM_COLUMN
+            and (
+                columns is None or col.name in columns or col.name == IDENTIFIER_COLUMN
+            )
+        ]
+
+    def _get_arrow_schema(self, columns: List[ColumnCatalogEntry]):
+        import pyarrow as pa
+
+        return pa.schema([(col.name, _get_arrow_type(col)) for col in columns])
+
+    def _get_part_files(self, table: TableCatalogEntry) -> List[tuple]:
+        """Return the (first row id, last row id, path) of the part files of the
+        table, ordered by row id."""
+        part_files = []
+        for file_name in os.listdir(table.file_url):
+            match = _PART_FILE_PATTERN.match(file_name)
+            if match:
+                part_files.append(
+                    (
+                        int(match.group(1)),
+                        int(match.group(2)),
+                        str(Path(table.file_url) / file_name),
+                    )
+                )
+        return sorted(part_files)
+
+    def _column_to_arrow_array(self, values: pd.Series, column: ColumnCatalogEntry):
+        import pyarrow as pa
+
+        arrow_type = _get_arrow_type(column)
+        if column.type in [ColumnType.NDARRAY, ColumnType.ANY]:
+            codec = self._get_ndarray_codec(column)
+            if codec is not None:
+                return pa.array([codec.encode(value) for value in values], arrow_type)
+            return pa.array(
+                [PickleSerializer.serialize(value) for value in values], arrow_type
+            )
+        # pyarrow converts numpy backed columns without a per value copy
+        return pa.array(values, arrow_type, from_pandas=True)
+
+    def create(self, table: TableCatalogEntry, **kwargs):
+        dir_path = Path(table.file_url)
+        try:
+            dir_path.mkdir(parents=True)
+        except FileExistsError:
+            error = "Failed to load the table {} as directory \
+                        already exists: {}".format(
+                table.name, dir_path
+            )
+            logger.error(error)
+            raise FileExistsError(error)
+        return True
+
+    def drop(self, table: TableCatalogEntry):
+        try:
+            shutil.rmtree(str(table.file_url))
+        except Exception as e:
+            err_msg = f"Failed to drop the table {table.name} with Exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def write(self, table: TableCatalogEntry, rows: Batch):
+        """
+        Append the rows to the table as a new parquet file.
+
+        Arguments:
+            table: table metadata object to write into
+            rows : batch to be persisted in the storage.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        try:
+            if len(rows) == 0:
+                return
+            part_files = self._get_part_files(table)
+            first_row_id = part_files[-1][1] + 1 if part_files else 1
+            last_row_id = first_row_id + len(rows) - 1
+
+            columns = self._get_data_columns(table)
+            arrays = []
+            for col in columns:
+                if col.name == IDENTIFIER_COLUMN:
+                    arrays.append(pa.array(range(first_row_id, last_row_id + 1)))
+                elif col.name in rows.frames.columns:
+                    arrays.append(
+                        self._column_to_arrow_array(rows.frames[col.name], col)
+                    )
+                else:
+                    arrays.append(pa.nulls(len(rows), _get_arrow_type(col)))
+            arrow_table = pa.Table.from_arrays(
+                arrays, schema=self._get_arrow_schema(columns)
+            )
+
+            file_name = f"part-{first_row_id:020d}-{last_row_id:020d}.parquet"
+            file_path = Path(table.file_url) / file_name
+            # write to a temporary file first, so that a failed write never
+            # leaves a partial file behind
+            tmp_file_path = Path(table.file_url) / f".{file_name}.tmp"
+            pq.write_table(
+                arrow_table, str(tmp_file_path), row_group_size=self._row_group_size
+            )
+            os.replace(tmp_file_path, file_path)
+        except Exception as e:
+            err_msg = f"Failed to update the table {table.name} with exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def read(
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        predicate: AbstractExpression = None,
+        columns: List[str] = None,
+    ) -> Iterator[Batch]:
+        """
+        Reads the table and return a batch iterator for the tuples.
+
+        Argument:
+            table: table metadata object of the table to read
+            batch_mem_size (int): memory size of the batch read from storage
+            predicate (AbstractExpression): predicate evaluated by the storage,
+                see `extract_pushdown_predicate_for_storage`
+            columns (List[str]): columns to read, None reads all the columns.
+                The row id column is always read.
+        Return:
+            Iterator of Batch read.
+        """
+        import pyarrow.dataset as ds
+
+        try:
+            part_files = [path for _, _, path in self._get_part_files(table)]
+            if not part_files:
+                return
+            table_columns = self._get_data_columns(table, columns)
+            dataset = ds.dataset(
+                part_files,
+                schema=self._get_arrow_schema(self._get_data_columns(table)),
+                format="parquet",
+            )
+            arrow_filter = None
+            if predicate is not None:
+                arrow_filter = predicate_to_arrow_filter_expression(predicate)
+
+            for record_batch in dataset.to_batches(
+                columns=[col.name for col in table_columns],
+                filter=arrow_filter,
+                batch_size=self._get_rows_per_batch(part_files[0], batch_mem_size),
+            ):
+                if record_batch.num_rows == 0:
+                    continue
+                yield self._record_batch_to_batch(record_batch, table_columns)
+        except Exception as e:
+            err_msg = f"Failed to read the table {table.name} with exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def _get_rows_per_batch(self, part_file: str, batch_mem_size: int) -> int:
+        import pyarrow.parquet as pq
+
+        # estimate the row size from the uncompressed size of the first row group
+        metadata = pq.ParquetFile(part_file).metadata
+        if metadata.num_row_groups == 0 or metadata.num_rows == 0:
+            return self._row_group_size
+        row_group = metadata.row_group(0)
+        row_size = max(1, row_group.total_byte_size // max(1, row_group.num_rows))
+        return max(1, batch_mem_size // row_size)
+
+    def _record_batch_to_batch(
+        self, record_batch, columns: List[ColumnCatalogEntry]
+    ) -> Batch:
+        # split_blocks avoids consolidating the columns into a single block, so
+        # that numeric columns without nulls are not copied
+        frame = record_batch.to_pandas(split_blocks=True)
+        for col in columns:
+            if col.type in [ColumnType.NDARRAY, ColumnType.ANY]:
+                # The codec also reads cells that were pickled
+                codec = self._get_ndarray_codec(col) or NdArrayCodec()
+                frame[col.name] = codec.decode_column(frame[col.name].tolist())
+        frame[ROW_NUM_COLUMN] = frame[IDENTIFIER_COLUMN]
+        return Batch(frame)
+
+    def delete(self, table: TableCatalogEntry, where_clause):
+        raise Exception("Delete not supported for columnar data table")
+
+    def rename(self, old_table: TableCatalogEntry, new_name: TableInfo):
+        raise Exception("Rename not supported for columnar data table")
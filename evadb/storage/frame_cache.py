@@ -0,0 +1,120 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+from evadb.utils.logging_manager import logger
+
+
+class FrameCache:
+    """On-disk cache of decoded video frames.
+
+    The frames of a video are cached in segments of `segment_size` consecutive
+    frames. Every segment is a `.npy` file of shape (N, H, W, 3), stored in a
+    directory keyed by the video file (path, size and modification time) and
+    the decoded resolution. Hits are memory-mapped copy-on-write, so the frames
+    are served without a copy and can still be modified by the caller.
+
+    The total size of the segments is bounded by `max_size` bytes. When the
+    budget is exceeded, the least recently used segments are evicted; the
+    access time is tracked with the modification time of the segment files.
+
+    Arguments:
+        cache_dir (str): directory of the cache
+        max_size (int): size budget of the cache in bytes
+        segment_size (int): number of frames in every segment
+    """
+
+    def __init__(self, cache_dir: str, max_size: int, segment_size: int):
+        self._cache_dir = Path(cache_dir)
+        self._max_size = max_size
+        self._segment_size = segment_size
+        self._lock = threading.Lock()
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def segment_size(self) -> int:
+        return self._segment_size
+
+    def get_video_key(self, video_file: str, resolution: Tuple[int, int]) -> str:
+        """Return the key of the decoded frames of the video. The key changes if
+        the video file is replaced."""
+        stat = os.stat(video_file)
+        key = (
+            f"{os.path.realpath(video_file)}:{stat.st_size}:{stat.st_mtime_ns}:"
+            f"{resolution[0]}x{resolution[1]}"
+        )
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _get_segment_path(self, video_key: str, segment_id: int) -> Path:
+        start = segment_id * self._segment_size
+        end = start + self._segment_size - 1
+        return self._cache_dir / video_key / f"{start:010d}-{end:010d}.npy"
+
+    def get_segment(self, video_key: str, segment_id: int) -> np.ndarray:
+        """Return the memory-mapped frames of the segment, or None on a miss"""
+        segment_path = self._get_segment_path(video_key, segment_id)
+        try:
+            frames = np.load(segment_path, mmap_mode="c")
+            os.utime(segment_path)
+            return frames
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+
+    def put_segment(self, video_key: str, segment_id: int, frames: np.ndarray):
+        if frames.nbytes > self._max_size:
+            return
+        segment_path = self._get_segment_path(video_key, segment_id)
+        try:
+            segment_path.parent.mkdir(parents=True, exist_ok=True)
+            # concurrent readers never see a partially written segment
+            tmp_path = segment_path.with_name(
+                f".{segment_path.name}.{threading.get_ident()}.tmp"
+            )
+            with open(tmp_path, "wb") as f:
+                np.save(f, frames)
+            os.replace(tmp_path, segment_path)
+        except OSError as e:
+            logger.warn(f"Failed to cache the frames {segment_path}: {str(e)}")
+            return
+        self._evict()
+
+    def _evict(self):
+        with self._lock:
+            segments = []
+            total_size = 0
+            for segment_path in self._cache_dir.glob("*/*.npy"):
+                try:
+                    stat = segment_path.stat()
+                except FileNotFoundError:
+                    continue
+                segments.append((stat.st_mtime_ns, stat.st_size, segment_path))
+                total_size += stat.st_size
+
+            for _, size, segment_path in sorted(segments):
+                if total_size <= self._max_size:
+                    break
+                segment_path.unlink(missing_ok=True)
+                total_size -= size
+                try:
+                    # remove the directories of videos without segments
+                    segment_path.parent.rmdir()
+                except OSError:
+                    pass
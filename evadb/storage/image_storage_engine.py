@@ -12,30 +12,79 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from pathlib import Path
-from typing import Iterator
+import itertools
+import math
+from functools import partial
+from typing import Iterator, List
 
+import numpy as np
+import pandas as pd
+
+from evadb.catalog.catalog_type import ImageColumnName
 from evadb.catalog.models.table_catalog import TableCatalogEntry
-from evadb.catalog.sql_config import ROW_NUM_COLUMN
+from evadb.constants import IMAGE_SCAN_WORKERS
 from evadb.database import EvaDBDatabase
 from evadb.models.storage.batch import Batch
-from evadb.readers.image.opencv_image_reader import CVImageReader
+from evadb.readers.image.opencv_image_reader import read_image
 from evadb.storage.abstract_media_storage_engine import AbstractMediaStorageEngine
+from evadb.storage.storage_utils import parallel_map
 
 
 class ImageStorageEngine(AbstractMediaStorageEngine):
     def __init__(self, db: EvaDBDatabase):
         super().__init__(db)
+        # images decoded concurrently by a scan
+        self._scan_workers = (
+            db.config.get_value("storage", "image_scan_workers") or IMAGE_SCAN_WORKERS
+        )
+
+    def read(
+        self, table: TableCatalogEntry, batch_mem_size: int = 30000000
+    ) -> Iterator[Batch]:
+        """
+        Decode the images of the table in a thread pool and return them in
+        batches of about `batch_mem_size` bytes. The images of the next batch
+        are decoded while the current batch is processed.
+        """
+        image_files = self._get_media_files(table)
+        first_image_file = next(image_files, None)
+        if first_image_file is None:
+            return
+        first_row = self._read_image_file(table, first_image_file)
+        # the batches are sized with the first image
+        rows_per_batch = max(1, batch_mem_size // first_row[2].nbytes)
+        # opencv releases the GIL while decoding, so the images are decoded in
+        # threads. The images of the current and the next batch are in flight.
+        image_rows = parallel_map(
+            partial(self._read_image_file, table),
+            image_files,
+            num_workers=self._scan_workers,
+            prefetch=math.ceil(2 * rows_per_batch / self._scan_workers),
+            use_threads=True,
+        )
+        rows = []
+        for row in itertools.chain([first_row], image_rows):
+            rows.append(row)
+            if len(rows) >= rows_per_batch:
+                yield self._rows_to_batch(table, rows)
+                rows = []
+        if rows:
+            yield self._rows_to_batch(table, rows)
+
+    def _read_image_file(self, table: TableCatalogEntry, image_file: tuple) -> tuple:
+        row_id, file_name, file_path, _ = image_file
+        return row_id, file_name, read_image(file_path)
 
-    def read(self, table: TableCatalogEntry) -> Iterator[Batch]:
-        for image_files in self._rdb_handler.read(self._get_metadata_table(table)):
-            for _, (row_id, file_name, _) in image_files.iterrows():
-                system_file_name = self._xform_file_url_to_file_name(file_name)
-                image_file = Path(table.file_url) / system_file_name
-                # setting batch_mem_size = 1, we need fix it
-                reader = CVImageReader(str(image_file), batch_mem_size=1)
-                for batch in reader.read():
-                    batch.frames[table.columns[0].name] = row_id
-                    batch.frames[table.columns[1].name] = str(file_name)
-                    batch.frames[ROW_NUM_COLUMN] = batch.frames[table.columns[0].name]
-                    yield batch
+    def _rows_to_batch(self, table: TableCatalogEntry, rows: List[tuple]) -> Batch:
+        row_ids, file_names, images = zip(*rows)
+        images = list(images)
+        if len({image.shape for image in images}) == 1:
+            # images of the same shape are stacked into one contiguous array,
+            # the rows of the batch are views into it
+            images = list(np.stack(images))
+        return self._to_table_batch(
+            table,
+            np.array(row_ids),
+            list(file_names),
+            pd.DataFrame({ImageColumnName.data.name: images}),
+        )
@@ -12,11 +12,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from threading import RLock
 from typing import Iterator, List
 
-import numpy as np
 import pandas as pd
-from sqlalchemy import Column, MetaData, Table, create_engine
+from sqlalchemy import Column, MetaData, Table, select
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -25,12 +25,44 @@ from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.catalog.models.utils import ColumnCatalogEntry
 from evadb.catalog.schema_utils import SchemaUtils
 from evadb.database import EvaDBDatabase
+from evadb.expression.abstract_expression import AbstractExpression
 from evadb.models.storage.batch import Batch
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
-from evadb.third_party.databases.interface import get_database_handler
+from evadb.storage.storage_utils import (
+    batch_to_sql_rows,
+    fetch_sql_rows_in_batches,
+    get_sqlalchemy_column,
+    orderby_list_to_sqlalchemy_clauses,
+    predicate_to_sqlalchemy_filter_clause,
+    rows_to_batches,
+)
+from evadb.third_party.databases.interface import (
+    get_database_handler,
+    get_sqlalchemy_engine,
+)
 from evadb.utils.generic_utils import PickleSerializer
 from evadb.utils.logging_manager import logger
 
+# Reflected tables are cached per data source, so that repeated writes do not
+# pay for table reflection every time.
+_reflected_tables = {}
+_cache_lock = RLock()
+
+
+def _get_reflected_table(uri: str, table_name: str) -> Table:
+    key = (uri, table_name)
+    with _cache_lock:
+        if key not in _reflected_tables:
+            _reflected_tables[key] = Table(
+                table_name, MetaData(), autoload_with=get_sqlalchemy_engine(uri)
+            )
+        return _reflected_tables[key]
+
+
+def _invalidate_reflected_table(uri: str, table_name: str):
+    with _cache_lock:
+        _reflected_tables.pop((uri, table_name), None)
+
 
 # Define a function to create a table
 def create_table(uri: str, table_name: str, columns: dict):
@@ -58,8 +90,7 @@ def create_table(uri: str, table_name: str, columns: dict):
     # https://sparrigan.github.io/sql/sqla/2016/01/03/dynamic-tables.html
     _ = type(f"__placeholder_class_name__{table_name}", (Base,), attr_dict)()
 
-    # Create a database engine (SQLite in this example)
-    engine = create_engine(uri)
+    engine = get_sqlalchemy_engine(uri)
 
     # Create a session
     Session = sessionmaker(bind=engine)
@@ -72,31 +103,21 @@ def create_table(uri: str, table_name: str, columns: dict):
     session.close()
 
 
-def _dict_to_sql_row(dict_row: dict, columns: List[ColumnCatalogEntry]):
-    # Serialize numpy data
-    for col in columns:
+def _sql_rows_to_batch(sql_rows: list, columns: List[ColumnCatalogEntry]) -> Batch:
+    # Build the batch column-wise; the rows are in the order of the columns
+    data = {}
+    for col, values in zip(columns, zip(*sql_rows)):
         if col.type == ColumnType.NDARRAY:
-            dict_row[col.name] = PickleSerializer.serialize(dict_row[col.name])
-        elif isinstance(dict_row[col.name], (np.generic,)):
-            # Sqlalchemy does not consume numpy generic data types
-            # convert numpy datatype to python generic datatype using tolist()
-            # eg. np.int64 -> int
-            # https://stackoverflow.com/a/53067954
-            dict_row[col.name] = dict_row[col.name].tolist()
-    return dict_row
-
-
-def _deserialize_sql_row(sql_row: tuple, columns: List[ColumnCatalogEntry]):
-    # Deserialize numpy data
-
-    dict_row = {}
-    for idx, col in enumerate(columns):
-        # hack, we skip deserializing if sql_row[col.name] is not of type bytes
-        if col.type == ColumnType.NDARRAY and isinstance(sql_row[col.name], bytes):
-            dict_row[col.name] = PickleSerializer.deserialize(sql_row[idx])
+            # hack, we skip deserializing if the value is not of type bytes
+            data[col.name] = [
+                PickleSerializer.deserialize(value)
+                if isinstance(value, bytes)
+                else value
+                for value in values
+            ]
         else:
-            dict_row[col.name] = sql_row[idx]
-    return dict_row
+            data[col.name] = list(values)
+    return Batch(pd.DataFrame(data))
 
 
 class NativeStorageEngine(AbstractStorageEngine):
@@ -121,6 +142,7 @@ class NativeStorageEngine(AbstractStorageEngine):
                 uri = handler.get_sqlalchmey_uri()
             sqlalchemy_schema = SchemaUtils.xform_to_sqlalchemy_schema(table.columns)
             create_table(uri, table.name, sqlalchemy_schema)
+            _invalidate_reflected_table(uri, table.name)
         except Exception as e:
             err_msg = f"Failed to create the table {table.name} in data source {table.database_name} with exception {str(e)}"
             logger.exception(err_msg)
@@ -134,24 +156,14 @@ class NativeStorageEngine(AbstractStorageEngine):
             ) as handler:
                 uri = handler.get_sqlalchmey_uri()
 
-            # Create a metadata object
-            engine = create_engine(uri)
-            metadata = MetaData()
-
             # Retrieve the SQLAlchemy table object for the existing table
-            table_to_update = Table(table.name, metadata, autoload_with=engine)
-            columns = rows.frames.keys()
-            data = []
-            # Todo: validate the data type before inserting into the table
-            for record in rows.frames.values:
-                row_data = {col: record[idx] for idx, col in enumerate(columns)}
-                data.append(_dict_to_sql_row(row_data, table.columns))
+            engine = get_sqlalchemy_engine(uri)
+            table_to_update = _get_reflected_table(uri, table.name)
 
-            Session = sessionmaker(bind=engine)
-            session = Session()
-            session.execute(table_to_update.insert(), data)
-            session.commit()
-            session.close()
+            # Todo: validate the data type before inserting into the table
+            with engine.begin() as connection:
+                for data in batch_to_sql_rows(rows, table.columns):
+                    connection.execute(table_to_update.insert(), data)
 
         except Exception as e:
             err_msg = f"Failed to write to the table {table.name} in data source {table.database_name} with exception {str(e)}"
@@ -159,39 +171,84 @@ class NativeStorageEngine(AbstractStorageEngine):
             raise Exception(err_msg)
 
     def read(
-        self, table: TableCatalogEntry, batch_mem_size: int = 30000000
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        predicate: AbstractExpression = None,
+        columns: List[str] = None,
+        orderby_list: List = None,
+        limit: int = None,
     ) -> Iterator[Batch]:
+        """
+        Reads the table from the data source.
+
+        For sqlalchemy compatible data sources, the predicate, projection, order
+        by and limit pushed down by the optimizer are compiled into a single
+        SELECT that runs in the data source, and the rows are streamed back in
+        batches of batch_mem_size.
+
+        Argument:
+            table: table metadata object of the table to read
+            batch_mem_size (int): memory size of the batch read from storage
+            predicate (AbstractExpression): predicate evaluated by the data source
+            columns (List[str]): columns to read, None reads all the columns
+            orderby_list (List): order by clause evaluated by the data source
+            limit (int): maximum number of rows to read
+        Return:
+            Iterator of Batch read.
+        """
         try:
             db_catalog_entry = self._get_database_catalog_entry(table.database_name)
             with get_database_handler(
                 db_catalog_entry.engine, **db_catalog_entry.params
             ) as handler:
-                handler_response = handler.select(table.name)
-                # we prefer the generator/iterator when available
-                result = []
-                if handler_response.data_generator:
-                    result = handler_response.data_generator
-                elif handler_response.data:
-                    result = handler_response.data
-
-                if handler.is_sqlalchmey_compatible():
-                    # For sql data source, we can deserialize sql rows into numpy array
-                    cols = result[0]._fields
-                    index_dict = {
-                        element.lower(): index for index, element in enumerate(cols)
-                    }
-                    try:
-                        ordered_columns = sorted(
-                            table.columns, key=lambda x: index_dict[x.name.lower()]
-                        )
-                    except KeyError as e:
-                        raise Exception(f"Column mismatch with error {e}")
-                    result = (
-                        _deserialize_sql_row(row, ordered_columns) for row in result
-                    )
-
-                for data_batch in result:
-                    yield Batch(pd.DataFrame([data_batch]))
+                if not handler.is_sqlalchmey_compatible():
+                    handler_response = handler.select(table.name)
+                    if handler_response.error is not None:
+                        raise Exception(handler_response.error)
+                    # we prefer the generator/iterator when available
+                    rows = []
+                    if handler_response.data_generator is not None:
+                        rows = handler_response.data_generator
+                    elif handler_response.data is not None:
+                        rows = handler_response.data
+                        if isinstance(rows, pd.DataFrame):
+                            rows = rows.to_dict("records")
+                    yield from rows_to_batches(rows, batch_mem_size)
+                    return
+                uri = handler.get_sqlalchmey_uri()
+
+            table_to_read = _get_reflected_table(uri, table.name)
+            table_columns = table.columns
+            if columns is not None:
+                table_columns = [col for col in table.columns if col.name in columns]
+            # EvaDB lowercases the column names of native tables, label the
+            # selected columns with the catalog names
+            query = select(
+                *[
+                    get_sqlalchemy_column(table_to_read, col.name).label(col.name)
+                    for col in table_columns
+                ]
+            )
+            if predicate is not None:
+                query = query.where(
+                    predicate_to_sqlalchemy_filter_clause(table_to_read, predicate)
+                )
+            if orderby_list:
+                query = query.order_by(
+                    *orderby_list_to_sqlalchemy_clauses(table_to_read, orderby_list)
+                )
+            if limit is not None:
+                query = query.limit(limit)
+
+            # Stream the rows on a dedicated connection using a server-side
+            # cursor (when supported by the driver).
+            with get_sqlalchemy_engine(uri).connect() as connection:
+                result = connection.execution_options(stream_results=True).execute(
+                    query
+                )
+                for sql_rows in fetch_sql_rows_in_batches(result, batch_mem_size):
+                    yield _sql_rows_to_batch(sql_rows, table_columns)
 
         except Exception as e:
             err_msg = f"Failed to read the table {table.name} in data source {table.database_name} with exception {str(e)}"
@@ -206,17 +263,10 @@ class NativeStorageEngine(AbstractStorageEngine):
             ) as handler:
                 uri = handler.get_sqlalchmey_uri()
 
-            # Create a metadata object
-            engine = create_engine(uri)
-            metadata = MetaData()
-            Session = sessionmaker(bind=engine)
-            session = Session()
             # Retrieve the SQLAlchemy table object for the existing table
-            table_to_remove = Table(table.name, metadata, autoload_with=engine)
-
-            table_to_remove.drop(engine)
-            session.commit()
-            session.close()
+            table_to_remove = _get_reflected_table(uri, table.name)
+            table_to_remove.drop(get_sqlalchemy_engine(uri))
+            _invalidate_reflected_table(uri, table.name)
         except Exception as e:
             err_msg = f"Failed to drop the table {table.name} in data source {table.database_name} with exception {str(e)}"
             logger.error(err_msg)
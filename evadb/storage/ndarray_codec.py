@@ -0,0 +1,175 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import struct
+from typing import Any, List, Sequence
+
+import numpy as np
+
+from evadb.catalog.catalog_type import ColumnType, NdArrayType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.utils.generic_utils import (
+    PickleSerializer,
+    try_to_import_lz4,
+    try_to_import_zstandard,
+)
+
+# Array types whose values have a fixed width and can be stored as a raw buffer.
+# Everything else (strings, decimals, objects) falls back to pickle.
+BINARY_NDARRAY_TYPES = [
+    None,
+    NdArrayType.INT8,
+    NdArrayType.UINT8,
+    NdArrayType.INT16,
+    NdArrayType.INT32,
+    NdArrayType.INT64,
+    NdArrayType.BOOL,
+    NdArrayType.FLOAT32,
+    NdArrayType.FLOAT64,
+    NdArrayType.ANYTYPE,
+]
+
+COMPRESSION_NONE = "none"
+COMPRESSION_LZ4 = "lz4"
+COMPRESSION_ZSTD = "zstd"
+_COMPRESSION_IDS = {COMPRESSION_NONE: 0, COMPRESSION_LZ4: 1, COMPRESSION_ZSTD: 2}
+
+# magic, compression id, ndim, dtype (eg. <f4, |u1)
+_MAGIC = b"EVNA"
+_HEADER = struct.Struct("<4sBB4s")
+
+
+class NdArrayCodec:
+    """Compact binary codec for NDARRAY cells of structured tables.
+
+    Every cell is stored as a small header (magic, compression, dtype and shape)
+    followed by the raw little-endian buffer of the array, optionally compressed
+    with LZ4 or zstd. Cells of a column that share dtype and shape are decoded
+    with a single `np.frombuffer` call into one stacked array.
+
+    Cells that cannot be represented as a raw buffer (eg. object arrays) are
+    pickled, and cells written by older versions (pickle blobs) remain readable.
+
+    Arguments:
+        compression (str): one of `none`, `lz4` or `zstd`
+    """
+
+    def __init__(self, compression: str = COMPRESSION_NONE):
+        compression = (compression or COMPRESSION_NONE).lower()
+        if compression not in _COMPRESSION_IDS:
+            raise ValueError(f"Unsupported NDARRAY compression {compression}")
+        self._compression = compression
+        self._compression_id = _COMPRESSION_IDS[compression]
+
+    @classmethod
+    def for_column(
+        cls, column: ColumnCatalogEntry, compression: str = COMPRESSION_NONE
+    ) -> "NdArrayCodec":
+        """Return the codec for the column, or None if the column is not an
+        NDARRAY column that can be stored as a raw buffer."""
+        if column.type != ColumnType.NDARRAY:
+            return None
+        if column.array_type not in BINARY_NDARRAY_TYPES:
+            return None
+        return cls(compression)
+
+    def encode(self, value: Any) -> bytes:
+        if value is None:
+            return None
+        if not isinstance(value, np.ndarray) or value.dtype.kind not in "biuf":
+            return PickleSerializer.serialize(value)
+
+        value = value.astype(value.dtype.newbyteorder("<"), order="C", copy=False)
+        header = _HEADER.pack(
+            _MAGIC,
+            self._compression_id,
+            value.ndim,
+            value.dtype.str.encode("ascii"),
+        ) + struct.pack(f"<{value.ndim}q", *value.shape)
+        return header + self._compress(value.tobytes())
+
+    def decode(self, data: bytes) -> Any:
+        return self.decode_column([data])[0]
+
+    def decode_column(self, column_values: Sequence[bytes]) -> List[Any]:
+        """Decode all the cells of a column in a batch.
+
+        If every cell is encoded with the binary codec and they share the same
+        header, the payloads are concatenated and decoded into one stacked
+        array; the returned cells are views into it.
+        """
+        headers = [self._read_header(value) for value in column_values]
+        if column_values and headers[0] is not None:
+            header_len, compression_id, dtype, shape = headers[0]
+            if all(header == headers[0] for header in headers):
+                buffer = bytearray().join(
+                    self._decompress(memoryview(value)[header_len:], compression_id)
+                    for value in column_values
+                )
+                stacked = np.frombuffer(buffer, dtype=dtype).reshape(
+                    (len(column_values),) + shape
+                )
+                return list(stacked)
+
+        return [
+            self._decode_cell(value, header)
+            for value, header in zip(column_values, headers)
+        ]
+
+    def _decode_cell(self, value: bytes, header: tuple) -> Any:
+        if value is None:
+            return None
+        if header is None:
+            # cells written before the binary codec was introduced
+            return PickleSerializer.deserialize(value)
+        header_len, compression_id, dtype, shape = header
+        buffer = bytearray(
+            self._decompress(memoryview(value)[header_len:], compression_id)
+        )
+        return np.frombuffer(buffer, dtype=dtype).reshape(shape)
+
+    def _read_header(self, value: bytes) -> tuple:
+        if value is None or value[: len(_MAGIC)] != _MAGIC:
+            return None
+        _, compression_id, ndim, dtype = _HEADER.unpack_from(value)
+        shape = struct.unpack_from(f"<{ndim}q", value, _HEADER.size)
+        header_len = _HEADER.size + 8 * ndim
+        dtype = np.dtype(dtype.rstrip(b"\x00").decode("ascii"))
+        return header_len, compression_id, dtype, shape
+
+    def _compress(self, data: bytes) -> bytes:
+        if self._compression == COMPRESSION_LZ4:
+            try_to_import_lz4()
+            import lz4.frame
+
+            return lz4.frame.compress(data)
+        elif self._compression == COMPRESSION_ZSTD:
+            try_to_import_zstandard()
+            import zstandard
+
+            return zstandard.ZstdCompressor().compress(data)
+        return data
+
+    def _decompress(self, data: memoryview, compression_id: int) -> bytes:
+        if compression_id == _COMPRESSION_IDS[COMPRESSION_LZ4]:
+            try_to_import_lz4()
+            import lz4.frame
+
+            return lz4.frame.decompress(data)
+        elif compression_id == _COMPRESSION_IDS[COMPRESSION_ZSTD]:
+            try_to_import_zstandard()
+            import zstandard
+
+            return zstandard.ZstdDecompressor().decompress(data)
+        return data
@@ -12,32 +12,43 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from pathlib import Path
+from functools import partial
 from typing import Iterator
 
 from evadb.catalog.models.table_catalog import TableCatalogEntry
-from evadb.catalog.sql_config import ROW_NUM_COLUMN, ROW_NUM_MAGIC
+from evadb.constants import DOCUMENT_SCAN_WORKERS
 from evadb.database import EvaDBDatabase
 from evadb.models.storage.batch import Batch
 from evadb.readers.pdf_reader import PDFReader
 from evadb.storage.abstract_media_storage_engine import AbstractMediaStorageEngine
 
 
+def _read_pdf_file(file_path: str, batch_mem_size: int) -> Iterator[Batch]:
+    # may run in the worker processes of the scan, fitz is not thread safe
+    reader = PDFReader(file_path, batch_mem_size=batch_mem_size)
+    return reader.read()
+
+
 class PDFStorageEngine(AbstractMediaStorageEngine):
     def __init__(self, db: EvaDBDatabase):
         super().__init__(db)
+        # files parsed concurrently by a scan, one process per worker
+        self._scan_workers = (
+            db.config.get_value("storage", "document_scan_workers")
+            or DOCUMENT_SCAN_WORKERS
+        )
 
-    def read(self, table: TableCatalogEntry) -> Iterator[Batch]:
-        for image_files in self._rdb_handler.read(self._get_metadata_table(table), 12):
-            for _, (row_id, file_name, _) in image_files.iterrows():
-                system_file_name = self._xform_file_url_to_file_name(file_name)
-                image_file = Path(table.file_url) / system_file_name
-                # setting batch_mem_size = 1, we need fix it
-                reader = PDFReader(str(image_file), batch_mem_size=1)
-                for batch in reader.read():
-                    batch.frames[table.columns[0].name] = row_id
-                    batch.frames[table.columns[1].name] = str(file_name)
-                    batch.frames[ROW_NUM_COLUMN] = (
-                        row_id * ROW_NUM_MAGIC + batch.frames[ROW_NUM_COLUMN]
-                    )
-                    yield batch
+    def read(
+        self, table: TableCatalogEntry, batch_mem_size: int = 30000000
+    ) -> Iterator[Batch]:
+        """
+        Parse the PDF files of the table and return their paragraphs in batches
+        of about `batch_mem_size` bytes. The paragraphs of small files are
+        merged into one batch.
+        """
+        yield from self._read_media_files(
+            table,
+            partial(_read_pdf_file, batch_mem_size=batch_mem_size),
+            batch_mem_size,
+            self._scan_workers,
+        )
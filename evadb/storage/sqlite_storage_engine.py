@@ -12,29 +12,76 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import defaultdict
+from threading import RLock
 from typing import Iterator, List
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import Table, inspect
+from sqlalchemy import Index, Table, and_, func, inspect, or_, select
 from sqlalchemy.sql.expression import ColumnElement
 
-from evadb.catalog.catalog_type import ColumnType
+from evadb.catalog.catalog_type import ColumnType, ScalarIndexType
+from evadb.catalog.catalog_utils import get_catalog_version
 from evadb.catalog.models.base_model import BaseModel
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.models.utils import ZoneMapCatalogEntry
 from evadb.catalog.schema_utils import SchemaUtils
 from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
+from evadb.constants import (
+    ZONE_MAP_CHUNK_SIZE,
+    ZONE_MAP_MAX_SKIPPED_RANGES,
+)
 from evadb.database import EvaDBDatabase
+from evadb.expression.abstract_expression import AbstractExpression
 from evadb.models.storage.batch import Batch
 from evadb.parser.table_ref import TableInfo
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
+from evadb.storage.ndarray_codec import NdArrayCodec
+from evadb.storage.storage_utils import (
+    batch_to_sql_rows,
+    fetch_sql_rows_in_pages,
+    predicate_to_sqlalchemy_filter_clause,
+    zone_map_may_satisfy_predicate,
+)
 from evadb.utils.generic_utils import PickleSerializer
 from evadb.utils.logging_manager import logger
 
 # Leveraging Dynamic schema in SQLAlchemy
 # https://sparrigan.github.io/sql/sqla/2016/01/03/dynamic-tables.html
 
+# Reflected tables are cached process-wide, keyed by the database and the table
+# name. An entry is only valid for the catalog version it was loaded in, since
+# CREATE, DROP and RENAME bump the version.
+_reflected_tables = {}
+_reflected_tables_lock = RLock()
+
+# Columns with zone maps (min/max statistics per chunk of row ids). Text columns
+# are left out since the database collation may not match python ordering.
+ZONE_MAP_COLUMN_TYPES = [ColumnType.INTEGER, ColumnType.FLOAT, ColumnType.BOOLEAN]
+
+
+def _to_python_value(value):
+    # numpy scalars are stored in the catalog as python values
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _merge_zone_maps(
+    first: ZoneMapCatalogEntry, second: ZoneMapCatalogEntry
+) -> ZoneMapCatalogEntry:
+    """Return the zone map of the rows covered by both zone maps"""
+    min_values = [v for v in [first.min_value, second.min_value] if v is not None]
+    max_values = [v for v in [first.max_value, second.max_value] if v is not None]
+    return ZoneMapCatalogEntry(
+        column_id=first.column_id,
+        chunk_id=first.chunk_id,
+        min_value=min(min_values) if min_values else None,
+        max_value=max(max_values) if max_values else None,
+        null_count=first.null_count + second.null_count,
+        row_count=first.row_count + second.row_count,
+    )
+
 
 class SQLStorageEngine(AbstractStorageEngine):
     def __init__(self, db: EvaDBDatabase):
@@ -42,48 +89,81 @@ class SQLStorageEngine(AbstractStorageEngine):
         Grab the existing sql session
         """
         super().__init__(db)
-        self._sql_session = db.catalog().sql_config.session
-        self._sql_engine = db.catalog().sql_config.engine
+        self._catalog = db.catalog()
+        self._sql_session = self._catalog.sql_config.session
+        self._sql_engine = self._catalog.sql_config.engine
         self._serializer = PickleSerializer
+        self._ndarray_compression = db.config.get_value(
+            "storage", "ndarray_compression"
+        )
+
+    def _get_ndarray_codec(self, column: ColumnCatalogEntry) -> NdArrayCodec:
+        # NDARRAY columns with fixed width types are stored as raw buffers,
+        # others are pickled
+        return NdArrayCodec.for_column(column, self._ndarray_compression)
 
-    def _dict_to_sql_row(self, dict_row: dict, columns: List[ColumnCatalogEntry]):
-        # Serialize numpy data
+    def _get_ndarray_serializer(self, column: ColumnCatalogEntry):
+        codec = self._get_ndarray_codec(column)
+        if codec is not None:
+            return codec.encode
+        return self._serializer.serialize
+
+    def _sql_rows_to_batch(
+        self, sql_rows: list, keys: List[str], columns: List[ColumnCatalogEntry]
+    ) -> Batch:
+        # Build the batch column-wise. Transposing the fetched rows once is
+        # much cheaper than materializing a dict for every row.
+        key_index = {key: idx for idx, key in enumerate(keys)}
+        values = list(zip(*sql_rows))
+        data = {}
         for col in columns:
+            col_values = values[key_index[col.name]]
             if col.type == ColumnType.NDARRAY:
-                dict_row[col.name] = self._serializer.serialize(dict_row[col.name])
-            elif isinstance(dict_row[col.name], (np.generic,)):
-                # Sqlalchemy does not consume numpy generic data types
-                # convert numpy datatype to python generic datatype using tolist()
-                # eg. np.int64 -> int
-                # https://stackoverflow.com/a/53067954
-                dict_row[col.name] = dict_row[col.name].tolist()
-        return dict_row
-
-    def _deserialize_sql_row(self, sql_row: dict, columns: List[ColumnCatalogEntry]):
-        # Deserialize numpy data
-        dict_row = {}
-        for idx, col in enumerate(columns):
-            if col.type == ColumnType.NDARRAY:
-                dict_row[col.name] = self._serializer.deserialize(sql_row[col.name])
+                # The codec also reads cells that were pickled
+                codec = self._get_ndarray_codec(col) or NdArrayCodec()
+                data[col.name] = codec.decode_column(col_values)
             else:
-                dict_row[col.name] = sql_row[col.name]
-        dict_row[ROW_NUM_COLUMN] = dict_row[IDENTIFIER_COLUMN]
-        return dict_row
+                data[col.name] = list(col_values)
+        data[ROW_NUM_COLUMN] = data[IDENTIFIER_COLUMN]
+        return Batch(pd.DataFrame(data))
+
+    def _get_reflection_cache_key(self, table_name: str):
+        return (str(self._sql_engine.url), table_name)
+
+    def _cache_reflected_table(self, table_name: str, table: Table, version: int):
+        with _reflected_tables_lock:
+            _reflected_tables[self._get_reflection_cache_key(table_name)] = (
+                version,
+                table,
+            )
+
+    def _invalidate_reflected_table(self, table_name: str):
+        with _reflected_tables_lock:
+            _reflected_tables.pop(self._get_reflection_cache_key(table_name), None)
 
     def _try_loading_table_via_reflection(self, table_name: str):
+        # read the version before loading the table, so that a concurrent
+        # schema change invalidates the entry
+        version = get_catalog_version()
+        with _reflected_tables_lock:
+            cached = _reflected_tables.get(self._get_reflection_cache_key(table_name))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
         metadata_obj = BaseModel.metadata
         if table_name in metadata_obj.tables:
-            return metadata_obj.tables[table_name]
-        # reflection
-        insp = inspect(self._sql_engine)
-        if insp.has_table(table_name):
+            table = metadata_obj.tables[table_name]
+        else:
+            # reflection
+            insp = inspect(self._sql_engine)
+            if not insp.has_table(table_name):
+                err_msg = f"No table found with name {table_name}"
+                logger.exception(err_msg)
+                raise Exception(err_msg)
             table = Table(table_name, metadata_obj)
             insp.reflect_table(table, None)
-            return table
-        else:
-            err_msg = f"No table found with name {table_name}"
-            logger.exception(err_msg)
-            raise Exception(err_msg)
+        self._cache_reflected_table(table_name, table, version)
+        return table
 
     def create(self, table: TableCatalogEntry, **kwargs):
         """
@@ -103,6 +183,7 @@ class SQLStorageEngine(AbstractStorageEngine):
         sqlalchemy_schema = SchemaUtils.xform_to_sqlalchemy_schema(table_columns)
         attr_dict.update(sqlalchemy_schema)
 
+        version = get_catalog_version()
         insp = inspect(self._sql_engine)
         if insp.has_table(table.name):
             logger.warning("Table {table.name} already exists")
@@ -113,11 +194,10 @@ class SQLStorageEngine(AbstractStorageEngine):
         new_table = type(
             f"__placeholder_class_name__{table.name}", (BaseModel,), attr_dict
         )()
-        table = BaseModel.metadata.tables[table.name]
-
-        if not insp.has_table(table.name):
-            BaseModel.metadata.tables[table.name].create(self._sql_engine)
+        sqlalchemy_table = BaseModel.metadata.tables[table.name]
+        sqlalchemy_table.create(self._sql_engine)
         self._sql_session.commit()
+        self._cache_reflected_table(table.name, sqlalchemy_table, version)
         return new_table
 
     def drop(self, table: TableCatalogEntry):
@@ -130,6 +210,7 @@ class SQLStorageEngine(AbstractStorageEngine):
                 # therefore manually removing the table from the in-memory metadata
                 # https://github.com/sqlalchemy/sqlalchemy/issues/5112
                 BaseModel.metadata.remove(table_to_remove)
+            self._invalidate_reflected_table(table.name)
             self._sql_session.commit()
         except Exception as e:
             err_msg = f"Failed to drop the table {table.name} with Exception {str(e)}"
@@ -146,8 +227,6 @@ class SQLStorageEngine(AbstractStorageEngine):
         """
         try:
             table_to_update = self._try_loading_table_via_reflection(table.name)
-            columns = rows.frames.keys()
-            data = []
 
             # During table writes, assume row_id is automatically handled by
             # the sqlalchemy engine. Another assumption we make here is the
@@ -158,23 +237,174 @@ class SQLStorageEngine(AbstractStorageEngine):
                 if (col.name != IDENTIFIER_COLUMN and col.name != ROW_NUM_COLUMN)
             ]
 
+            zone_map_columns = self._get_zone_map_columns(table)
+            update_zone_maps = bool(zone_map_columns) and len(rows) > 0
+            row_id = table_to_update.columns[IDENTIFIER_COLUMN]
+            if update_zone_maps:
+                last_row_id = self._sql_session.execute(
+                    select(func.max(row_id))
+                ).scalar()
+
             # Todo: validate the data type before inserting into the table
-            for record in rows.frames.values:
-                row_data = {
-                    col: record[idx]
-                    for idx, col in enumerate(columns)
-                    if col != ROW_NUM_COLUMN
-                }
-                data.append(self._dict_to_sql_row(row_data, table_columns))
-            self._sql_session.execute(table_to_update.insert(), data)
+            for data in batch_to_sql_rows(
+                rows,
+                table_columns,
+                self._get_ndarray_serializer,
+                exclude_columns=[ROW_NUM_COLUMN],
+            ):
+                self._sql_session.execute(table_to_update.insert(), data)
+
+            if update_zone_maps:
+                # the row ids are read back, since they are not dense on every
+                # database (eg. sequences skip the ids of rolled back writes).
+                # The zone maps are committed in the same transaction as the
+                # rows, so that they always cover the stored rows.
+                query = select(row_id).order_by(row_id)
+                if last_row_id is not None:
+                    query = query.where(row_id > last_row_id)
+                row_ids = np.asarray(self._sql_session.execute(query).scalars().all())
+                zone_map_entries = self._get_zone_map_entries(
+                    table, zone_map_columns, rows, row_ids, last_row_id
+                )
+                self._catalog.upsert_zone_map_catalog_entries(
+                    zone_map_entries, commit=False
+                )
             self._sql_session.commit()
         except Exception as e:
+            self._sql_session.rollback()
             err_msg = f"Failed to update the table {table.name} with exception {str(e)}"
             logger.exception(err_msg)
             raise Exception(err_msg)
 
+    def _get_zone_map_columns(
+        self, table: TableCatalogEntry
+    ) -> List[ColumnCatalogEntry]:
+        # zone maps are stored in the catalog, so the columns need catalog ids
+        return [
+            col
+            for col in table.columns
+            if col.type in ZONE_MAP_COLUMN_TYPES
+            and col.row_id is not None
+            and col.name not in [IDENTIFIER_COLUMN, ROW_NUM_COLUMN]
+        ]
+
+    def _get_zone_map_entries(
+        self,
+        table: TableCatalogEntry,
+        columns: List[ColumnCatalogEntry],
+        rows: Batch,
+        row_ids: np.ndarray,
+        last_row_id: int = None,
+    ) -> List[ZoneMapCatalogEntry]:
+        """Compute the zone maps of the chunks holding the rows, which were
+        written with the increasing row_ids. The statistics are computed from
+        the batch, and merged with the zone maps of the chunk holding
+        last_row_id, the last row of the previous writes, if the new rows share
+        it."""
+        assert len(row_ids) == len(rows), "Row ids do not match the written rows"
+        chunk_ids = (row_ids - 1) // ZONE_MAP_CHUNK_SIZE
+        chunks, starts = np.unique(chunk_ids, return_index=True)
+        ends = list(starts[1:]) + [len(rows)]
+
+        previous_entries = {}
+        if (
+            last_row_id is not None
+            and (last_row_id - 1) // ZONE_MAP_CHUNK_SIZE == chunks[0]
+        ):
+            previous_entries = {
+                entry.column_id: entry
+                for entry in self._catalog.get_zone_map_catalog_entries(
+                    table, chunk_ids=[int(chunks[0])]
+                )
+            }
+
+        entries = []
+        for col in columns:
+            if col.name in rows.frames.columns:
+                values = rows.frames[col.name]
+            else:
+                values = pd.Series([None] * len(rows))
+            for chunk, start, end in zip(chunks, starts, ends):
+                chunk_values = values.iloc[start:end].dropna()
+                entry = ZoneMapCatalogEntry(
+                    column_id=col.row_id,
+                    chunk_id=int(chunk),
+                    min_value=_to_python_value(chunk_values.min())
+                    if len(chunk_values)
+                    else None,
+                    max_value=_to_python_value(chunk_values.max())
+                    if len(chunk_values)
+                    else None,
+                    null_count=int(end - start - len(chunk_values)),
+                    row_count=int(end - start),
+                )
+                if start == 0 and previous_entries:
+                    previous = previous_entries.get(col.row_id)
+                    if previous is None:
+                        # the chunk holds rows written without zone maps, so it
+                        # is left without a zone map and always read
+                        continue
+                    entry = _merge_zone_maps(previous, entry)
+                entries.append(entry)
+        return entries
+
+    def _get_zone_map_filter_clause(
+        self,
+        table: TableCatalogEntry,
+        table_to_read: Table,
+        predicate: AbstractExpression,
+    ):
+        """Return a filter clause on the row id that skips the chunks that
+        cannot satisfy the predicate according to their zone maps, or None if
+        no chunk can be skipped. Chunks without zone maps are always read."""
+        columns = {col.row_id: col.name for col in self._get_zone_map_columns(table)}
+        if not columns:
+            return None
+        chunks = defaultdict(dict)
+        for entry in self._catalog.get_zone_map_catalog_entries(table):
+            if entry.column_id in columns:
+                chunks[entry.chunk_id][columns[entry.column_id]] = entry
+        skipped_chunk_ids = sorted(
+            chunk_id
+            for chunk_id, zone_maps in chunks.items()
+            if not zone_map_may_satisfy_predicate(predicate, zone_maps)
+        )
+        if not skipped_chunk_ids:
+            return None
+
+        # merge consecutive chunks into ranges, and keep the widest ranges so
+        # that the filter clause stays small
+        skipped_ranges = []
+        for chunk_id in skipped_chunk_ids:
+            if skipped_ranges and skipped_ranges[-1][1] == chunk_id - 1:
+                skipped_ranges[-1][1] = chunk_id
+            else:
+                skipped_ranges.append([chunk_id, chunk_id])
+        skipped_ranges = sorted(
+            sorted(skipped_ranges, key=lambda r: r[1] - r[0], reverse=True)[
+                :ZONE_MAP_MAX_SKIPPED_RANGES
+            ]
+        )
+
+        # read the row ids between the skipped ranges. Range conditions on the
+        # primary key let the database seek instead of scanning the table.
+        row_id = table_to_read.columns[IDENTIFIER_COLUMN]
+        clauses = []
+        start = 1
+        for first_chunk_id, last_chunk_id in skipped_ranges:
+            end = first_chunk_id * ZONE_MAP_CHUNK_SIZE
+            if end >= start:
+                clauses.append(and_(row_id >= start, row_id <= end))
+            start = (last_chunk_id + 1) * ZONE_MAP_CHUNK_SIZE + 1
+        clauses.append(row_id >= start)
+        return or_(*clauses)
+
     def read(
-        self, table: TableCatalogEntry, batch_mem_size: int = 30000000
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        predicate: AbstractExpression = None,
+        columns: List[str] = None,
     ) -> Iterator[Batch]:
         """
         Reads the table and return a batch iterator for the
@@ -183,18 +413,56 @@ class SQLStorageEngine(AbstractStorageEngine):
         Argument:
             table: table metadata object of the table to read
             batch_mem_size (int): memory size of the batch read from storage
+            predicate (AbstractExpression): predicate evaluated by the database,
+                see `extract_pushdown_predicate_for_storage`. The zone maps of
+                the table are used to skip the chunks that cannot satisfy it.
+            columns (List[str]): columns to read, None reads all the columns.
+                The row id column is always read.
         Return:
-            Iterator of Batch read.
+            Iterator of Batch read, in the order of the row ids.
         """
         try:
             table_to_read = self._try_loading_table_via_reflection(table.name)
-            result = self._sql_session.execute(table_to_read.select()).fetchall()
-            for row in result:
-                yield Batch(
-                    pd.DataFrame(
-                        [self._deserialize_sql_row(row._asdict(), table.columns)]
-                    )
+            table_columns = table.columns
+            if columns is not None:
+                table_columns = [
+                    col
+                    for col in table.columns
+                    if col.name in columns or col.name == IDENTIFIER_COLUMN
+                ]
+            query = select(*[table_to_read.columns[col.name] for col in table_columns])
+            if predicate is not None:
+                zone_map_clause = self._get_zone_map_filter_clause(
+                    table, table_to_read, predicate
+                )
+                if zone_map_clause is not None:
+                    query = query.where(zone_map_clause)
+                query = query.where(
+                    predicate_to_sqlalchemy_filter_clause(table_to_read, predicate)
                 )
+            # Read the rows in chunks ordered by the row id, on connections of
+            # their own. A cursor left open on the catalog session between the
+            # batches blocks the writes of the consumer (eg. CREATE TABLE AS
+            # SELECT) forever, and materializing the whole table is expensive.
+            for sql_rows in fetch_sql_rows_in_pages(
+                self._sql_engine,
+                query,
+                table_to_read.columns[IDENTIFIER_COLUMN],
+                batch_mem_size,
+            ):
+                keys = list(sql_rows[0]._fields)
+                yield self._sql_rows_to_batch(sql_rows, keys, table_columns)
+        except Exception as e:
+            err_msg = f"Failed to read the table {table.name} with exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def get_last_row_id(self, table: TableCatalogEntry) -> int:
+        """Return the largest row id of the table, None if the table is empty"""
+        try:
+            table_to_read = self._try_loading_table_via_reflection(table.name)
+            row_id = table_to_read.columns[IDENTIFIER_COLUMN]
+            return self._sql_session.execute(select(func.max(row_id))).scalar()
         except Exception as e:
             err_msg = f"Failed to read the table {table.name} with exception {str(e)}"
             logger.exception(err_msg)
@@ -222,5 +490,58 @@ class SQLStorageEngine(AbstractStorageEngine):
             logger.exception(err_msg)
             raise Exception(err_msg)
 
+    def create_index(
+        self,
+        table: TableCatalogEntry,
+        index_name: str,
+        column_name: str,
+        index_type: ScalarIndexType,
+    ):
+        """Create a database index on a scalar column of the table.
+        The database keeps the index up to date on writes and deletes, and uses
+        it to evaluate the predicates pushed down to `read`.
+
+        Argument:
+            table: table metadata object of the table
+            index_name: name of the index
+            column_name: name of the indexed column
+            index_type: BTREE or HASH. SQLite only supports b-tree indexes, so
+                HASH falls back to a b-tree index there.
+        """
+        try:
+            table_to_index = self._try_loading_table_via_reflection(table.name)
+            dialect_kwargs = {}
+            if index_type == ScalarIndexType.HASH:
+                dialect_kwargs["postgresql_using"] = "hash"
+            index = Index(
+                index_name, table_to_index.columns[column_name], **dialect_kwargs
+            )
+            index.create(self._sql_engine)
+            self._sql_session.commit()
+        except Exception as e:
+            err_msg = (
+                f"Failed to create index {index_name} on the table {table.name} "
+                f"with exception {str(e)}"
+            )
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def drop_index(self, table: TableCatalogEntry, index_name: str):
+        """Drop the database index created by `create_index`."""
+        try:
+            table_to_index = self._try_loading_table_via_reflection(table.name)
+            for index in list(table_to_index.indexes):
+                if index.name == index_name:
+                    index.drop(self._sql_engine)
+                    table_to_index.indexes.discard(index)
+            self._sql_session.commit()
+        except Exception as e:
+            err_msg = (
+                f"Failed to drop index {index_name} on the table {table.name} "
+                f"with exception {str(e)}"
+            )
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
     def rename(self, old_table: TableCatalogEntry, new_name: TableInfo):
         raise Exception("Rename not supported for structured data table")
@@ -16,6 +16,7 @@ from evadb.catalog.catalog_type import TableType
 from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.database import EvaDBDatabase
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
+from evadb.storage.columnar_storage_engine import ColumnarStorageEngine
 from evadb.storage.document_storage_engine import DocumentStorageEngine
 from evadb.storage.image_storage_engine import ImageStorageEngine
 from evadb.storage.native_storage_engine import NativeStorageEngine
@@ -37,6 +38,7 @@ class StorageEngine:
                 TableType.DOCUMENT_DATA: DocumentStorageEngine,
                 TableType.PDF_DATA: PDFStorageEngine,
                 TableType.NATIVE_DATA: NativeStorageEngine,
+                TableType.COLUMNAR_DATA: ColumnarStorageEngine,
             }
 
     @classmethod
@@ -0,0 +1,452 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import operator
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import (
+    Column,
+    CursorResult,
+    Engine,
+    Row,
+    Select,
+    Table,
+    and_,
+    not_,
+    or_,
+)
+
+from evadb.catalog.catalog_type import ColumnType
+from evadb.catalog.models.utils import ColumnCatalogEntry, ZoneMapCatalogEntry
+from evadb.constants import BULK_INSERT_CHUNK_SIZE
+from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage.batch import Batch
+from evadb.parser.types import ParserOrderBySortType
+from evadb.utils.generic_utils import PickleSerializer, get_size
+
+SQL_COMPARISON_OPERATORS = {
+    ExpressionType.COMPARE_EQUAL: operator.eq,
+    ExpressionType.COMPARE_GREATER: operator.gt,
+    ExpressionType.COMPARE_LESSER: operator.lt,
+    ExpressionType.COMPARE_GEQ: operator.ge,
+    ExpressionType.COMPARE_LEQ: operator.le,
+    ExpressionType.COMPARE_NEQ: operator.ne,
+}
+
+# comparison obtained by swapping the operands, eg. 5 < id -> id > 5
+_SWAPPED_COMPARISON_OPERATORS = {
+    ExpressionType.COMPARE_EQUAL: ExpressionType.COMPARE_EQUAL,
+    ExpressionType.COMPARE_NEQ: ExpressionType.COMPARE_NEQ,
+    ExpressionType.COMPARE_GREATER: ExpressionType.COMPARE_LESSER,
+    ExpressionType.COMPARE_LESSER: ExpressionType.COMPARE_GREATER,
+    ExpressionType.COMPARE_GEQ: ExpressionType.COMPARE_LEQ,
+    ExpressionType.COMPARE_LEQ: ExpressionType.COMPARE_GEQ,
+}
+
+
+def get_sqlalchemy_column(table: Table, column_name: str) -> Column:
+    """Return the column of the table. Falls back to a case insensitive lookup
+    because EvaDB lowercases the column names of native tables."""
+    if column_name in table.columns:
+        return table.columns[column_name]
+    for column in table.columns:
+        if column.name.lower() == column_name.lower():
+            return column
+    raise KeyError(f"Column {column_name} not found in table {table.name}")
+
+
+def predicate_to_sqlalchemy_filter_clause(table: Table, predicate: AbstractExpression):
+    """Convert the predicate into a sqlalchemy filter clause on the table.
+
+    Only logical expressions and comparisons between columns and constants are
+    supported, see `extract_pushdown_predicate_for_storage`.
+
+    Args:
+        table (Table): sqlalchemy table the predicate is evaluated on
+        predicate (AbstractExpression): predicate to convert
+    Returns:
+        ColumnElement[bool]: the sqlalchemy filter clause
+    """
+    if isinstance(predicate, TupleValueExpression):
+        return get_sqlalchemy_column(table, predicate.name)
+
+    if isinstance(predicate, ConstantValueExpression):
+        return predicate.value
+
+    if isinstance(predicate, LogicalExpression):
+        children = [
+            predicate_to_sqlalchemy_filter_clause(table, child)
+            for child in predicate.children
+        ]
+        if predicate.etype == ExpressionType.LOGICAL_AND:
+            return and_(*children)
+        elif predicate.etype == ExpressionType.LOGICAL_OR:
+            return or_(*children)
+        elif predicate.etype == ExpressionType.LOGICAL_NOT:
+            return not_(children[0])
+
+    if (
+        isinstance(predicate, ComparisonExpression)
+        and predicate.etype in SQL_COMPARISON_OPERATORS
+    ):
+        left = predicate_to_sqlalchemy_filter_clause(table, predicate.get_child(0))
+        right = predicate_to_sqlalchemy_filter_clause(table, predicate.get_child(1))
+        return SQL_COMPARISON_OPERATORS[predicate.etype](left, right)
+
+    raise ValueError(f"Predicate type {predicate.etype} not supported in storage")
+
+
+def _zone_map_may_satisfy_comparison(
+    etype: ExpressionType, zone_map: ZoneMapCatalogEntry, value
+) -> bool:
+    if zone_map.row_count == zone_map.null_count:
+        # comparisons with null are never true
+        return False
+    min_value, max_value = zone_map.min_value, zone_map.max_value
+    if min_value is None or max_value is None or value is None:
+        return True
+    try:
+        if etype == ExpressionType.COMPARE_EQUAL:
+            return min_value <= value <= max_value
+        elif etype == ExpressionType.COMPARE_NEQ:
+            return not (min_value == max_value == value)
+        elif etype == ExpressionType.COMPARE_GREATER:
+            return max_value > value
+        elif etype == ExpressionType.COMPARE_GEQ:
+            return max_value >= value
+        elif etype == ExpressionType.COMPARE_LESSER:
+            return min_value < value
+        elif etype == ExpressionType.COMPARE_LEQ:
+            return min_value <= value
+    except TypeError:
+        # eg. a string constant compared with an integer column
+        return True
+    return True
+
+
+def zone_map_may_satisfy_predicate(
+    predicate: AbstractExpression, zone_maps: Dict[str, ZoneMapCatalogEntry]
+) -> bool:
+    """Check whether any row of a chunk may satisfy the predicate, using the
+    zone maps of the chunk. The check is conservative: it only returns False if
+    the min/max statistics prove that no row of the chunk satisfies it.
+
+    Args:
+        predicate (AbstractExpression): predicate pushed down to the storage,
+            see `extract_pushdown_predicate_for_storage`
+        zone_maps (Dict[str, ZoneMapCatalogEntry]): zone maps of the chunk
+            indexed by column name
+    Returns:
+        bool: False if the chunk can be skipped
+    """
+    if isinstance(predicate, LogicalExpression):
+        if predicate.etype == ExpressionType.LOGICAL_AND:
+            return all(
+                zone_map_may_satisfy_predicate(child, zone_maps)
+                for child in predicate.children
+            )
+        elif predicate.etype == ExpressionType.LOGICAL_OR:
+            return any(
+                zone_map_may_satisfy_predicate(child, zone_maps)
+                for child in predicate.children
+            )
+        return True
+
+    if (
+        isinstance(predicate, ComparisonExpression)
+        and predicate.etype in _SWAPPED_COMPARISON_OPERATORS
+    ):
+        left, right = predicate.get_child(0), predicate.get_child(1)
+        etype = predicate.etype
+        if isinstance(left, ConstantValueExpression):
+            left, right = right, left
+            etype = _SWAPPED_COMPARISON_OPERATORS[etype]
+        if isinstance(left, TupleValueExpression) and isinstance(
+            right, ConstantValueExpression
+        ):
+            zone_map = zone_maps.get(left.name)
+            if zone_map is not None:
+                return _zone_map_may_satisfy_comparison(etype, zone_map, right.value)
+
+    return True
+
+
+def orderby_list_to_sqlalchemy_clauses(table: Table, orderby_list: List) -> List:
+    """Convert the order by list [(TupleValueExpression, ParserOrderBySortType)]
+    into sqlalchemy order by clauses on the table."""
+    clauses = []
+    for column, sort_type in orderby_list:
+        sql_column = get_sqlalchemy_column(table, column.name)
+        if sort_type == ParserOrderBySortType.DESC:
+            clauses.append(sql_column.desc())
+        else:
+            clauses.append(sql_column.asc())
+    return clauses
+
+
+def _pickle_ndarray_serializer(column: ColumnCatalogEntry) -> Callable:
+    return PickleSerializer.serialize
+
+
+def column_to_sql_values(
+    values: pd.Series,
+    column: Optional[ColumnCatalogEntry],
+    ndarray_serializer: Callable[[ColumnCatalogEntry], Callable],
+) -> list:
+    """Convert the values of a column into python values accepted by sqlalchemy.
+    NDARRAY values are serialized using the serializer returned for the column."""
+    if column is not None and column.type == ColumnType.NDARRAY:
+        serialize = ndarray_serializer(column)
+        return [serialize(value) for value in values]
+    if values.dtype != object:
+        # Sqlalchemy does not consume numpy generic data types. tolist()
+        # converts the whole column to python generic datatypes at once.
+        # eg. np.int64 -> int
+        return values.tolist()
+    return [
+        value.tolist() if isinstance(value, np.generic) else value for value in values
+    ]
+
+
+def batch_to_sql_rows(
+    rows: Batch,
+    columns: List[ColumnCatalogEntry],
+    ndarray_serializer: Callable[
+        [ColumnCatalogEntry], Callable
+    ] = _pickle_ndarray_serializer,
+    exclude_columns: Iterable[str] = (),
+) -> Iterator[List[dict]]:
+    """Convert the batch into chunks of rows accepted by sqlalchemy.
+    The conversion is done column-wise to avoid per-cell python overhead."""
+    column_map = {col.name: col for col in columns}
+    exclude_columns = set(exclude_columns)
+    names = [name for name in rows.frames.columns if name not in exclude_columns]
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        chunk = rows.frames.iloc[start : start + BULK_INSERT_CHUNK_SIZE]
+        values = [
+            column_to_sql_values(chunk[name], column_map.get(name), ndarray_serializer)
+            for name in names
+        ]
+        yield [dict(zip(names, row)) for row in zip(*values)]
+
+
+def fetch_sql_rows_in_batches(
+    result: CursorResult, batch_mem_size: int
+) -> Iterator[List[Row]]:
+    """Fetch the rows of the result in chunks that fit within batch_mem_size.
+    The row size is estimated using the first row."""
+    sql_rows = result.fetchmany(1)
+    if not sql_rows:
+        return
+    row_size = get_size(sql_rows[0])
+    num_rows = max(1, batch_mem_size // max(row_size, 1))
+    if num_rows > 1:
+        sql_rows.extend(result.fetchmany(num_rows - 1))
+    while sql_rows:
+        yield sql_rows
+        sql_rows = result.fetchmany(num_rows)
+
+
+def rows_to_batches(rows: Iterable[dict], batch_mem_size: int) -> Iterator[Batch]:
+    """Group the rows, eg. the rows yielded by a data source, in batches that
+    fit within batch_mem_size. The row size is estimated using the first row."""
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is None:
+        return
+    num_rows = max(1, batch_mem_size // max(get_size(first_row), 1))
+    chunk = [first_row]
+    for row in rows:
+        if len(chunk) == num_rows:
+            yield Batch(pd.DataFrame(chunk))
+            chunk = []
+        chunk.append(row)
+    yield Batch(pd.DataFrame(chunk))
+
+
+def fetch_sql_rows_in_pages(
+    engine: Engine, query: Select, key: Column, batch_mem_size: int
+) -> Iterator[List[Row]]:
+    """Fetch the rows of the query ordered by the unique key column, in chunks
+    that fit within batch_mem_size. Every chunk is read by its own statement on
+    a dedicated connection, so that no cursor (and, on SQLite, no read lock) is
+    held while the chunk is consumed. The row size is estimated using the first
+    row."""
+    query = query.order_by(key)
+
+    def fetch_page(num_rows: int, last_key: Any) -> List[Row]:
+        page = query if last_key is None else query.where(key > last_key)
+        with engine.connect() as conn:
+            return conn.execute(page.limit(num_rows)).fetchall()
+
+    sql_rows = fetch_page(1, None)
+    if not sql_rows:
+        return
+    row_size = get_size(sql_rows[0])
+    num_rows = max(1, batch_mem_size // max(row_size, 1))
+    if num_rows > 1:
+        sql_rows.extend(fetch_page(num_rows - 1, sql_rows[-1]._mapping[key.name]))
+    while sql_rows:
+        yield sql_rows
+        if len(sql_rows) < num_rows:
+            return
+        sql_rows = fetch_page(num_rows, sql_rows[-1]._mapping[key.name])
+
+
+# marks the end of the batches of a source in the queues of a parallel scan
+_SCAN_SOURCE_DONE = object()
+
+
+def _put_until_stopped(
+    out_queue: queue.Queue, item: Any, stop_event: threading.Event
+) -> bool:
+    while not stop_event.is_set():
+        try:
+            out_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _scan_source(
+    read_source: Callable[[Any], Iterator],
+    source: Any,
+    out_queue: queue.Queue,
+    stop_event: threading.Event,
+):
+    try:
+        for batch in read_source(source):
+            if not _put_until_stopped(out_queue, batch, stop_event):
+                return
+    except Exception as e:
+        _put_until_stopped(out_queue, e, stop_event)
+    _put_until_stopped(out_queue, _SCAN_SOURCE_DONE, stop_event)
+
+
+def parallel_scan(
+    read_source: Callable[[Any], Iterator],
+    sources: Iterable,
+    num_workers: int,
+    prefetch: int = 2,
+    ordered: bool = True,
+) -> Iterator:
+    """Read the sources concurrently in `num_workers` threads and yield their
+    batches.
+
+    Every worker buffers at most `prefetch` batches. If `ordered` is True, the
+    batches are yielded in the order of the sources, otherwise as soon as they
+    are read. Closing the returned generator (eg. when a LIMIT is satisfied)
+    stops the workers. An exception raised by `read_source` is re-raised in the
+    caller.
+    """
+    sources = iter(sources)
+    stop_event = threading.Event()
+    shared_queue = queue.Queue(maxsize=prefetch * num_workers)
+    pending = deque()
+
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+
+        def submit_next_source() -> bool:
+            source = next(sources, _SCAN_SOURCE_DONE)
+            if source is _SCAN_SOURCE_DONE:
+                return False
+            out_queue = queue.Queue(maxsize=prefetch) if ordered else shared_queue
+            pool.submit(_scan_source, read_source, source, out_queue, stop_event)
+            pending.append(out_queue)
+            return True
+
+        try:
+            for _ in range(num_workers):
+                if not submit_next_source():
+                    break
+            while pending:
+                # the ordered scan drains the queue of the oldest source, the
+                # unordered scan the queue shared by all the sources
+                item = pending[0].get()
+                if item is _SCAN_SOURCE_DONE:
+                    pending.popleft()
+                    submit_next_source()
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop_event.set()
+
+
+def parallel_map(
+    func: Callable[[Any], Any],
+    items: Iterable,
+    num_workers: int,
+    prefetch: int = 2,
+    use_threads: bool = False,
+) -> Iterator:
+    """Apply `func` to the items in a pool of `num_workers` processes and yield
+    the results in the order of the items.
+
+    At most `prefetch` results per worker are computed ahead of the consumer.
+    Closing the returned generator cancels the pending items. `func`, the items
+    and the results must be picklable, unless `use_threads` is True, which runs
+    them in a pool of threads instead (eg. for functions that release the GIL).
+    With a single worker, the items are processed in the calling process.
+    """
+    if num_workers <= 1:
+        yield from map(func, items)
+        return
+
+    items = iter(items)
+    pending = deque()
+    executor_class = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    with executor_class(max_workers=num_workers) as pool:
+        try:
+            while True:
+                while len(pending) < num_workers * prefetch:
+                    item = next(items, _SCAN_SOURCE_DONE)
+                    if item is _SCAN_SOURCE_DONE:
+                        break
+                    pending.append(pool.submit(func, item))
+                if not pending:
+                    break
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def concat_batches(batches: Iterable[Batch], batch_mem_size: int) -> Iterator[Batch]:
+    """Merge consecutive batches into batches of at least `batch_mem_size`
+    bytes, eg. the small batches read from many small files. Batches that are
+    already larger are returned as they are."""
+    buffered_batches = []
+    buffered_size = 0
+    for batch in batches:
+        buffered_batches.append(batch)
+        buffered_size += int(batch.frames.memory_usage(deep=True).sum())
+        if buffered_size >= batch_mem_size:
+            yield Batch.concat(buffered_batches, copy=False)
+            buffered_batches = []
+            buffered_size = 0
+    if buffered_batches:
+        yield Batch.concat(buffered_batches, copy=False)
@@ -13,21 +13,57 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import sys
-from pathlib import Path
-from typing import Iterator
+from functools import partial
+from typing import Iterator, Tuple
 
+from evadb.catalog.catalog_type import VideoMetadataColumnName
 from evadb.catalog.models.table_catalog import TableCatalogEntry
-from evadb.catalog.sql_config import ROW_NUM_COLUMN, ROW_NUM_MAGIC
+from evadb.constants import (
+    FRAME_CACHE_SEGMENT_SIZE,
+    VIDEO_SCAN_PREFETCH,
+    VIDEO_SCAN_WORKERS,
+)
 from evadb.database import EvaDBDatabase
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.models.storage.batch import Batch
 from evadb.readers.decord_reader import DecordReader
 from evadb.storage.abstract_media_storage_engine import AbstractMediaStorageEngine
+from evadb.storage.frame_cache import FrameCache
+from evadb.storage.storage_utils import parallel_scan
 
 
 class DecordStorageEngine(AbstractMediaStorageEngine):
     def __init__(self, db: EvaDBDatabase):
         super().__init__(db)
+        # videos decoded concurrently, one reader per worker thread
+        self._scan_workers = (
+            db.config.get_value("storage", "video_scan_workers") or VIDEO_SCAN_WORKERS
+        )
+        self._scan_prefetch = (
+            db.config.get_value("storage", "video_scan_prefetch") or VIDEO_SCAN_PREFETCH
+        )
+        scan_ordered = db.config.get_value("storage", "video_scan_ordered")
+        self._scan_ordered = True if scan_ordered is None else scan_ordered
+        # the audio is returned in segments of this many seconds if set
+        self._audio_chunk_duration = db.config.get_value(
+            "storage", "audio_chunk_duration"
+        )
+        self._audio_chunk_overlap = (
+            db.config.get_value("storage", "audio_chunk_overlap") or 0
+        )
+        self._frame_cache = None
+        frame_cache_size = db.config.get_value("storage", "frame_cache_size")
+        if frame_cache_size:
+            self._frame_cache = FrameCache(
+                db.config.get_value("storage", "frame_cache_dir"),
+                max_size=frame_cache_size * 1024 * 1024,
+                segment_size=db.config.get_value("storage", "frame_cache_segment_size")
+                or FRAME_CACHE_SEGMENT_SIZE,
+            )
+
+    def is_scan_ordered(self) -> bool:
+        """Return True if `read` returns the frames in the order of the videos"""
+        return self._scan_workers <= 1 or self._scan_ordered
 
     def read(
         self,
@@ -38,28 +74,61 @@ class DecordStorageEngine(AbstractMediaStorageEngine):
         sampling_type: str = None,
         read_audio: bool = False,
         read_video: bool = True,
+        resolution: Tuple[int, int] = None,
+    ) -> Iterator[Batch]:
+        audio_args = {}
+        if read_audio and self._audio_chunk_duration:
+            # every segment of the audio is returned in its own batch
+            audio_args = {
+                "audio_chunk_duration": self._audio_chunk_duration,
+                "audio_chunk_overlap": self._audio_chunk_overlap,
+            }
+        elif read_audio:
+            # increase batch size when reading audio so that
+            # the audio for the file is returned in one single batch
+            batch_mem_size = sys.maxsize
+        read_video_file = partial(
+            self._read_video_file,
+            table,
+            batch_mem_size=batch_mem_size,
+            predicate=predicate,
+            sampling_rate=sampling_rate,
+            sampling_type=sampling_type,
+            read_audio=read_audio,
+            read_video=read_video,
+            resolution=resolution,
+            frame_cache=self._frame_cache,
+            **audio_args,
+        )
+        video_files = self._get_video_files(table)
+        if self._scan_workers > 1:
+            yield from parallel_scan(
+                read_video_file,
+                video_files,
+                num_workers=self._scan_workers,
+                prefetch=self._scan_prefetch,
+                ordered=self._scan_ordered,
+            )
+        else:
+            for video_file in video_files:
+                yield from read_video_file(video_file)
+
+    def _get_video_files(self, table: TableCatalogEntry) -> Iterator[tuple]:
+        """Yield the media files of the videos of the table, with the index of
+        the video as metadata. The index is empty for the tables loaded before
+        the videos were indexed."""
+        index_columns = [
+            column.name
+            for column in self._get_metadata_table(table).columns
+            if column.name in VideoMetadataColumnName.__members__
+            and column.name != VideoMetadataColumnName.file_url.name
+        ]
+        return self._get_media_files(table, index_columns)
+
+    def _read_video_file(
+        self, table: TableCatalogEntry, video_file: tuple, **reader_args
     ) -> Iterator[Batch]:
-        for video_files in self._rdb_handler.read(self._get_metadata_table(table), 12):
-            for _, (row_id, video_file_name, _) in video_files.iterrows():
-                system_file_name = self._xform_file_url_to_file_name(video_file_name)
-                video_file = Path(table.file_url) / system_file_name
-                # increase batch size when reading audio so that
-                # the audio for the file is returned in one single batch
-                if read_audio:
-                    batch_mem_size = sys.maxsize
-                reader = DecordReader(
-                    str(video_file),
-                    batch_mem_size=batch_mem_size,
-                    predicate=predicate,
-                    sampling_rate=sampling_rate,
-                    sampling_type=sampling_type,
-                    read_audio=read_audio,
-                    read_video=read_video,
-                )
-                for batch in reader.read():
-                    batch.frames[table.columns[0].name] = row_id
-                    batch.frames[table.columns[1].name] = str(video_file_name)
-                    batch.frames[ROW_NUM_COLUMN] = (
-                        row_id * ROW_NUM_MAGIC + batch.frames[ROW_NUM_COLUMN]
-                    )
-                    yield batch
+        row_id, file_name, file_path, video_index = video_file
+        reader = DecordReader(file_path, video_index=video_index or None, **reader_args)
+        for batch in reader.read():
+            yield self._to_table_batch(table, row_id, file_name, batch.frames)
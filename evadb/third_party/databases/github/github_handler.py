@@ -31,7 +31,7 @@ class GithubHandler(DBHandler):
             name (str): name of the DB handler instance
             **kwargs: arbitrary keyword arguments for establishing the connection.
         """
-        super().__init__(name)
+        super().__init__(name, **kwargs)
         self.owner = kwargs.get("owner", "")
         self.repo = kwargs.get("repo", "")
         self.github_token = kwargs.get("github_token", "")
@@ -14,9 +14,17 @@
 # limitations under the License.
 import importlib
 import os
+import time
+from collections import deque
 from contextlib import contextmanager
+from threading import Lock
 
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from evadb.constants import NATIVE_HANDLER_POOL_IDLE_TIMEOUT, NATIVE_HANDLER_POOL_SIZE
 from evadb.executor.executor_utils import ExecutorError
+from evadb.utils.logging_manager import logger
 
 
 def _get_database_handler(engine: str, **kwargs):
@@ -48,16 +56,156 @@ def _get_database_handler(engine: str, **kwargs):
         raise NotImplementedError(f"Engine {engine} is not supported")
 
 
-@contextmanager
-def get_database_handler(engine: str, **kwargs):
-    handler = _get_database_handler(engine, **kwargs)
-    try:
+class DatabaseHandlerPool:
+    """
+    Pool of connected handlers of a single data source.
+
+    Connecting to a remote database often costs more than running a short query,
+    so handlers are returned to the pool after use instead of being disconnected.
+    A pooled handler is health checked before it is handed out again, and handlers
+    that stay idle for longer than idle_timeout seconds are disconnected.
+
+    Args:
+        engine (str): the engine of the data source
+        params (dict): the connection parameters of the data source
+        size (int): the maximum number of idle handlers kept in the pool
+        idle_timeout (float): seconds after which an idle handler is disconnected
+    """
+
+    def __init__(self, engine: str, params: dict, size: int, idle_timeout: float):
+        self.engine = engine
+        self.params = params
+        self.size = size
+        self.idle_timeout = idle_timeout
+        # (handler, time it was returned to the pool)
+        self._idle_handlers = deque()
+        self._lock = Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                self._evict_idle_handlers()
+                if not self._idle_handlers:
+                    break
+                handler, _ = self._idle_handlers.pop()
+            if handler.check_connection().status:
+                return handler
+            logger.debug(f"Discarding broken connection to {self.engine}")
+            handler.disconnect()
+
+        handler = _get_database_handler(self.engine, **self.params)
         resp = handler.connect()
         if not resp.status:
             raise ExecutorError(f"Cannot establish connection due to {resp.error}")
+        return handler
+
+    def release(self, handler):
+        with self._lock:
+            self._evict_idle_handlers()
+            if len(self._idle_handlers) < self.size:
+                self._idle_handlers.append((handler, time.monotonic()))
+                return
+        handler.disconnect()
+
+    def clear(self):
+        with self._lock:
+            handlers = [handler for handler, _ in self._idle_handlers]
+            self._idle_handlers.clear()
+        for handler in handlers:
+            handler.disconnect()
+
+    def _evict_idle_handlers(self):
+        # the oldest handlers are on the left
+        now = time.monotonic()
+        while (
+            self._idle_handlers and now - self._idle_handlers[0][1] > self.idle_timeout
+        ):
+            handler, _ = self._idle_handlers.popleft()
+            handler.disconnect()
+
+
+_handler_pools = {}
+_sqlalchemy_engines = {}
+_pools_lock = Lock()
+
+
+def _get_pool_key(engine: str, **kwargs):
+    return (engine, tuple(sorted((key, str(value)) for key, value in kwargs.items())))
+
+
+def _get_database_handler_pool(engine: str, **kwargs) -> DatabaseHandlerPool:
+    key = _get_pool_key(engine, **kwargs)
+    with _pools_lock:
+        if key not in _handler_pools:
+            _handler_pools[key] = DatabaseHandlerPool(
+                engine,
+                kwargs,
+                size=int(kwargs.get("pool_size", NATIVE_HANDLER_POOL_SIZE)),
+                idle_timeout=float(
+                    kwargs.get("pool_idle_timeout", NATIVE_HANDLER_POOL_IDLE_TIMEOUT)
+                ),
+            )
+        return _handler_pools[key]
+
+
+@contextmanager
+def get_database_handler(engine: str, **kwargs):
+    """
+    Yield a connected handler of the data source. The handler is borrowed from
+    the pool of the data source and returned to it on exit; the pool size and
+    idle timeout can be set with the pool_size and pool_idle_timeout parameters
+    of the data source.
+    """
+    pool = _get_database_handler_pool(engine, **kwargs)
+    handler = pool.acquire()
+    try:
         yield handler
-    finally:
+    except BaseException:
+        # the connection may be left in an unknown state
         handler.disconnect()
+        raise
+    else:
+        pool.release(handler)
+
+
+def get_sqlalchemy_engine(uri: str) -> Engine:
+    """
+    Return the SQLAlchemy engine of the data source. Engines are cached per uri,
+    so their connection pool is shared by all the queries on the data source.
+    """
+    with _pools_lock:
+        if uri not in _sqlalchemy_engines:
+            _sqlalchemy_engines[uri] = create_engine(uri, pool_pre_ping=True)
+        return _sqlalchemy_engines[uri]
+
+
+def clear_database_handler_pool(engine: str, **kwargs):
+    """
+    Disconnect the pooled handlers and dispose the SQLAlchemy engine of the data
+    source, e.g., when it is dropped.
+    """
+    with _pools_lock:
+        pool = _handler_pools.pop(_get_pool_key(engine, **kwargs), None)
+        # the data source was never connected to
+        if pool is None:
+            return
+        handler = _get_database_handler(engine, **kwargs)
+        sqlalchemy_engine = None
+        if handler.is_sqlalchmey_compatible():
+            sqlalchemy_engine = _sqlalchemy_engines.pop(
+                handler.get_sqlalchmey_uri(), None
+            )
+    pool.clear()
+    if sqlalchemy_engine is not None:
+        sqlalchemy_engine.dispose()
+
+
+def is_sqlalchmey_compatible_database(engine: str, **kwargs) -> bool:
+    """
+    Return whether the data source is sqlalchemy compatible without connecting to
+    it. Queries on such data sources can be pushed down to the database.
+    """
+    return _get_database_handler(engine, **kwargs).is_sqlalchmey_compatible()
 
 
 def dynamic_import(handler_dir):
@@ -36,7 +36,7 @@ class MariaDbHandler(DBHandler):
             name (str): name of the DB handler instance
             **kwargs: arbitrary keyword arguments for establishing the connection.
         """
-        super().__init__(name)
+        super().__init__(name, **kwargs)
         self.host = kwargs.get("host")
         self.port = kwargs.get("port")
         self.user = kwargs.get("user")
@@ -79,10 +79,13 @@ class MariaDbHandler(DBHandler):
         Returns:
           DBHandlerStatus
         """
-        if self.connection:
-            return DBHandlerStatus(status=True)
-        else:
+        if not self.connection:
             return DBHandlerStatus(status=False, error="Not connected to the database.")
+        try:
+            self.connection.ping()
+            return DBHandlerStatus(status=True)
+        except mariadb.Error as e:
+            return DBHandlerStatus(status=False, error=str(e))
 
     def get_tables(self) -> DBHandlerResponse:
         """
@@ -24,7 +24,7 @@ from evadb.third_party.databases.types import (
 
 class MysqlHandler(DBHandler):
     def __init__(self, name: str, **kwargs):
-        super().__init__(name)
+        super().__init__(name, **kwargs)
         self.host = kwargs.get("host")
         self.port = kwargs.get("port")
         self.user = kwargs.get("user")
@@ -53,10 +53,12 @@ class MysqlHandler(DBHandler):
         return f"mysql+mysqlconnector://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
     def check_connection(self) -> DBHandlerStatus:
-        if self.connection:
-            return DBHandlerStatus(status=True)
-        else:
+        if not self.connection:
             return DBHandlerStatus(status=False, error="Not connected to the database.")
+        # is_connected pings the server
+        if self.connection.is_connected():
+            return DBHandlerStatus(status=True)
+        return DBHandlerStatus(status=False, error="Lost connection to the database.")
 
     def get_tables(self) -> DBHandlerResponse:
         if not self.connection:
@@ -31,7 +31,7 @@ class PostgresHandler(DBHandler):
             name (str): name of the DB handler instance
             **kwargs: arbitrary keyword arguments for establishing the connection.
         """
-        super().__init__(name)
+        super().__init__(name, **kwargs)
         self.host = kwargs.get("host")
         self.port = kwargs.get("port")
         self.user = kwargs.get("user")
@@ -74,10 +74,14 @@ class PostgresHandler(DBHandler):
         Returns:
             DBHandlerStatus
         """
-        if self.connection:
-            return DBHandlerStatus(status=True)
-        else:
+        if not self.connection:
             return DBHandlerStatus(status=False, error="Not connected to the database.")
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return DBHandlerStatus(status=True)
+        except psycopg2.Error as e:
+            return DBHandlerStatus(status=False, error=str(e))
 
     def get_tables(self) -> DBHandlerResponse:
         """
@@ -32,7 +32,7 @@ class SQLiteHandler(DBHandler):
             name (str): name of the DB handler instance
             **kwargs: arbitrary keyword arguments for establishing the connection.
         """
-        super().__init__(name)
+        super().__init__(name, **kwargs)
         self.database = kwargs.get("database")
         self.connection = None
 
@@ -66,10 +66,13 @@ class SQLiteHandler(DBHandler):
         Returns:
             DBHandlerStatus
         """
-        if self.connection:
-            return DBHandlerStatus(status=True)
-        else:
+        if not self.connection:
             return DBHandlerStatus(status=False, error="Not connected to the database.")
+        try:
+            self.connection.execute("SELECT 1")
+            return DBHandlerStatus(status=True)
+        except sqlite3.Error as e:
+            return DBHandlerStatus(status=False, error=str(e))
 
     def get_tables(self) -> DBHandlerResponse:
         """
@@ -16,8 +16,6 @@ from dataclasses import dataclass
 from typing import Generator
 
 import pandas as pd
-from sqlalchemy import MetaData, Table, create_engine
-from sqlalchemy.orm import sessionmaker
 
 
 @dataclass
@@ -27,6 +25,7 @@ class DBHandlerResponse:
 
     Attributes:
         data (pd.DataFrame): A Pandas DataFrame containing the data retrieved from the database.
+        data_generator (Generator, optional): A generator that lazily yields the rows retrieved from the database.
         error (str, optional): An optional error message indicating any issues encountered during the operation.
     """
 
@@ -157,29 +156,15 @@ class DBHandler:
 
     def select(self, table_name: str) -> DBHandlerResponse:
         """
-        Returns a generator that yields the data from the given table, or the data.
+        Reads the rows of the given table. Only the data sources that are not sqlalchemy compatible implement this method. The tables of the sqlalchemy compatible data sources are read by the native storage engine, which pushes the predicates, projections and limits down to the data source.
+
         Args:
             table_name (str): name of the table whose data is to be retrieved.
+
         Returns:
-            DBHandlerResponse: An instance of DBHandlerResponse containing the data, data generator, or an error message. Data is in a pandas DataFrame.
+            DBHandlerResponse: An instance of DBHandlerResponse containing either the data, a pandas DataFrame with the rows of the table, or the data_generator, a generator that yields the rows of the table as dicts, or an error message.
 
         Raises:
-            NotImplementedError: The default implementation of this method is for sqlalchemy-supported data source. The data source that does not support sqlalchemy should overwrite this function.
+            NotImplementedError: This method should be implemented in derived classes that are not sqlalchemy compatible.
         """
-        try:
-            uri = self.get_sqlalchmey_uri()
-            # Create a metadata object
-            engine = create_engine(uri)
-            metadata = MetaData()
-
-            Session = sessionmaker(bind=engine)
-            session = Session()
-            # Retrieve the SQLAlchemy table object for the existing table
-            table_to_read = Table(table_name, metadata, autoload_with=engine)
-            # TODO: there is a BUG in the SQLAlchemy session management, when there is a function expression in the plan tree, we will update the catalog for its cost, which leads to a SQLAlchemy deadlock if we return a generator here.
-            result = session.execute(table_to_read.select()).fetchall()
-            session.close()
-            # A generator is better, however, the current implementation suffers from deadlock from different SQLAlchemy sessions.
-            return DBHandlerResponse(data=result)
-        except Exception as e:
-            return DBHandlerResponse(data=None, error=str(e))
+        raise NotImplementedError()
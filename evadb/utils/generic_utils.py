@@ -586,6 +586,51 @@ def is_chromadb_available() -> bool:
         return False
 
 
+##############################
+## STORAGE
+##############################
+
+
+def try_to_import_lz4():
+    try:
+        import lz4  # noqa: F401
+    except ImportError:
+        raise ValueError(
+            """Could not import lz4 python package.
+                Please install it with `pip install lz4`."""
+        )
+
+
+def try_to_import_zstandard():
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        raise ValueError(
+            """Could not import zstandard python package.
+                Please install it with `pip install zstandard`."""
+        )
+
+
+def try_to_import_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.dataset  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ValueError(
+            """Could not import pyarrow python package.
+                Please install it with `pip install pyarrow`."""
+        )
+
+
+def is_pyarrow_available() -> bool:
+    try:
+        try_to_import_pyarrow()
+        return True
+    except ValueError:  # noqa: E722
+        return False
+
+
 ##############################
 ## UTILS
 ##############################
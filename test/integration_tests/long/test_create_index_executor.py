@@ -20,8 +20,9 @@ from test.util import get_evadb_for_testing, load_functions_for_testing
 import numpy as np
 import pandas as pd
 import pytest
+from sqlalchemy import inspect, text
 
-from evadb.catalog.catalog_type import VectorStoreType
+from evadb.catalog.catalog_type import ScalarIndexType, VectorStoreType
 from evadb.executor.executor_utils import ExecutorError
 from evadb.models.storage.batch import Batch
 from evadb.server.command_handler import execute_query_fetch_all
@@ -102,6 +103,8 @@ class CreateIndexTest(unittest.TestCase):
         execute_query_fetch_all(cls.evadb, query)
         query = "DROP TABLE testCreateIndexInputTable;"
         execute_query_fetch_all(cls.evadb, query)
+        query = "DROP TABLE IF EXISTS testCreateIndexScalarTable;"
+        execute_query_fetch_all(cls.evadb, query)
 
     @macos_skip_marker
     def test_index_already_exist(self):
@@ -200,3 +203,67 @@ class CreateIndexTest(unittest.TestCase):
         distance, row_id = index.search(np.array([[0, 0, 0]]).astype(np.float32), 1)
         self.assertEqual(distance[0][0], 0)
         self.assertEqual(row_id[0][0], 1)
+
+    def test_should_create_scalar_index(self):
+        execute_query_fetch_all(
+            self.evadb,
+            """create table if not exists testCreateIndexScalarTable (
+                video_id INTEGER,
+                label TEXT(10),
+                feat NDARRAY FLOAT32(1,3)
+            );""",
+        )
+        for video_id, label in [(1, "car"), (17, "person"), (17, "car")]:
+            execute_query_fetch_all(
+                self.evadb,
+                f"""INSERT INTO testCreateIndexScalarTable (video_id, label)
+                    VALUES ({video_id}, '{label}');""",
+            )
+
+        query = "CREATE INDEX testCreateIndexName ON testCreateIndexScalarTable (video_id) USING BTREE;"
+        execute_query_fetch_all(self.evadb, query)
+
+        index_catalog_entry = self.evadb.catalog().get_index_catalog_entry_by_name(
+            "testCreateIndexName"
+        )
+        self.assertEqual(index_catalog_entry.type, ScalarIndexType.BTREE)
+        self.assertEqual(index_catalog_entry.feat_column.name, "video_id")
+
+        # The index is built and maintained by the database.
+        sql_engine = self.evadb.catalog().sql_config.engine
+        self.assertIn(
+            "testCreateIndexName",
+            [
+                index["name"]
+                for index in inspect(sql_engine).get_indexes(
+                    "testCreateIndexScalarTable"
+                )
+            ],
+        )
+        execute_query_fetch_all(
+            self.evadb,
+            "INSERT INTO testCreateIndexScalarTable (video_id, label) VALUES (17, 'bus');",
+        )
+        with sql_engine.connect() as conn:
+            plan = conn.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT * FROM testCreateIndexScalarTable "
+                    "WHERE video_id = 17"
+                )
+            ).fetchall()
+        self.assertIn("testCreateIndexName", str(plan))
+
+        # The predicate is evaluated by the database using the index.
+        batch = execute_query_fetch_all(
+            self.evadb,
+            """SELECT label FROM testCreateIndexScalarTable
+                WHERE video_id = 17 AND label = 'car';""",
+        )
+        self.assertEqual(
+            list(batch.frames["testcreateindexscalartable.label"]), ["car"]
+        )
+
+        # Scalar indexes are only created on scalar columns of structured tables.
+        query = "CREATE INDEX testCreateHashIndex ON testCreateIndexScalarTable (feat) USING HASH;"
+        with self.assertRaises(Exception):
+            execute_query_fetch_all(self.evadb, query)
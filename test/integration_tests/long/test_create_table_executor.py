@@ -22,6 +22,7 @@ from test.util import (
     load_functions_for_testing,
     shutdown_ray,
 )
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -30,6 +31,7 @@ from evadb.configuration.constants import EvaDB_ROOT_DIR
 from evadb.executor.executor_utils import ExecutorError
 from evadb.models.storage.batch import Batch
 from evadb.server.command_handler import execute_query_fetch_all
+from evadb.storage.sqlite_storage_engine import SQLStorageEngine
 
 NUM_FRAMES = 10
 
@@ -86,6 +88,195 @@ class CreateTableTest(unittest.TestCase):
         # re create table should work
         execute_query_fetch_all(self.evadb, create_query)
 
+    def test_should_create_table_from_select_on_structured_table(self):
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS source_table;")
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS dummy_table;")
+        execute_query_fetch_all(
+            self.evadb, "CREATE TABLE source_table (a INTEGER, b TEXT(10));"
+        )
+        table = self.evadb.catalog().get_table_catalog_entry("source_table")
+        SQLStorageEngine(self.evadb).write(
+            table,
+            Batch(pd.DataFrame({"a": range(300), "b": [f"b{i}" for i in range(300)]})),
+        )
+
+        batch_mem_size = self.evadb.config.get_value("executor", "batch_mem_size")
+        # the source table is read in many batches, which are written while
+        # the table is still being read
+        self.evadb.config.update_value("executor", "batch_mem_size", 2000)
+        try:
+            execute_query_fetch_all(
+                self.evadb,
+                """CREATE TABLE dummy_table
+                    AS SELECT a, b FROM source_table WHERE a >= 10;""",
+            )
+        finally:
+            self.evadb.config.update_value("executor", "batch_mem_size", batch_mem_size)
+
+        result = execute_query_fetch_all(self.evadb, "SELECT a, b FROM dummy_table;")
+        result.sort()
+        self.assertEqual(list(result.frames["dummy_table.a"]), list(range(10, 300)))
+        self.assertEqual(
+            list(result.frames["dummy_table.b"]), [f"b{i}" for i in range(10, 300)]
+        )
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS source_table;")
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS dummy_table;")
+
+    def test_should_resume_create_table_from_select(self):
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS dummy_table;")
+        create_query = """CREATE TABLE dummy_table
+            AS SELECT id, DummyObjectDetector(data).label FROM MyVideo;
+        """
+        write = SQLStorageEngine.write
+        num_writes = []
+        error = None
+
+        def fail_on_third_write(storage_engine, table, rows):
+            write(storage_engine, table, rows)
+            num_writes.append(len(rows))
+            if len(num_writes) == 3:
+                raise error
+
+        batch_mem_size = self.evadb.config.get_value("executor", "batch_mem_size")
+        # read 3 frames in every batch
+        self.evadb.config.update_value("executor", "batch_mem_size", 9000)
+        try:
+            with patch.object(SQLStorageEngine, "write", fail_on_third_write):
+                # the table of a failing query is dropped
+                error = RuntimeError("error")
+                with self.assertRaises(ExecutorError):
+                    execute_query_fetch_all(
+                        self.evadb, create_query, do_not_print_exceptions=True
+                    )
+                self.assertIsNone(
+                    self.evadb.catalog().get_table_catalog_entry("dummy_table")
+                )
+
+                num_writes.clear()
+                error = KeyboardInterrupt()
+                with self.assertRaises(KeyboardInterrupt):
+                    execute_query_fetch_all(
+                        self.evadb, create_query, do_not_print_exceptions=True
+                    )
+                # the rows are kept, including the rows of the last write,
+                # which was not checkpointed
+                result = execute_query_fetch_all(
+                    self.evadb, "SELECT id FROM dummy_table;"
+                )
+                self.assertEqual(len(result), 9)
+                catalog = self.evadb.catalog()
+                checkpoint = catalog.get_checkpoint_catalog_entry(
+                    catalog.get_table_catalog_entry("dummy_table")
+                )
+                self.assertEqual(
+                    (checkpoint.output_rows, checkpoint.last_row_id), (6, 6)
+                )
+
+                # the rerun resumes after the checkpoint
+                num_writes.clear()
+                execute_query_fetch_all(self.evadb, create_query)
+                self.assertEqual(num_writes, [3, 1])
+        finally:
+            self.evadb.config.update_value("executor", "batch_mem_size", batch_mem_size)
+
+        result = execute_query_fetch_all(
+            self.evadb, "SELECT id, label FROM dummy_table;"
+        )
+        result.sort()
+        labels = DummyObjectDetector().labels
+        expected = [
+            {"dummy_table.id": i, "dummy_table.label": [labels[1 + i % 2]]}
+            for i in range(NUM_FRAMES)
+        ]
+        self.assertEqual(result, Batch(frames=pd.DataFrame(expected)))
+
+        # the table is complete
+        with self.assertRaises(ExecutorError):
+            execute_query_fetch_all(
+                self.evadb, create_query, do_not_print_exceptions=True
+            )
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS dummy_table;")
+
+    def test_should_resume_create_table_from_select_on_structured_table(self):
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS source_table;")
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS dummy_table;")
+        execute_query_fetch_all(self.evadb, "CREATE TABLE source_table (a INTEGER);")
+        table = self.evadb.catalog().get_table_catalog_entry("source_table")
+        SQLStorageEngine(self.evadb).write(
+            table, Batch(pd.DataFrame({"a": range(300)}))
+        )
+        create_query = """CREATE TABLE dummy_table
+            AS SELECT a FROM source_table WHERE a >= 10;"""
+
+        write = SQLStorageEngine.write
+        num_writes = []
+
+        def interrupt_third_write(storage_engine, table, rows):
+            if table.name == "dummy_table" and len(num_writes) == 2:
+                num_writes.append(len(rows))
+                raise KeyboardInterrupt()
+            write(storage_engine, table, rows)
+            if table.name == "dummy_table":
+                num_writes.append(len(rows))
+
+        batch_mem_size = self.evadb.config.get_value("executor", "batch_mem_size")
+        self.evadb.config.update_value("executor", "batch_mem_size", 2000)
+        try:
+            with patch.object(SQLStorageEngine, "write", interrupt_third_write):
+                with self.assertRaises(KeyboardInterrupt):
+                    execute_query_fetch_all(
+                        self.evadb, create_query, do_not_print_exceptions=True
+                    )
+            catalog = self.evadb.catalog()
+            checkpoint = catalog.get_checkpoint_catalog_entry(
+                catalog.get_table_catalog_entry("dummy_table")
+            )
+            self.assertEqual(checkpoint.output_rows, sum(num_writes[:2]))
+
+            # the rerun resumes after the checkpoint
+            execute_query_fetch_all(self.evadb, create_query)
+        finally:
+            self.evadb.config.update_value("executor", "batch_mem_size", batch_mem_size)
+
+        result = execute_query_fetch_all(self.evadb, "SELECT a FROM dummy_table;")
+        result.sort()
+        self.assertEqual(list(result.frames["dummy_table.a"]), list(range(10, 300)))
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS source_table;")
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS dummy_table;")
+
+    def test_should_not_checkpoint_unordered_video_scan(self):
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS dummy_table;")
+        write = SQLStorageEngine.write
+        checkpoints = []
+
+        def record_checkpoint(storage_engine, table, rows):
+            write(storage_engine, table, rows)
+            catalog = self.evadb.catalog()
+            checkpoints.append(catalog.get_checkpoint_catalog_entry(table))
+
+        config = self.evadb.config
+        scan_config = {
+            key: config.get_value("storage", key)
+            for key in ["video_scan_workers", "video_scan_ordered"]
+        }
+        # the frames of the videos are returned as soon as they are decoded
+        config.update_value("storage", "video_scan_workers", 2)
+        config.update_value("storage", "video_scan_ordered", False)
+        try:
+            with patch.object(SQLStorageEngine, "write", record_checkpoint):
+                execute_query_fetch_all(
+                    self.evadb, "CREATE TABLE dummy_table AS SELECT id FROM MyVideo;"
+                )
+        finally:
+            for key, value in scan_config.items():
+                config.update_value("storage", key, value)
+
+        self.assertTrue(checkpoints)
+        self.assertEqual(checkpoints, [None] * len(checkpoints))
+        result = execute_query_fetch_all(self.evadb, "SELECT id FROM dummy_table;")
+        self.assertEqual(len(result), NUM_FRAMES)
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS dummy_table;")
+
     @macos_skip_marker
     @pytest.mark.torchtest
     def test_should_create_table_from_select_lateral_join(self):
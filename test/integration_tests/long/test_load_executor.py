@@ -20,6 +20,7 @@ import tempfile
 import unittest
 from pathlib import Path
 from test.util import (
+    NUM_FRAMES,
     create_dummy_batches,
     create_dummy_csv_batches,
     create_large_scale_image_dataset,
@@ -29,6 +30,7 @@ from test.util import (
     get_evadb_for_testing,
     shutdown_ray,
 )
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -40,6 +42,7 @@ from evadb.executor.executor_utils import ExecutorError
 from evadb.models.storage.batch import Batch
 from evadb.parser.types import FileFormatType
 from evadb.server.command_handler import execute_query_fetch_all
+from evadb.storage.sqlite_storage_engine import SQLStorageEngine
 
 
 @pytest.mark.notparallel
@@ -75,6 +78,33 @@ class LoadExecutorTests(unittest.TestCase):
         self.assertEqual(actual_batch, expected_batch)
         execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyVideo;")
 
+    def test_should_index_video_at_load_time(self):
+        query = f"LOAD VIDEO '{self.video_file_path}' INTO MyVideo;"
+        execute_query_fetch_all(self.evadb, query)
+
+        table_catalog_entry = self.evadb.catalog().get_table_catalog_entry("MyVideo")
+        metadata_table = (
+            self.evadb.catalog().get_multimedia_metadata_table_catalog_entry(
+                table_catalog_entry
+            )
+        )
+        batches = list(SQLStorageEngine(self.evadb).read(metadata_table))
+        self.assertEqual(len(batches), 1)
+        video_index = batches[0].frames.iloc[0]
+        self.assertEqual(video_index["file_url"], self.video_file_path)
+        self.assertEqual(video_index["num_frames"], NUM_FRAMES)
+        self.assertGreater(video_index["fps"], 0)
+        self.assertGreater(video_index["duration"], 0)
+        # every frame of the MJPEG sample video is a key frame
+        self.assertEqual(list(video_index["key_indices"]), list(range(NUM_FRAMES)))
+
+        # the timestamps of the frames are read from the index
+        seconds = execute_query_fetch_all(self.evadb, "SELECT seconds FROM MyVideo;")
+        np.testing.assert_array_equal(
+            np.round(video_index["timestamps"], 2), seconds.frames["myvideo.seconds"]
+        )
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyVideo;")
+
     def test_should_form_symlink_to_individual_video(self):
         catalog_manager = self.evadb.catalog()
         query = f"LOAD VIDEO '{self.video_file_path}' INTO MyVideo;"
@@ -491,6 +521,93 @@ class LoadExecutorTests(unittest.TestCase):
         # Clean up large scale image directory.
         shutil.rmtree(large_scale_image_files_path)
 
+    def test_should_load_incrementally(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            shutil.copy(self.video_file_path, Path(tmp_dir) / "a.avi")
+            load_query = f"LOAD VIDEO '{tmp_dir}/*.avi' INTO MyVideos INCREMENTAL;"
+            result = execute_query_fetch_all(self.evadb, load_query)
+            self.assertEqual(list(result.frames["status"]), ["added"])
+
+            # unchanged files are skipped
+            shutil.copy(self.video_file_path, Path(tmp_dir) / "b.avi")
+            result = execute_query_fetch_all(self.evadb, load_query)
+            self.assertEqual(list(result.frames["file_path"]), [f"{tmp_dir}/b.avi"])
+            new_row_id = result.frames["_row_id"][0]
+            result = execute_query_fetch_all(self.evadb, load_query)
+            self.assertEqual(len(result), 0)
+
+            # changed files are loaded again with a new row id
+            os.utime(Path(tmp_dir) / "a.avi", ns=(0, 0))
+            result = execute_query_fetch_all(self.evadb, load_query)
+            self.assertEqual(list(result.frames["status"]), ["updated"])
+            self.assertNotIn(result.frames["_row_id"][0], [1, new_row_id])
+
+            # the delta can be queried with the row ids
+            result = execute_query_fetch_all(
+                self.evadb,
+                f"SELECT id FROM MyVideos WHERE _row_id = {new_row_id};",
+            )
+            self.assertEqual(len(result), NUM_FRAMES)
+            result = execute_query_fetch_all(self.evadb, "SELECT id FROM MyVideos;")
+            self.assertEqual(len(result), 2 * NUM_FRAMES)
+
+    def test_should_not_revalidate_unchanged_files(self):
+        image_files_path = create_large_scale_image_dataset(3)
+        load_query = f"LOAD IMAGE '{image_files_path}/*.jpg' INTO MyCachedImages;"
+        drop_query = "DROP TABLE IF EXISTS MyCachedImages;"
+        execute_query_fetch_all(self.evadb, load_query)
+        execute_query_fetch_all(self.evadb, drop_query)
+
+        with patch(
+            "evadb.executor.load_multimedia_executor.validate_media"
+        ) as mock_validate:
+            execute_query_fetch_all(self.evadb, load_query)
+            mock_validate.assert_not_called()
+        execute_query_fetch_all(self.evadb, drop_query)
+
+        # a replaced file is validated again
+        with open(os.path.join(image_files_path, "img0.jpg"), "w") as f:
+            f.write("aa")
+        with self.assertRaises(ExecutorError):
+            execute_query_fetch_all(
+                self.evadb, load_query, do_not_print_exceptions=True
+            )
+        execute_query_fetch_all(self.evadb, drop_query)
+
+        shutil.rmtree(image_files_path)
+
+    def test_should_reject_truncated_videos(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # an mp4 container header without a moov atom
+            video_path = os.path.join(tmp_dir, "truncated.mp4")
+            with open(video_path, "wb") as f:
+                f.write(b"\x00\x00\x00\x18ftypmp42" + bytes(4096))
+            with self.assertRaises(ExecutorError):
+                execute_query_fetch_all(
+                    self.evadb,
+                    f"LOAD VIDEO '{video_path}' INTO TruncatedVideos;",
+                    do_not_print_exceptions=True,
+                )
+        # the file is rejected before the table is created
+        self.assertIsNone(
+            self.evadb.catalog().get_table_catalog_entry("TruncatedVideos")
+        )
+
+        # a failed load drops the table it created, including its catalog entry
+        with patch(
+            "evadb.executor.load_multimedia_executor.get_video_index",
+            side_effect=RuntimeError("index failure"),
+        ):
+            with self.assertRaises(ExecutorError):
+                execute_query_fetch_all(
+                    self.evadb,
+                    f"LOAD VIDEO '{self.video_file_path}' INTO TruncatedVideos;",
+                    do_not_print_exceptions=True,
+                )
+        self.assertIsNone(
+            self.evadb.catalog().get_table_catalog_entry("TruncatedVideos")
+        )
+
     def test_load_pdfs(self):
         execute_query_fetch_all(
             self.evadb,
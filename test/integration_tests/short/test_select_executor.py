@@ -30,6 +30,7 @@ import pandas as pd
 import pytest
 
 from evadb.binder.binder_utils import BinderError
+from evadb.configuration.constants import EvaDB_INSTALLATION_DIR, EvaDB_ROOT_DIR
 from evadb.models.storage.batch import Batch
 from evadb.optimizer.operators import LogicalFilter
 from evadb.server.command_handler import execute_query_fetch_all
@@ -157,6 +158,21 @@ class SelectExecutorTest(unittest.TestCase):
         self.assertEqual(len(actual_batch), len(expected_batch[0]))
         self.assertEqual(actual_batch, expected_batch[0])
 
+    def test_select_and_where_on_seconds(self):
+        # the frames of the sample video are 0.1 seconds apart
+        select_query = """SELECT * FROM MyVideo
+            WHERE seconds > 0.25 AND seconds < 0.65 AND id != 5 ORDER BY id;"""
+        actual_batch = execute_query_fetch_all(self.evadb, select_query)
+        expected_batch = list(create_dummy_batches(filters=[3, 4, 6]))[0]
+        self.assertEqual(actual_batch, expected_batch)
+
+        # predicates that cannot be converted to frame ranges are evaluated
+        # after reading the frames
+        select_query = """SELECT id FROM MyVideo
+            WHERE seconds > 0.25 AND (id < 4 OR seconds > 0.75) ORDER BY id;"""
+        actual_batch = execute_query_fetch_all(self.evadb, select_query)
+        self.assertEqual(list(actual_batch.frames["myvideo.id"]), [3, 8, 9])
+
     def test_select_and_aggregate(self):
         simple_aggregate_query = "SELECT COUNT(*), AVG(id) FROM MyVideo;"
         actual_batch = execute_query_fetch_all(self.evadb, simple_aggregate_query)
@@ -452,3 +468,29 @@ class SelectExecutorTest(unittest.TestCase):
             pd.DataFrame([{"dummynoinputfunction.label": "DummyNoInputFunction"}])
         )
         self.assertEqual(actual_batch, expected)
+
+    def test_should_decode_frames_at_function_input_resolution(self):
+        execute_query_fetch_all(
+            self.evadb,
+            f"LOAD VIDEO '{EvaDB_ROOT_DIR}/test/data/uadetrac/ua_detrac.mp4' INTO UADETRAC;",
+        )
+        execute_query_fetch_all(
+            self.evadb,
+            f"""CREATE FUNCTION IF NOT EXISTS LowResFlip
+                IMPL '{EvaDB_INSTALLATION_DIR}/functions/ndarray/horizontal_flip.py'
+                INPUT_RESOLUTION '160x96';""",
+        )
+        select_query = "SELECT LowResFlip(data) FROM UADETRAC WHERE id < 5;"
+        actual_batch = execute_query_fetch_all(self.evadb, select_query)
+        self.assertEqual(len(actual_batch), 5)
+        for frame in actual_batch.frames.iloc[:, 0]:
+            self.assertEqual(frame.shape, (96, 160, 3))
+
+        # the projected frames are decoded at their native resolution
+        select_query = "SELECT LowResFlip(data), data FROM UADETRAC WHERE id < 5;"
+        actual_batch = execute_query_fetch_all(self.evadb, select_query)
+        for frame in actual_batch.frames.iloc[:, 0]:
+            self.assertEqual(frame.shape, (540, 960, 3))
+
+        execute_query_fetch_all(self.evadb, "DROP FUNCTION LowResFlip;")
+        execute_query_fetch_all(self.evadb, "DROP TABLE UADETRAC;")
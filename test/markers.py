@@ -24,6 +24,7 @@ from evadb.utils.generic_utils import (
     is_gpu_available,
     is_ludwig_available,
     is_pinecone_available,
+    is_pyarrow_available,
     is_qdrant_available,
     is_sklearn_available,
 )
@@ -96,3 +97,8 @@ forecast_skip_marker = pytest.mark.skipif(
     is_forecast_available() is False,
     reason="Run only if forecasting packages available",
 )
+
+pyarrow_skip_marker = pytest.mark.skipif(
+    is_pyarrow_available() is False,
+    reason="Skipping since pyarrow is not installed",
+)
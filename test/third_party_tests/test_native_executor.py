@@ -121,6 +121,17 @@ class NativeExecutorTest(unittest.TestCase):
         self.assertEqual(res_batch.frames["test_table.name"][1], "bb")
         self.assertEqual(res_batch.frames["test_table.age"][1], 2)
 
+        # filter, projection, order by and limit run in the native database
+        res_batch = execute_query_fetch_all(
+            self.evadb,
+            """SELECT name FROM test_data_source.test_table
+                WHERE age > 0 AND comment != 'cccc'
+                ORDER BY age DESC LIMIT 1;""",
+        )
+        self.assertEqual(len(res_batch), 1)
+        self.assertEqual(list(res_batch.frames.columns), ["test_table.name"])
+        self.assertEqual(res_batch.frames["test_table.name"][0], "bb")
+
         self._create_evadb_table_using_select_query()
         self._create_native_table_using_select_query()
         self._drop_table_in_native_database()
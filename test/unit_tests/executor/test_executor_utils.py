@@ -0,0 +1,88 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from test.util import create_sample_video, file_remove
+from unittest.mock import patch
+
+import numpy as np
+
+from evadb.executor.executor_utils import (
+    get_media_validation_key,
+    validate_image,
+    validate_video,
+)
+from evadb.parser.types import FileFormatType
+
+
+class ExecutorUtilsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write_file(self, name: str, content: bytes) -> Path:
+        path = Path(self.tmp_dir.name) / name
+        path.write_bytes(content)
+        return path
+
+    def test_should_validate_video_from_container_header(self):
+        video_path = create_sample_video()
+        with patch("cv2.VideoCapture") as mock_capture:
+            self.assertTrue(validate_video(Path(video_path)))
+            # the container is identified without opening the file with opencv
+            mock_capture.assert_not_called()
+        file_remove("dummy.avi")
+
+    def test_should_reject_videos_with_only_a_container_header(self):
+        headers = [
+            b"\x00\x00\x00\x18ftypmp42",
+            b"RIFF\x00\x00\x00\x00AVI LIST",
+            b"\x1a\x45\xdf\xa3\x01\x00",
+            b"FLV\x01",
+            b"OggS\x00\x02",
+        ]
+        for idx, header in enumerate(headers):
+            # truncated files that decord cannot index
+            path = self._write_file(f"video_{idx}", header + bytes(4096))
+            self.assertFalse(validate_video(path))
+
+    def test_should_reject_invalid_videos(self):
+        self.assertFalse(validate_video(self._write_file("empty.mp4", b"")))
+        self.assertFalse(validate_video(self._write_file("text.mp4", b"not a video")))
+        self.assertFalse(validate_video(Path(self.tmp_dir.name) / "missing.mp4"))
+
+    def test_should_validate_image_from_header(self):
+        import cv2
+
+        path = str(Path(self.tmp_dir.name) / "image.jpg")
+        cv2.imwrite(path, np.zeros((8, 8, 3), dtype=np.uint8))
+        with patch("cv2.imread") as mock_imread:
+            self.assertTrue(validate_image(Path(path)))
+            mock_imread.assert_not_called()
+        self.assertFalse(validate_image(self._write_file("text.jpg", b"aa")))
+
+    def test_validation_key_should_change_with_file(self):
+        path = self._write_file("image.jpg", b"aa")
+        key = get_media_validation_key(path, FileFormatType.IMAGE)
+        self.assertEqual(key, get_media_validation_key(path, FileFormatType.IMAGE))
+        self.assertNotEqual(key, get_media_validation_key(path, FileFormatType.VIDEO))
+
+        path.write_bytes(b"aaa")
+        os.utime(path, ns=(0, 0))
+        self.assertNotEqual(key, get_media_validation_key(path, FileFormatType.IMAGE))
@@ -0,0 +1,78 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+import pandas as pd
+from mock import MagicMock, patch
+
+from evadb.catalog.catalog_type import TableType
+from evadb.catalog.sql_config import ROW_NUM_COLUMN
+from evadb.executor.executor_utils import ExecutorError
+from evadb.executor.storage_executor import StorageExecutor
+from evadb.models.storage.batch import Batch
+
+
+def _create_batch(row_numbers):
+    return Batch(pd.DataFrame({"id": row_numbers, ROW_NUM_COLUMN: row_numbers}))
+
+
+class StorageExecutorTest(unittest.TestCase):
+    def _read(self, executor, batches):
+        with patch.object(StorageExecutor, "_read", return_value=iter(batches)):
+            return list(executor.exec())
+
+    def test_should_track_progress(self):
+        executor = StorageExecutor(MagicMock(), MagicMock())
+        executor.track_progress()
+        batches = [_create_batch([1, 2]), _create_batch([3, 5])]
+        self.assertEqual(self._read(executor, batches), batches)
+        self.assertEqual(executor.last_row_number, 5)
+
+    def test_should_skip_rows_before_resume_row_number(self):
+        executor = StorageExecutor(MagicMock(), MagicMock())
+        executor.track_progress(resume_row_number=3)
+        batches = [_create_batch([1, 2]), _create_batch([3, 4, 5])]
+        self.assertEqual(self._read(executor, batches), [_create_batch([4, 5])])
+        self.assertEqual(executor.last_row_number, 5)
+
+    def test_should_raise_error_on_unordered_scan(self):
+        executor = StorageExecutor(MagicMock(), MagicMock())
+        executor.track_progress()
+        with self.assertRaises(ExecutorError):
+            self._read(executor, [_create_batch([3, 4]), _create_batch([1, 2])])
+
+        executor = StorageExecutor(MagicMock(), MagicMock())
+        executor.track_progress()
+        with self.assertRaises(ExecutorError):
+            self._read(executor, [_create_batch([2, 1])])
+
+    def test_should_report_if_rows_are_read_in_order(self):
+        node = MagicMock()
+        node.table.table_type = TableType.STRUCTURED_DATA
+        self.assertTrue(StorageExecutor(MagicMock(), node).reads_in_order())
+
+        node.table.table_type = TableType.NATIVE_DATA
+        self.assertFalse(StorageExecutor(MagicMock(), node).reads_in_order())
+
+        node.table.table_type = TableType.VIDEO_DATA
+        for is_scan_ordered in [True, False]:
+            with patch(
+                "evadb.executor.storage_executor.StorageEngine.factory"
+            ) as factory:
+                factory.return_value.is_scan_ordered.return_value = is_scan_ordered
+                self.assertEqual(
+                    StorageExecutor(MagicMock(), node).reads_in_order(),
+                    is_scan_ordered,
+                )
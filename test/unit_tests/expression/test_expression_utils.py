@@ -15,6 +15,8 @@
 import unittest
 from unittest.mock import Mock
 
+import numpy as np
+
 from evadb.expression.abstract_expression import ExpressionType
 from evadb.expression.arithmetic_expression import ArithmeticExpression
 from evadb.expression.comparison_expression import ComparisonExpression
@@ -22,6 +24,7 @@ from evadb.expression.constant_value_expression import ConstantValueExpression
 from evadb.expression.expression_utils import (
     conjunction_list_to_expression_tree,
     contains_single_column,
+    extract_range_list_from_column_values,
     extract_range_list_from_comparison_expr,
     extract_range_list_from_predicate,
     is_simple_predicate,
@@ -149,6 +152,53 @@ class ExpressionUtilsTest(unittest.TestCase):
             )
             extract_range_list_from_predicate(expr, 0, 100)
 
+    def test_extract_range_list_from_column_values(self):
+        column_values = {
+            "id": np.arange(8),
+            "seconds": np.array([0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5]),
+        }
+        # seconds > 1 AND seconds <= 2.5 -> (3, 5)
+        expr = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            self.gen_cmp_expr(1, name="seconds"),
+            self.gen_cmp_expr(2.5, ExpressionType.COMPARE_LEQ, name="seconds"),
+        )
+        self.assertEqual(
+            extract_range_list_from_column_values(expr, column_values), [(3, 5)]
+        )
+
+        # 1 > seconds OR id >= 6 -> [(0, 1), (6, 7)]
+        expr = LogicalExpression(
+            ExpressionType.LOGICAL_OR,
+            self.gen_cmp_expr(1, name="seconds", const_first=True),
+            self.gen_cmp_expr(6, ExpressionType.COMPARE_GEQ),
+        )
+        self.assertEqual(
+            extract_range_list_from_column_values(expr, column_values),
+            [(0, 1), (6, 7)],
+        )
+
+        # seconds != 1.5 AND id < 5 -> [(0, 2), (4, 4)]
+        expr = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            self.gen_cmp_expr(1.5, ExpressionType.COMPARE_NEQ, name="seconds"),
+            self.gen_cmp_expr(5, ExpressionType.COMPARE_LESSER),
+        )
+        self.assertEqual(
+            extract_range_list_from_column_values(expr, column_values),
+            [(0, 2), (4, 4)],
+        )
+
+        # seconds > 10 -> []
+        expr = self.gen_cmp_expr(10, name="seconds")
+        self.assertEqual(extract_range_list_from_column_values(expr, column_values), [])
+
+        with self.assertRaises(RuntimeError):
+            expr = ArithmeticExpression(
+                ExpressionType.AGGREGATION_COUNT, Mock(), Mock()
+            )
+            extract_range_list_from_column_values(expr, column_values)
+
     def test_predicate_contains_single_column(self):
         self.assertTrue(contains_single_column(self.gen_cmp_expr(10)))
         expr1 = LogicalExpression(
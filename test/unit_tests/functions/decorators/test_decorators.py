@@ -61,3 +61,15 @@ class DecoratorTests(unittest.TestCase):
         forward_func()
         self.assertEqual(forward_func.tags["input"], [input_type])
         self.assertEqual(forward_func.tags["output"], [output_type])
+        self.assertIsNone(forward_func.tags["input_resolution"])
+
+    def test_forward_input_resolution_is_updated(self):
+        @forward(
+            input_signatures=[NumpyArray(name="frame", type=NdArrayType.UINT8)],
+            output_signatures=[NumpyArray(name="label", type=NdArrayType.STR)],
+            input_resolution=(224, 224),
+        )
+        def forward_func():
+            pass
+
+        self.assertEqual(forward_func.tags["input_resolution"], (224, 224))
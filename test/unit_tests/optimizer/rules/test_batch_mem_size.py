@@ -57,4 +57,18 @@ class BatchMemSizeTest(unittest.TestCase):
         with patch.object(SQLStorageEngine, "read") as mock_read:
             mock_read.__iter__.return_value = []
             execute_query_fetch_all(self.evadb, select_table_query)
-            mock_read.assert_called_with(ANY, test_batch_mem_size)
+            mock_read.assert_called_with(
+                ANY,
+                test_batch_mem_size,
+                predicate=None,
+                columns=[
+                    "_row_id",
+                    "bbox",
+                    "dataset_name",
+                    "frame_id",
+                    "id",
+                    "label",
+                    "object_id",
+                    "video_id",
+                ],
+            )
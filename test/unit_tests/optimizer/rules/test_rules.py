@@ -18,12 +18,21 @@ from test.util import create_sample_video, get_evadb_for_testing
 import pytest
 from mock import MagicMock, patch
 
-from evadb.catalog.catalog_type import TableType
+from evadb.catalog.catalog_type import ColumnType, TableType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.expression_utils import conjunction_list_to_expression_tree
+from evadb.expression.function_expression import FunctionExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.optimizer.operators import (
     LogicalFilter,
     LogicalGet,
     LogicalJoin,
+    LogicalLimit,
+    LogicalOrderBy,
     LogicalSample,
 )
 from evadb.optimizer.rules.rules import (
@@ -32,6 +41,8 @@ from evadb.optimizer.rules.rules import (
     CacheFunctionExpressionInProject,
     CombineSimilarityOrderByAndLimitToVectorIndexScan,
     EmbedFilterIntoGet,
+    EmbedLimitIntoGet,
+    EmbedOrderByIntoGet,
     EmbedSampleIntoGet,
     LogicalApplyAndMergeToPhysical,
     LogicalApplyAndMergeToRayPhysical,
@@ -74,7 +85,8 @@ from evadb.optimizer.rules.rules import (
     XformLateralJoinToLinearFlow,
 )
 from evadb.optimizer.rules.rules_manager import RulesManager, disable_rules
-from evadb.parser.types import JoinType
+from evadb.parser.alias import Alias
+from evadb.parser.types import JoinType, ParserOrderBySortType
 from evadb.server.command_handler import execute_query_fetch_all
 from evadb.utils.generic_utils import is_ray_enabled_and_installed
 
@@ -100,6 +112,8 @@ class RulesTest(unittest.TestCase):
             Promise.LOGICAL_INNER_JOIN_COMMUTATIVITY,
             Promise.EMBED_FILTER_INTO_GET,
             Promise.EMBED_SAMPLE_INTO_GET,
+            Promise.EMBED_ORDERBY_INTO_GET,
+            Promise.EMBED_LIMIT_INTO_GET,
             Promise.XFORM_LATERAL_JOIN_TO_LINEAR_FLOW,
             Promise.PUSHDOWN_FILTER_THROUGH_JOIN,
             Promise.PUSHDOWN_FILTER_THROUGH_APPLY_AND_MERGE,
@@ -160,6 +174,8 @@ class RulesTest(unittest.TestCase):
             EmbedFilterIntoGet(),
             #    EmbedFilterIntoDerivedGet(),
             EmbedSampleIntoGet(),
+            EmbedOrderByIntoGet(),
+            EmbedLimitIntoGet(),
             XformLateralJoinToLinearFlow(),
             PushDownFilterThroughApplyAndMerge(),
             PushDownFilterThroughJoin(),
@@ -267,6 +283,93 @@ class RulesTest(unittest.TestCase):
         self.assertFalse(rewrite_opr is logi_get)
         self.assertEqual(rewrite_opr.predicate, predicate)
 
+    def test_embed_filter_into_get_with_structured_data(self):
+        rule = EmbedFilterIntoGet()
+        table_obj = TableCatalogEntry(
+            name="foo", table_type=TableType.STRUCTURED_DATA, file_url=MagicMock()
+        )
+        column = ColumnCatalogEntry("id", ColumnType.INTEGER)
+        id_pred = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            TupleValueExpression("id", "foo", col_object=column),
+            ConstantValueExpression(5),
+        )
+        func_pred = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            FunctionExpression(None, "Func"),
+            ConstantValueExpression(1),
+        )
+        predicate = conjunction_list_to_expression_tree([id_pred, func_pred])
+
+        logi_get = LogicalGet(MagicMock(), table_obj, Alias("foo"), columns=["id"])
+        logi_filter = LogicalFilter(predicate, [logi_get])
+        self.assertTrue(rule.check(logi_filter, MagicMock()))
+
+        rewrite_opr = next(rule.apply(logi_filter, MagicMock()))
+        # only the function expression is evaluated by the executor
+        self.assertIsInstance(rewrite_opr, LogicalFilter)
+        self.assertEqual(rewrite_opr.predicate, func_pred)
+        new_get = rewrite_opr.children[0]
+        self.assertEqual(new_get.predicate, id_pred)
+        self.assertEqual(new_get.columns, ["id"])
+
+        # nothing left to push down
+        self.assertFalse(rule.check(rewrite_opr, MagicMock()))
+
+    @patch("evadb.optimizer.rules.rules.is_storage_pushdown_supported")
+    def test_embed_orderby_and_limit_into_get_with_native_data(
+        self, pushdown_supported_mock
+    ):
+        pushdown_supported_mock.return_value = True
+        table_obj = TableCatalogEntry(
+            name="foo", table_type=TableType.NATIVE_DATA, file_url=MagicMock()
+        )
+        column = ColumnCatalogEntry("id", ColumnType.INTEGER)
+        orderby_list = [
+            (
+                TupleValueExpression("id", "foo", col_object=column),
+                ParserOrderBySortType.DESC,
+            )
+        ]
+        logi_get = LogicalGet(MagicMock(), table_obj, Alias("foo"), columns=["id"])
+
+        orderby_rule = EmbedOrderByIntoGet()
+        logi_orderby = LogicalOrderBy(orderby_list, [logi_get])
+        self.assertTrue(orderby_rule.check(logi_orderby, MagicMock()))
+        new_get = next(orderby_rule.apply(logi_orderby, MagicMock()))
+        self.assertEqual(new_get.orderby_list, orderby_list)
+        self.assertEqual(new_get.columns, ["id"])
+
+        limit_rule = EmbedLimitIntoGet()
+        logi_limit = LogicalLimit(ConstantValueExpression(10), [new_get])
+        self.assertTrue(limit_rule.check(logi_limit, MagicMock()))
+        new_get = next(limit_rule.apply(logi_limit, MagicMock()))
+        self.assertEqual(new_get.limit, 10)
+        self.assertEqual(new_get.orderby_list, orderby_list)
+
+        # the database cannot order the rows after applying the limit
+        logi_orderby = LogicalOrderBy(orderby_list, [new_get])
+        self.assertFalse(orderby_rule.check(logi_orderby, MagicMock()))
+
+        # function expressions are evaluated by the executor
+        logi_orderby = LogicalOrderBy(
+            [(FunctionExpression(None, "Func"), ParserOrderBySortType.ASC)],
+            [logi_get],
+        )
+        self.assertFalse(orderby_rule.check(logi_orderby, MagicMock()))
+
+    def test_embed_orderby_and_limit_into_get_does_not_work_with_structured_data(
+        self,
+    ):
+        table_obj = TableCatalogEntry(
+            name="foo", table_type=TableType.STRUCTURED_DATA, file_url=MagicMock()
+        )
+        logi_get = LogicalGet(MagicMock(), table_obj, Alias("foo"))
+        logi_orderby = LogicalOrderBy(MagicMock(), [logi_get])
+        logi_limit = LogicalLimit(ConstantValueExpression(10), [logi_get])
+        self.assertFalse(EmbedOrderByIntoGet().check(logi_orderby, MagicMock()))
+        self.assertFalse(EmbedLimitIntoGet().check(logi_limit, MagicMock()))
+
     def test_embed_sample_into_get_does_not_work_with_structured_data(self):
         rule = EmbedSampleIntoGet()
 
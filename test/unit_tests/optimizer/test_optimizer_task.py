@@ -95,7 +95,9 @@ class TestOptimizerTask(unittest.TestCase):
     def test_nested_implementation(self):
         child_predicate = MagicMock()
         root_predicate = MagicMock()
-        with patch("evadb.optimizer.rules.rules.extract_pushdown_predicate") as mock:
+        with patch(
+            "evadb.optimizer.rules.rules.extract_pushdown_predicate_for_video"
+        ) as mock:
             with patch("evadb.optimizer.rules.rules.is_video_table") as mock_vid:
                 mock_vid.return_value = True
                 mock.side_effect = [
@@ -15,7 +15,18 @@
 import unittest
 
 from evadb.catalog.catalog_type import ColumnType, NdArrayType
-from evadb.optimizer.optimizer_utils import column_definition_to_function_io
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.expression_utils import conjunction_list_to_expression_tree
+from evadb.expression.function_expression import FunctionExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.optimizer.optimizer_utils import (
+    column_definition_to_function_io,
+    extract_pushdown_predicate_for_storage,
+    extract_pushdown_predicate_for_video,
+)
 from evadb.parser.create_statement import ColumnDefinition
 
 
@@ -45,3 +56,80 @@ class OptimizerUtilsTest(unittest.TestCase):
             self.assertEqual(io.array_dimensions, (None, None, None))
             self.assertEqual(io.is_input, True)
             self.assertEqual(io.function_id, None)
+
+    def test_extract_pushdown_predicate_for_storage(self):
+        column = ColumnCatalogEntry("id", ColumnType.INTEGER)
+        feature = ColumnCatalogEntry(
+            "feature", ColumnType.NDARRAY, False, NdArrayType.FLOAT32, [3]
+        )
+        id_pred = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            TupleValueExpression("id", "t", col_object=column),
+            ConstantValueExpression(5),
+        )
+        func_pred = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            FunctionExpression(None, "Func"),
+            ConstantValueExpression(1),
+        )
+        feature_pred = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            TupleValueExpression("feature", "t", col_object=feature),
+            ConstantValueExpression(1),
+        )
+        predicate = conjunction_list_to_expression_tree(
+            [id_pred, func_pred, feature_pred]
+        )
+
+        pushdown_pred, rem_pred = extract_pushdown_predicate_for_storage(predicate, "t")
+        self.assertEqual(pushdown_pred, id_pred)
+        self.assertEqual(
+            rem_pred, conjunction_list_to_expression_tree([func_pred, feature_pred])
+        )
+
+        # predicates on other tables are not pushed
+        pushdown_pred, rem_pred = extract_pushdown_predicate_for_storage(
+            id_pred, "other"
+        )
+        self.assertIsNone(pushdown_pred)
+        self.assertEqual(rem_pred, id_pred)
+
+    def test_extract_pushdown_predicate_for_video(self):
+        def cmp_expr(name, value, alias="v"):
+            return ComparisonExpression(
+                ExpressionType.COMPARE_GREATER,
+                TupleValueExpression(name, alias, col_alias=f"{alias}.{name}"),
+                ConstantValueExpression(value),
+            )
+
+        id_pred = cmp_expr("id", 5)
+        seconds_pred = cmp_expr("seconds", 2.5)
+        data_pred = cmp_expr("data", 1)
+        func_pred = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            FunctionExpression(None, "Func"),
+            ConstantValueExpression(1),
+        )
+        predicate = conjunction_list_to_expression_tree(
+            [seconds_pred, func_pred, id_pred, data_pred]
+        )
+
+        pushdown_pred, rem_pred = extract_pushdown_predicate_for_video(predicate, "v")
+        self.assertEqual(
+            pushdown_pred, conjunction_list_to_expression_tree([id_pred, seconds_pred])
+        )
+        self.assertEqual(
+            rem_pred, conjunction_list_to_expression_tree([func_pred, data_pred])
+        )
+
+        pushdown_pred, rem_pred = extract_pushdown_predicate_for_video(
+            seconds_pred, "v"
+        )
+        self.assertEqual(pushdown_pred, seconds_pred)
+        self.assertIsNone(rem_pred)
+
+        # predicates on other tables are not pushed
+        pushdown_pred, rem_pred = extract_pushdown_predicate_for_video(
+            cmp_expr("seconds", 2.5, alias="w"), "v"
+        )
+        self.assertIsNone(pushdown_pred)
@@ -15,7 +15,12 @@
 import unittest
 from pathlib import Path
 
-from evadb.catalog.catalog_type import ColumnType, NdArrayType, VectorStoreType
+from evadb.catalog.catalog_type import (
+    ColumnType,
+    NdArrayType,
+    TableType,
+    VectorStoreType,
+)
 from evadb.expression.abstract_expression import ExpressionType
 from evadb.expression.comparison_expression import ComparisonExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
@@ -334,6 +339,28 @@ class ParserTests(unittest.TestCase):
         self.assertEqual(len(evadb_statement_list), 1)
         self.assertIsInstance(evadb_statement_list[0], AbstractStatement)
 
+    def test_create_table_statement_with_columnar_storage(self):
+        parser = Parser()
+        query = "CREATE TABLE Dummy (id INTEGER, name TEXT(10)) STORAGE COLUMNAR;"
+        create_stmt = parser.parse(query)[0]
+        self.assertEqual(create_stmt.table_type, TableType.COLUMNAR_DATA)
+        self.assertEqual(len(create_stmt.column_list), 2)
+
+        query = "CREATE TABLE Dummy (id INTEGER);"
+        self.assertEqual(parser.parse(query)[0].table_type, TableType.STRUCTURED_DATA)
+        self.assertNotEqual(parser.parse(query)[0], create_stmt)
+
+        select_query = "SELECT id FROM MyVideo;"
+        query = f"CREATE TABLE Dummy STORAGE COLUMNAR AS {select_query}"
+        expected_stmt = CreateTableStatement(
+            TableInfo("Dummy"),
+            False,
+            [],
+            parser.parse(select_query)[0],
+            table_type=TableType.COLUMNAR_DATA,
+        )
+        self.assertEqual(parser.parse(query)[0], expected_stmt)
+
     def test_create_table_statement_without_proper_datatype(self):
         parser = Parser()
         query = """CREATE TABLE IF NOT EXISTS Dummy (
@@ -912,6 +939,17 @@ class ParserTests(unittest.TestCase):
         load_data_stmt = evadb_statement_list[0]
         self.assertEqual(load_data_stmt, expected_stmt)
 
+    def test_load_incremental_statement(self):
+        parser = Parser()
+        load_data_query = """LOAD VIDEO 'data/*.mp4' INTO MyVideo INCREMENTAL;"""
+        file_options = {"file_format": FileFormatType.VIDEO, "incremental": True}
+        expected_stmt = LoadDataStatement(
+            TableInfo("MyVideo"), Path("data/*.mp4"), None, file_options
+        )
+        load_data_stmt = parser.parse(load_data_query)[0]
+        self.assertEqual(load_data_stmt, expected_stmt)
+        self.assertNotEqual(load_data_stmt, parser.parse(load_data_query[:-13])[0])
+
     def test_load_csv_data_statement(self):
         parser = Parser()
         load_data_query = """LOAD CSV 'data/meta.csv'
@@ -15,8 +15,14 @@
 import unittest
 from test.util import create_dummy_csv_batches, create_sample_csv, file_remove
 
+import numpy as np
+import pandas as pd
+
+from evadb.catalog.catalog_type import ColumnType, NdArrayType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.expression.tuple_value_expression import TupleValueExpression
-from evadb.readers.csv_reader import CSVReader
+from evadb.models.storage.batch import Batch
+from evadb.readers.csv_reader import CSVReader, convert_csv_strings_to_ndarrays
 
 
 class CSVLoaderTest(unittest.TestCase):
@@ -47,3 +53,41 @@ class CSVLoaderTest(unittest.TestCase):
 
         # assert batches are equal
         self.assertEqual(batches, expected)
+
+    def test_should_return_chunks_sized_by_batch_mem_size(self):
+        bbox = ColumnCatalogEntry(
+            "bbox", ColumnType.NDARRAY, False, NdArrayType.FLOAT32, [4]
+        )
+        column_list = [
+            TupleValueExpression(name="id", table_alias="dummy"),
+            TupleValueExpression(name="bbox", table_alias="dummy", col_object=bbox),
+        ]
+        expected = list(create_dummy_csv_batches(target_columns=["id", "bbox"]))[0]
+        row_size = pd.read_csv(self.csv_file_path, usecols=["id", "bbox"]).memory_usage(
+            deep=True
+        ).sum() / len(expected)
+
+        csv_loader = CSVReader(
+            file_url=self.csv_file_path,
+            column_list=column_list,
+            batch_mem_size=int(row_size * 8) + 1,
+        )
+        batches = list(csv_loader.read())
+        self.assertEqual([len(batch) for batch in batches], [8, 8, 4])
+
+        actual = Batch.concat(batches)
+        self.assertEqual(list(actual.frames["id"]), list(expected.frames["id"]))
+        for actual_bbox, expected_bbox in zip(
+            actual.frames["bbox"], expected.frames["bbox"]
+        ):
+            self.assertEqual(actual_bbox.dtype, np.float32)
+            np.testing.assert_array_equal(actual_bbox, expected_bbox)
+
+    def test_should_convert_csv_strings_to_ndarrays(self):
+        arrays = convert_csv_strings_to_ndarrays(pd.Series(["1,2", "3.5,4"]))
+        np.testing.assert_array_equal(arrays, [[1, 2], [3.5, 4]])
+        # the arrays of the same length share one buffer
+        self.assertIs(arrays[0].base, arrays[1].base)
+
+        arrays = convert_csv_strings_to_ndarrays(pd.Series(["1", "2,3,4", "5,6"]))
+        self.assertEqual([list(array) for array in arrays], [[1], [2, 3, 4], [5, 6]])
@@ -12,7 +12,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import tempfile
 import unittest
+import wave
 from test.util import (
     FRAME_SIZE,
     NUM_FRAMES,
@@ -20,6 +23,7 @@ from test.util import (
     create_sample_video,
     file_remove,
 )
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -31,7 +35,8 @@ from evadb.expression.comparison_expression import ComparisonExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
 from evadb.expression.logical_expression import LogicalExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
-from evadb.readers.decord_reader import DecordReader
+from evadb.readers.decord_reader import DecordReader, get_video_index
+from evadb.storage.frame_cache import FrameCache
 from evadb.utils.generic_utils import try_to_import_decord
 
 
@@ -131,6 +136,52 @@ class DecordLoaderTest(unittest.TestCase):
             )
         self.assertEqual(batches, expected)
 
+    def test_should_read_frames_with_predicate_on_seconds(self):
+        # the frames of the sample video are 0.1 seconds apart
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            ComparisonExpression(
+                ExpressionType.COMPARE_GREATER,
+                left=TupleValueExpression("seconds"),
+                right=ConstantValueExpression(0.25),
+            ),
+            ComparisonExpression(
+                ExpressionType.COMPARE_LESSER,
+                left=TupleValueExpression("seconds"),
+                right=ConstantValueExpression(0.65),
+            ),
+        )
+        for k in range(1, 3):
+            video_loader = DecordReader(
+                file_url=self.video_file_url,
+                sampling_rate=k,
+                predicate=predicate,
+            )
+            batches = list(video_loader.read())
+            expected = self._batches_to_reader_convertor(
+                create_dummy_batches(
+                    filters=[i for i in range(4 if k == 2 else 3, 7, k)],
+                    is_from_storage=True,
+                )
+            )
+            self.assertEqual(batches, expected)
+
+        # predicates on the frame id and seconds are combined
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            predicate,
+            ComparisonExpression(
+                ExpressionType.COMPARE_NEQ,
+                left=TupleValueExpression("id"),
+                right=ConstantValueExpression(5),
+            ),
+        )
+        video_loader = DecordReader(
+            file_url=self.video_file_url, predicate=predicate, read_video=False
+        )
+        frame_ids = [i for batch in video_loader.read() for i in batch.frames["id"]]
+        self.assertEqual(frame_ids, [3, 4, 6])
+
     def test_should_return_one_batch(self):
         video_loader = DecordReader(
             file_url=self.video_file_url,
@@ -152,6 +203,142 @@ class DecordLoaderTest(unittest.TestCase):
         )
         self.assertEqual(batches, expected)
 
+    def test_should_decode_frames_in_blocks(self):
+        video_loader = DecordReader(
+            file_url=self.video_file_url,
+            batch_mem_size=self.frame_size * 4,
+        )
+        batches = list(video_loader.read())
+        self.assertEqual(sum(len(batch) for batch in batches), NUM_FRAMES)
+        for batch in batches:
+            frames = batch.frames["data"]
+            # the frames of a batch are views into one decoded block
+            self.assertTrue(all(frame.base is frames[0].base for frame in frames))
+            self.assertEqual(frames[0].base.shape[0], len(batch))
+
+    def test_should_size_blocks_without_decoding_frames_twice(self):
+        video_loader = DecordReader(
+            file_url=self.video_file_url,
+            batch_mem_size=self.frame_size * 4,
+        )
+        reader = video_loader._reader
+        with patch.object(
+            type(reader), "__getitem__", wraps=reader.__getitem__
+        ) as getitem_mock:
+            batches = list(video_loader.read())
+        # only the dimensions of the frames are read outside of the blocks
+        getitem_mock.assert_called_once_with(0)
+        self.assertEqual(sum(len(batch) for batch in batches), NUM_FRAMES)
+
+        # the dimensions are known from the resolution the frames are
+        # decoded at
+        video_loader = DecordReader(
+            file_url=self.video_file_url,
+            batch_mem_size=self.frame_size * 4,
+            resolution=FRAME_SIZE,
+        )
+        reader = video_loader._reader
+        with patch.object(type(reader), "__getitem__", side_effect=AssertionError):
+            batches = list(video_loader.read())
+        self.assertEqual(sum(len(batch) for batch in batches), NUM_FRAMES)
+
+    def test_should_read_metadata_without_decoding_frames(self):
+        video_loader = DecordReader(
+            file_url=self.video_file_url,
+            sampling_rate=2,
+            read_video=False,
+        )
+        with patch.object(
+            video_loader._reader, "get_batch", side_effect=AssertionError
+        ):
+            batches = list(video_loader.read())
+        expected = self._batches_to_reader_convertor(
+            create_dummy_batches(
+                filters=[i for i in range(0, NUM_FRAMES, 2)], is_from_storage=True
+            )
+        )
+        self.assertEqual(len(batches), len(expected))
+        for batch, expected_batch in zip(batches, expected):
+            for column in ["id", "_row_number", "seconds"]:
+                self.assertEqual(
+                    list(batch.frames[column]), list(expected_batch.frames[column])
+                )
+            self.assertTrue(all(frame.size == 0 for frame in batch.frames["data"]))
+
+    def test_should_read_metadata_from_video_index(self):
+        video_index = get_video_index(self.video_file_url)
+        self.assertEqual(video_index["num_frames"], NUM_FRAMES)
+        self.assertEqual(len(video_index["timestamps"]), NUM_FRAMES)
+
+        expected = self._batches_to_reader_convertor(
+            create_dummy_batches(
+                filters=[i for i in range(0, NUM_FRAMES, 2)], is_from_storage=True
+            )
+        )
+        # the video file is not opened
+        with patch("decord.VideoReader", side_effect=AssertionError):
+            video_loader = DecordReader(
+                file_url=self.video_file_url,
+                sampling_rate=2,
+                read_video=False,
+                video_index=video_index,
+            )
+            batches = list(video_loader.read())
+        self.assertEqual(len(batches), len(expected))
+        for batch, expected_batch in zip(batches, expected):
+            for column in ["id", "_row_number", "seconds"]:
+                self.assertEqual(
+                    list(batch.frames[column]), list(expected_batch.frames[column])
+                )
+            self.assertEqual(batch.frames["seconds"].dtype, np.float64)
+
+        # indexes with float32 timestamps are read as float64 as well
+        video_index["timestamps"] = video_index["timestamps"].astype(np.float32)
+        video_loader = DecordReader(
+            file_url=self.video_file_url, read_video=False, video_index=video_index
+        )
+        batch = next(video_loader.read())
+        self.assertEqual(batch.frames["seconds"].dtype, np.float64)
+        self.assertEqual(list(batch.frames["seconds"][:3]), [0.0, 0.1, 0.2])
+
+        # the key frames are read from the index
+        video_index["key_indices"] = np.array([0, 4, 8])
+        video_loader = DecordReader(
+            file_url=self.video_file_url,
+            sampling_type=IFRAMES,
+            video_index=video_index,
+        )
+        frame_ids = [i for batch in video_loader.read() for i in batch.frames["id"]]
+        self.assertEqual(frame_ids, [0, 4, 8])
+
+    def test_should_read_frames_from_frame_cache(self):
+        expected = self._batches_to_reader_convertor(
+            create_dummy_batches(
+                filters=[i for i in range(0, NUM_FRAMES, 3)], is_from_storage=True
+            )
+        )
+        with tempfile.TemporaryDirectory() as cache_dir:
+            frame_cache = FrameCache(cache_dir, max_size=2**30, segment_size=4)
+            for _ in range(2):
+                video_loader = DecordReader(
+                    file_url=self.video_file_url,
+                    sampling_rate=3,
+                    frame_cache=frame_cache,
+                )
+                batches = list(video_loader.read())
+                self.assertEqual(batches, expected)
+
+            # the sampled reads cached every segment of the video
+            video_loader = DecordReader(
+                file_url=self.video_file_url, frame_cache=frame_cache
+            )
+            reader = video_loader._reader
+            with patch.object(
+                reader, "get_batch", side_effect=AssertionError
+            ), patch.object(type(reader), "__getitem__", side_effect=AssertionError):
+                batches = list(video_loader.read())
+            self.assertEqual(sum(len(batch) for batch in batches), NUM_FRAMES)
+
     def test_should_sample_every_k_frame(self):
         for k in range(1, 10):
             video_loader = DecordReader(
@@ -231,3 +418,69 @@ class DecordLoaderTest(unittest.TestCase):
             )
         # verify that no video frame was read
         self.assertEqual(batches.iloc[0]["data"].shape, (0,))
+
+    def test_should_return_audio_chunks(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # 5.5 seconds of 8kHz mono audio, sample i has the value i
+            audio_file_url = os.path.join(tmp_dir, "audio.wav")
+            samples = np.arange(44000, dtype=np.int16)
+            with wave.open(audio_file_url, "wb") as audio_file:
+                audio_file.setnchannels(1)
+                audio_file.setsampwidth(2)
+                audio_file.setframerate(8000)
+                audio_file.writeframes(samples.tobytes())
+            expected_audio = samples / 32768.0
+
+            video_loader = DecordReader(
+                file_url=audio_file_url,
+                sampling_type=AUDIORATE,
+                sampling_rate=8000,
+                read_audio=True,
+                audio_chunk_duration=2,
+                audio_chunk_overlap=0.5,
+            )
+            batches = list(video_loader.read())
+            # segments start every 1.5 seconds, the last one is shorter
+            self.assertEqual(len(batches), 4)
+            for i, batch in enumerate(batches):
+                self.assertEqual(len(batch), 1)
+                row = batch.frames.iloc[0]
+                self.assertEqual(row["id"], i)
+                self.assertEqual(row["_row_number"], i)
+                self.assertEqual(row["seconds"], 1.5 * i)
+                self.assertEqual(row["data"].shape, (0,))
+                np.testing.assert_allclose(
+                    row["audio"], expected_audio[12000 * i : 12000 * i + 16000]
+                )
+            self.assertEqual(len(batches[-1].frames.iloc[0]["audio"]), 8000)
+
+            # the predicate on the timestamps selects the segments to decode
+            predicate = ComparisonExpression(
+                ExpressionType.COMPARE_GEQ,
+                TupleValueExpression(name="seconds"),
+                ConstantValueExpression(3),
+            )
+            video_loader = DecordReader(
+                file_url=audio_file_url,
+                sampling_type=AUDIORATE,
+                sampling_rate=8000,
+                read_audio=True,
+                audio_chunk_duration=2,
+                audio_chunk_overlap=0.5,
+                predicate=predicate,
+            )
+            self.assertEqual(
+                [batch.frames.iloc[0]["id"] for batch in video_loader.read()], [2, 3]
+            )
+
+    def test_should_throw_error_when_audio_chunk_overlap_is_too_long(self):
+        with self.assertRaises(AssertionError) as error_context:
+            DecordReader(
+                file_url=self.video_file_url,
+                read_audio=True,
+                audio_chunk_duration=1,
+                audio_chunk_overlap=1,
+            )
+        self.assertIn(
+            "Audio chunk overlap must be shorter", error_context.exception.args[0]
+        )
@@ -0,0 +1,153 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import shutil
+import unittest
+from test.markers import pyarrow_skip_marker
+from test.util import (
+    NUM_FRAMES,
+    create_dummy_batches,
+    get_evadb_for_testing,
+    suffix_pytest_xdist_worker_id_to_dir,
+)
+
+import pytest
+
+from evadb.catalog.catalog_type import ColumnType, NdArrayType, TableType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.storage.columnar_storage_engine import ColumnarStorageEngine
+
+
+@pyarrow_skip_marker
+@pytest.mark.notparallel
+class ColumnarStorageEngineTest(unittest.TestCase):
+    def create_sample_table(self):
+        table_info = TableCatalogEntry(
+            "dataset",
+            str(suffix_pytest_xdist_worker_id_to_dir("columnar_dataset")),
+            table_type=TableType.COLUMNAR_DATA,
+        )
+        column_pk = ColumnCatalogEntry(
+            IDENTIFIER_COLUMN, ColumnType.INTEGER, is_nullable=False
+        )
+        column_0 = ColumnCatalogEntry("name", ColumnType.TEXT, is_nullable=False)
+        column_1 = ColumnCatalogEntry("id", ColumnType.INTEGER, is_nullable=False)
+        column_2 = ColumnCatalogEntry(
+            "data", ColumnType.NDARRAY, False, NdArrayType.UINT8, [2, 2, 3]
+        )
+        table_info.columns = [column_pk, column_0, column_1, column_2]
+        return table_info
+
+    def setUp(self):
+        self.table = self.create_sample_table()
+        self.evadb = get_evadb_for_testing()
+        self.engine = ColumnarStorageEngine(self.evadb)
+        self.engine.create(self.table)
+
+    def tearDown(self):
+        shutil.rmtree(
+            suffix_pytest_xdist_worker_id_to_dir("columnar_dataset"),
+            ignore_errors=True,
+        )
+
+    def write_dummy_batches(self):
+        dummy_batches = list(create_dummy_batches())
+        # drop the _row_id
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            self.engine.write(self.table, batch)
+        return dummy_batches
+
+    def test_should_create_empty_table(self):
+        records = list(self.engine.read(self.table, batch_mem_size=3000))
+        self.assertEqual(len(records), 0)
+        with self.assertRaises(FileExistsError):
+            self.engine.create(self.table)
+        self.engine.drop(self.table)
+        self.assertFalse(os.path.exists(self.table.file_url))
+
+    def test_should_write_rows_to_table(self):
+        dummy_batches = self.write_dummy_batches()
+        # every write is a new part file
+        part_files = os.listdir(self.table.file_url)
+        self.assertEqual(len(part_files), len(dummy_batches))
+
+        read_batches = list(self.engine.read(self.table))
+        self.assertEqual(sum(len(batch) for batch in read_batches), NUM_FRAMES)
+        frames = [row for batch in read_batches for _, row in batch.frames.iterrows()]
+        expected = [
+            row for batch in dummy_batches for _, row in batch.frames.iterrows()
+        ]
+        for expected_row, row in zip(expected, frames):
+            self.assertEqual(expected_row["id"], row["id"])
+            self.assertEqual(expected_row["name"], row["name"])
+            self.assertTrue((expected_row["data"] == row["data"]).all())
+
+        row_ids = [
+            row_id for batch in read_batches for row_id in batch.frames[ROW_NUM_COLUMN]
+        ]
+        self.assertEqual(row_ids, list(range(1, NUM_FRAMES + 1)))
+        self.engine.drop(self.table)
+
+    def test_should_read_rows_in_batches_of_batch_mem_size(self):
+        self.write_dummy_batches()
+        read_batches = list(self.engine.read(self.table, batch_mem_size=15000))
+        self.assertGreater(len(read_batches), 1)
+        self.assertEqual(sum(len(batch) for batch in read_batches), NUM_FRAMES)
+        ids = [id for batch in read_batches for id in batch.frames["id"]]
+        self.assertEqual(ids, list(range(NUM_FRAMES)))
+        self.engine.drop(self.table)
+
+    def test_should_push_predicate_and_columns_into_scan(self):
+        self.write_dummy_batches()
+        # id >= 3 AND id < 7
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            ComparisonExpression(
+                ExpressionType.COMPARE_GEQ,
+                TupleValueExpression(name="id"),
+                ConstantValueExpression(3),
+            ),
+            ComparisonExpression(
+                ExpressionType.COMPARE_LESSER,
+                TupleValueExpression(name="id"),
+                ConstantValueExpression(7),
+            ),
+        )
+        read_batches = list(
+            self.engine.read(self.table, predicate=predicate, columns=["id"])
+        )
+        ids = [id for batch in read_batches for id in batch.frames["id"]]
+        self.assertEqual(ids, [3, 4, 5, 6])
+        # the row id is always read
+        self.assertEqual(
+            set(read_batches[0].columns), {IDENTIFIER_COLUMN, "id", ROW_NUM_COLUMN}
+        )
+        self.engine.drop(self.table)
+
+    def test_should_not_support_delete_and_rename(self):
+        with self.assertRaises(Exception):
+            self.engine.delete(self.table, None)
+        with self.assertRaises(Exception):
+            self.engine.rename(self.table, None)
+        self.engine.drop(self.table)
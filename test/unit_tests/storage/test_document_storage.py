@@ -0,0 +1,88 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import unittest
+from test.util import get_evadb_for_testing
+
+import pandas as pd
+import pytest
+
+from evadb.catalog.sql_config import ROW_NUM_MAGIC
+from evadb.configuration.constants import EvaDB_ROOT_DIR
+from evadb.models.storage.batch import Batch
+from evadb.server.command_handler import execute_query_fetch_all
+from evadb.storage.storage_engine import StorageEngine
+
+read_pages = []
+
+
+def _read_pages(file_path: str):
+    # one batch per page, the pid tells where the file was parsed
+    for page in range(3):
+        read_pages.append((file_path, page))
+        yield Batch(
+            pd.DataFrame({"page": [page], "pid": [os.getpid()], "_row_number": [page]})
+        )
+
+
+@pytest.mark.notparallel
+class PDFStorageEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.evadb = get_evadb_for_testing()
+        self.evadb.catalog().reset()
+        self.pdf_files = [
+            f"{EvaDB_ROOT_DIR}/data/documents/one_page.pdf",
+            f"{EvaDB_ROOT_DIR}/data/documents/state_of_the_union.pdf",
+        ]
+        for pdf_file in self.pdf_files:
+            execute_query_fetch_all(self.evadb, f"LOAD PDF '{pdf_file}' INTO MyPDFs;")
+        self.table = self.evadb.catalog().get_table_catalog_entry("MyPDFs")
+        self.pdf_engine = StorageEngine.factory(self.evadb, self.table)
+        read_pages.clear()
+
+    def tearDown(self):
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyPDFs;")
+
+    def test_should_stream_files_in_process(self):
+        batches = self.pdf_engine._read_media_files(
+            self.table, _read_pages, batch_mem_size=1, num_workers=1
+        )
+        batch = next(batches)
+        self.assertEqual(list(batch.frames["page"]), [0])
+        self.assertEqual(batch.frames["pid"][0], os.getpid())
+        # the scan stops in the middle of the first file
+        batches.close()
+        self.assertEqual(read_pages, [(read_pages[0][0], 0)])
+
+    def test_should_parse_small_files_in_workers(self):
+        # only the one page pdf is small enough to be parsed in a worker
+        batch_mem_size = os.path.getsize(self.pdf_files[0])
+        batches = list(
+            self.pdf_engine._read_media_files(
+                self.table, _read_pages, batch_mem_size=batch_mem_size, num_workers=2
+            )
+        )
+        frames = Batch.concat(batches).frames
+        self.assertEqual(list(frames["page"]), [0, 1, 2] * 2)
+        self.assertEqual(
+            list(frames["name"]), [self.pdf_files[0]] * 3 + [self.pdf_files[1]] * 3
+        )
+        pids = list(frames["pid"])
+        self.assertNotIn(os.getpid(), pids[:3])
+        self.assertEqual(pids[3:], [os.getpid()] * 3)
+        self.assertEqual(
+            list(frames["_row_number"]),
+            [row_id * ROW_NUM_MAGIC + page for row_id in [1, 2] for page in range(3)],
+        )
@@ -0,0 +1,76 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from evadb.storage.frame_cache import FrameCache
+
+
+class FrameCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp_dir.name, "frame_cache")
+        self.video_file = os.path.join(self.tmp_dir.name, "video.mp4")
+        Path(self.video_file).write_bytes(b"video")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _segment(self, value):
+        return np.full((4, 2, 2, 3), value, dtype=np.uint8)
+
+    def test_should_serve_segments_from_mmap(self):
+        cache = FrameCache(self.cache_dir, max_size=2**20, segment_size=4)
+        video_key = cache.get_video_key(self.video_file, (-1, -1))
+        self.assertIsNone(cache.get_segment(video_key, 0))
+
+        cache.put_segment(video_key, 0, self._segment(1))
+        segment = cache.get_segment(video_key, 0)
+        self.assertIsInstance(segment, np.memmap)
+        np.testing.assert_array_equal(segment, self._segment(1))
+
+        # the mapping is copy-on-write
+        segment[0] = 5
+        np.testing.assert_array_equal(cache.get_segment(video_key, 0), self._segment(1))
+
+    def test_video_key_should_depend_on_file_and_resolution(self):
+        cache = FrameCache(self.cache_dir, max_size=2**20, segment_size=4)
+        video_key = cache.get_video_key(self.video_file, (-1, -1))
+        self.assertNotEqual(video_key, cache.get_video_key(self.video_file, (64, 64)))
+
+        Path(self.video_file).write_bytes(b"new video")
+        self.assertNotEqual(video_key, cache.get_video_key(self.video_file, (-1, -1)))
+
+    def test_should_evict_least_recently_used_segments(self):
+        segment_bytes = self._segment(0).nbytes + 128
+        cache = FrameCache(self.cache_dir, max_size=2 * segment_bytes, segment_size=4)
+        video_key = cache.get_video_key(self.video_file, (-1, -1))
+        cache.put_segment(video_key, 0, self._segment(0))
+        time.sleep(0.01)
+        cache.put_segment(video_key, 1, self._segment(1))
+        time.sleep(0.01)
+        # segment 0 becomes the most recently used
+        self.assertIsNotNone(cache.get_segment(video_key, 0))
+        time.sleep(0.01)
+        cache.put_segment(video_key, 2, self._segment(2))
+
+        self.assertIsNotNone(cache.get_segment(video_key, 0))
+        self.assertIsNone(cache.get_segment(video_key, 1))
+        self.assertIsNotNone(cache.get_segment(video_key, 2))
@@ -0,0 +1,75 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import glob
+import unittest
+from test.util import get_evadb_for_testing
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from evadb.configuration.constants import EvaDB_ROOT_DIR
+from evadb.readers.image.opencv_image_reader import read_image
+from evadb.server.command_handler import execute_query_fetch_all
+from evadb.storage.storage_engine import StorageEngine
+
+
+@pytest.mark.notparallel
+class ImageStorageEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.evadb = get_evadb_for_testing()
+        self.evadb.catalog().reset()
+        image_files_path = (
+            f"{EvaDB_ROOT_DIR}/test/data/uadetrac/small-data/MVI_20011/*.jpg"
+        )
+        self.image_files = sorted(glob.glob(image_files_path))
+        execute_query_fetch_all(
+            self.evadb, f"LOAD IMAGE '{image_files_path}' INTO MyImages;"
+        )
+        self.table = self.evadb.catalog().get_table_catalog_entry("MyImages")
+        self.image_engine = StorageEngine.factory(self.evadb, self.table)
+
+    def tearDown(self):
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyImages;")
+
+    def test_should_read_images_in_batches(self):
+        image_size = read_image(self.image_files[0]).nbytes
+        batches = list(self.image_engine.read(self.table, 4 * image_size))
+        self.assertEqual(
+            [len(batch) for batch in batches],
+            [4, 4, len(self.image_files) - 8],
+        )
+
+        file_names = [name for batch in batches for name in batch.frames["name"]]
+        self.assertEqual(sorted(file_names), self.image_files)
+        for batch in batches:
+            frames = batch.frames["data"]
+            # images of the same shape share one stacked array
+            self.assertTrue(all(frame.base is frames[0].base for frame in frames))
+            for name, frame in zip(batch.frames["name"], frames):
+                np.testing.assert_array_equal(frame, read_image(name))
+            self.assertEqual(
+                list(batch.frames["_row_id"]), list(batch.frames["_row_number"])
+            )
+
+    def test_should_stop_decoding_when_scan_is_closed(self):
+        with patch(
+            "evadb.storage.image_storage_engine.read_image", side_effect=read_image
+        ) as mock_read_image:
+            image_size = read_image(self.image_files[0]).nbytes
+            batches = self.image_engine.read(self.table, image_size)
+            self.assertEqual(len(next(batches)), 1)
+            batches.close()
+            self.assertLess(mock_read_image.call_count, len(self.image_files))
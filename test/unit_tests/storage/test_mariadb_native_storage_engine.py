@@ -22,6 +22,7 @@ import pytest
 
 from evadb.catalog.models.utils import DatabaseCatalogEntry
 from evadb.server.command_handler import execute_query_fetch_all
+from evadb.third_party.databases.interface import clear_database_handler_pool
 
 
 class NativeQueryResponse:
@@ -76,6 +77,7 @@ class MariaDbStorageEngineTest(unittest.TestCase):
         )
 
     def tearDown(self):
+        clear_database_handler_pool("mariadb", **self.get_mariadb_params())
         self.get_database_catalog_entry_patcher.stop()
         self.execute_native_query_patcher.stop()
         self.connect_patcher.stop()
@@ -92,7 +94,8 @@ class MariaDbStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
 
     def test_execute_mariadb_insert_query(self):
         execute_query_fetch_all(
@@ -108,7 +111,8 @@ class MariaDbStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
 
     def test_execute_mariadb_update_query(self):
         execute_query_fetch_all(
@@ -123,7 +127,8 @@ class MariaDbStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
 
     def test_execute_mariadb_delete_query(self):
         execute_query_fetch_all(
@@ -137,4 +142,5 @@ class MariaDbStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
@@ -22,6 +22,7 @@ import pytest
 
 from evadb.catalog.models.utils import DatabaseCatalogEntry
 from evadb.server.command_handler import execute_query_fetch_all
+from evadb.third_party.databases.interface import clear_database_handler_pool
 
 
 class NativeQueryResponse:
@@ -81,6 +82,7 @@ class MySQLNativeStorageEngineTest(unittest.TestCase):
         )
 
     def tearDown(self):
+        clear_database_handler_pool("mysql", **self.get_mysql_params())
         self.get_database_catalog_entry_patcher.stop()
         self.execute_native_query_patcher.stop()
         self.connect_patcher.stop()
@@ -97,7 +99,8 @@ class MySQLNativeStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
 
     def test_execute_mysql_insert_query(self):
         execute_query_fetch_all(
@@ -113,7 +116,8 @@ class MySQLNativeStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
 
     def test_execute_mysql_update_query(self):
         execute_query_fetch_all(
@@ -128,7 +132,8 @@ class MySQLNativeStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
 
     def test_execute_mysql_delete_query(self):
         execute_query_fetch_all(
@@ -142,4 +147,5 @@ class MySQLNativeStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
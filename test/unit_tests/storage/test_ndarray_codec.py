@@ -0,0 +1,105 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+import numpy as np
+
+from evadb.catalog.catalog_type import ColumnType, NdArrayType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.storage.ndarray_codec import NdArrayCodec
+from evadb.utils.generic_utils import (
+    PickleSerializer,
+    try_to_import_lz4,
+    try_to_import_zstandard,
+)
+
+
+class NdArrayCodecTest(unittest.TestCase):
+    def test_should_select_codec_from_column_type(self):
+        feature_col = ColumnCatalogEntry(
+            "features", ColumnType.NDARRAY, False, NdArrayType.FLOAT32, [2048]
+        )
+        text_col = ColumnCatalogEntry(
+            "labels", ColumnType.NDARRAY, False, NdArrayType.STR, [None]
+        )
+        int_col = ColumnCatalogEntry("id", ColumnType.INTEGER)
+        self.assertIsNotNone(NdArrayCodec.for_column(feature_col))
+        self.assertIsNone(NdArrayCodec.for_column(text_col))
+        self.assertIsNone(NdArrayCodec.for_column(int_col))
+
+    def test_should_roundtrip_arrays(self):
+        codec = NdArrayCodec()
+        values = [
+            np.arange(12, dtype=np.uint8).reshape(2, 2, 3),
+            np.random.rand(5).astype(np.float32),
+            np.array(3.0, dtype=np.float64),
+            np.array([True, False]),
+            np.arange(4, dtype=">i4"),
+        ]
+        for value in values:
+            decoded = codec.decode(codec.encode(value))
+            self.assertEqual(decoded.shape, value.shape)
+            np.testing.assert_array_equal(decoded, value)
+
+    def test_should_decode_column_into_stacked_array(self):
+        codec = NdArrayCodec()
+        values = [np.full((3, 2), i, dtype=np.float32) for i in range(4)]
+        decoded = codec.decode_column([codec.encode(value) for value in values])
+        self.assertEqual(len(decoded), 4)
+        for expected, actual in zip(values, decoded):
+            np.testing.assert_array_equal(expected, actual)
+        # all the cells share one writable buffer
+        self.assertIs(decoded[0].base, decoded[1].base)
+        decoded[0][0, 0] = 10
+        self.assertEqual(decoded[0][0, 0], 10)
+
+    def test_should_decode_mixed_shapes_and_pickled_cells(self):
+        codec = NdArrayCodec()
+        values = [
+            np.zeros((2, 2)),
+            np.ones(3),
+            np.array(["a", "b"], dtype=object),
+            None,
+        ]
+        encoded = [codec.encode(value) for value in values[:3]]
+        # rows written by older versions of the storage engine
+        encoded.append(PickleSerializer.serialize(np.arange(3)))
+        encoded.append(None)
+        decoded = codec.decode_column(encoded)
+        np.testing.assert_array_equal(decoded[0], values[0])
+        np.testing.assert_array_equal(decoded[1], values[1])
+        np.testing.assert_array_equal(decoded[2], values[2])
+        np.testing.assert_array_equal(decoded[3], np.arange(3))
+        self.assertIsNone(decoded[4])
+
+    def test_should_compress_arrays(self):
+        for compression, try_to_import in [
+            ("lz4", try_to_import_lz4),
+            ("zstd", try_to_import_zstandard),
+        ]:
+            try:
+                try_to_import()
+            except ValueError:
+                continue
+            codec = NdArrayCodec(compression)
+            value = np.zeros((64, 64), dtype=np.float32)
+            encoded = codec.encode(value)
+            self.assertLess(len(encoded), value.nbytes)
+            # decoding does not depend on the configured compression
+            np.testing.assert_array_equal(NdArrayCodec().decode(encoded), value)
+
+    def test_should_raise_on_invalid_compression(self):
+        with self.assertRaises(ValueError):
+            NdArrayCodec("gzip")
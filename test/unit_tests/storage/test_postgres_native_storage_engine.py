@@ -22,6 +22,7 @@ import pytest
 
 from evadb.catalog.models.utils import DatabaseCatalogEntry
 from evadb.server.command_handler import execute_query_fetch_all
+from evadb.third_party.databases.interface import clear_database_handler_pool
 
 
 class NativeQueryResponse:
@@ -82,6 +83,7 @@ class PostgresNativeStorageEngineTest(unittest.TestCase):
         )
 
     def tearDown(self):
+        clear_database_handler_pool("postgres", **self.get_postgres_params())
         self.get_database_catalog_entry_patcher.stop()
         self.execute_native_query_patcher.stop()
         self.connect_patcher.stop()
@@ -98,7 +100,8 @@ class PostgresNativeStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
 
     def test_execute_postgres_insert_query(self):
         execute_query_fetch_all(
@@ -114,7 +117,8 @@ class PostgresNativeStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
 
     def test_execute_postgres_update_query(self):
         execute_query_fetch_all(
@@ -129,7 +133,8 @@ class PostgresNativeStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
 
     def test_execute_postgres_delete_query(self):
         execute_query_fetch_all(
@@ -143,4 +148,5 @@ class PostgresNativeStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
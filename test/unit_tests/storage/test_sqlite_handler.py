@@ -0,0 +1,82 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import tempfile
+import unittest
+
+from evadb.third_party.databases.interface import (
+    DatabaseHandlerPool,
+    clear_database_handler_pool,
+    get_database_handler,
+)
+from evadb.third_party.databases.sqlite.sqlite_handler import SQLiteHandler
+
+
+class SQLiteHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.database = os.path.join(self.tmp_dir.name, "native.db")
+        self.handler = SQLiteHandler("test_data_source", database=self.database)
+        self.handler.connect()
+        self.handler.execute_native_query(
+            "CREATE TABLE test_table (name VARCHAR(10), age INT)"
+        )
+        values = ", ".join(f"('name_{i}', {i})" for i in range(25))
+        self.handler.execute_native_query(f"INSERT INTO test_table VALUES {values}")
+
+    def tearDown(self):
+        self.handler.disconnect()
+        self.tmp_dir.cleanup()
+
+    def test_get_database_handler_should_reuse_connections(self):
+        params = {"database": self.database}
+        try:
+            with get_database_handler("sqlite", **params) as handler:
+                connection = handler.connection
+            with get_database_handler("sqlite", **params) as handler:
+                self.assertIs(handler.connection, connection)
+
+            # broken connections are replaced
+            connection.close()
+            with get_database_handler("sqlite", **params) as handler:
+                self.assertIsNot(handler.connection, connection)
+                self.assertTrue(handler.check_connection().status)
+
+            # connections are not reused after an error
+            with self.assertRaises(ValueError):
+                with get_database_handler("sqlite", **params) as handler:
+                    connection = handler.connection
+                    raise ValueError()
+            with get_database_handler("sqlite", **params) as handler:
+                self.assertIsNot(handler.connection, connection)
+        finally:
+            clear_database_handler_pool("sqlite", **params)
+
+    def test_pool_should_evict_idle_handlers(self):
+        params = {"database": self.database}
+        pool = DatabaseHandlerPool("sqlite", params, size=1, idle_timeout=60)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        # the pool is full
+        pool.release(second)
+        self.assertFalse(second.check_connection().status)
+        self.assertIs(pool.acquire(), first)
+
+        pool.release(first)
+        pool.idle_timeout = -1
+        handler = pool.acquire()
+        self.assertIsNot(handler, first)
+        self.assertFalse(first.check_connection().status)
+        handler.disconnect()
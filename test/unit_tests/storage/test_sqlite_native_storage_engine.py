@@ -21,6 +21,7 @@ import pytest
 
 from evadb.catalog.models.utils import DatabaseCatalogEntry
 from evadb.server.command_handler import execute_query_fetch_all
+from evadb.third_party.databases.interface import clear_database_handler_pool
 
 
 class NativeQueryResponse:
@@ -73,6 +74,7 @@ class SQLiteNativeStorageEngineTest(unittest.TestCase):
         )
 
     def tearDown(self):
+        clear_database_handler_pool("sqlite", **self.get_sqlite_params())
         self.get_database_catalog_entry_patcher.stop()
         self.execute_native_query_patcher.stop()
         self.connect_patcher.stop()
@@ -89,7 +91,8 @@ class SQLiteNativeStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
 
     def test_execute_sqlite_insert_query(self):
         execute_query_fetch_all(
@@ -105,7 +108,8 @@ class SQLiteNativeStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
 
     def test_execute_sqlite_update_query(self):
         execute_query_fetch_all(
@@ -120,7 +124,8 @@ class SQLiteNativeStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
 
     def test_execute_sqlite_delete_query(self):
         execute_query_fetch_all(
@@ -134,4 +139,5 @@ class SQLiteNativeStorageEngineTest(unittest.TestCase):
         self.connect_mock.assert_called_once()
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
-        self.disconnect_mock.assert_called_once()
+        # the handler is returned to the pool instead of being disconnected
+        self.disconnect_mock.assert_not_called()
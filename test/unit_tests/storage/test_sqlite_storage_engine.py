@@ -15,17 +15,31 @@
 import shutil
 import unittest
 from test.util import (
+    NUM_FRAMES,
     create_dummy_batches,
     get_evadb_for_testing,
     suffix_pytest_xdist_worker_id_to_dir,
 )
+from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from evadb.catalog.catalog_type import ColumnType, NdArrayType, TableType
+from evadb.catalog.catalog_utils import bump_catalog_version
+from evadb.catalog.models.base_model import BaseModel
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
-from evadb.catalog.sql_config import IDENTIFIER_COLUMN
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage.batch import Batch
+from evadb.parser.create_statement import ColumnDefinition
+from evadb.parser.table_ref import TableInfo
 from evadb.storage.sqlite_storage_engine import SQLStorageEngine
 
 
@@ -88,6 +102,233 @@ class SQLStorageEngineTest(unittest.TestCase):
         # clean up
         sqlengine.drop(self.table)
 
+    def test_should_read_rows_in_batches_of_batch_mem_size(self):
+        dummy_batches = list(create_dummy_batches())
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            sqlengine.write(self.table, batch)
+
+        # a single batch when everything fits in memory
+        read_batch = list(sqlengine.read(self.table))
+        self.assertEqual(len(read_batch), 1)
+        self.assertEqual(len(read_batch[0]), NUM_FRAMES)
+
+        # multi-row batches when batch_mem_size is smaller than the table
+        read_batch = list(sqlengine.read(self.table, batch_mem_size=15000))
+        self.assertGreater(len(read_batch), 1)
+        self.assertTrue(all(len(batch) > 1 for batch in read_batch[:-1]))
+        self.assertEqual(sum(len(batch) for batch in read_batch), NUM_FRAMES)
+        ids = [id for batch in read_batch for id in batch.frames["id"]]
+        self.assertEqual(ids, list(range(NUM_FRAMES)))
+        self.assertEqual(
+            list(read_batch[0].frames[ROW_NUM_COLUMN]),
+            list(read_batch[0].frames[IDENTIFIER_COLUMN]),
+        )
+        # clean up
+        sqlengine.drop(self.table)
+
+    def test_should_write_rows_in_chunks(self):
+        dummy_batches = list(create_dummy_batches(batch_size=NUM_FRAMES))
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+        with patch("evadb.storage.storage_utils.BULK_INSERT_CHUNK_SIZE", 3):
+            for batch in dummy_batches:
+                batch.drop_column_alias()
+                sqlengine.write(self.table, batch)
+
+        read_batch = list(sqlengine.read(self.table))
+        self.assertEqual(len(read_batch[0]), NUM_FRAMES)
+        self.assertEqual(list(read_batch[0].frames["id"]), list(range(NUM_FRAMES)))
+        for expected, actual in zip(
+            dummy_batches[0].frames["data"], read_batch[0].frames["data"]
+        ):
+            self.assertTrue((expected == actual).all())
+        # clean up
+        sqlengine.drop(self.table)
+
+    def test_should_push_predicate_and_columns_into_sql(self):
+        dummy_batches = list(create_dummy_batches())
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            sqlengine.write(self.table, batch)
+
+        # id >= 3 AND id < 7
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            ComparisonExpression(
+                ExpressionType.COMPARE_GEQ,
+                TupleValueExpression(name="id"),
+                ConstantValueExpression(3),
+            ),
+            ComparisonExpression(
+                ExpressionType.COMPARE_LESSER,
+                TupleValueExpression(name="id"),
+                ConstantValueExpression(7),
+            ),
+        )
+        read_batch = list(
+            sqlengine.read(self.table, predicate=predicate, columns=["id"])
+        )
+        self.assertEqual(len(read_batch), 1)
+        self.assertEqual(list(read_batch[0].frames["id"]), [3, 4, 5, 6])
+        # the row id is always read
+        self.assertEqual(
+            set(read_batch[0].columns), {IDENTIFIER_COLUMN, "id", ROW_NUM_COLUMN}
+        )
+        # clean up
+        sqlengine.drop(self.table)
+
+    def test_should_cache_reflected_tables(self):
+        dummy_batches = list(create_dummy_batches())
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+
+        # no schema introspection on writes and reads
+        with patch("evadb.storage.sqlite_storage_engine.inspect") as inspect_mock:
+            for batch in dummy_batches:
+                batch.drop_column_alias()
+                sqlengine.write(self.table, batch)
+            read_batches = list(sqlengine.read(self.table))
+            self.assertEqual(sum(len(batch) for batch in read_batches), NUM_FRAMES)
+            inspect_mock.assert_not_called()
+
+        table = sqlengine._try_loading_table_via_reflection(self.table.name)
+        BaseModel.metadata.remove(table)
+        self.assertIs(
+            sqlengine._try_loading_table_via_reflection(self.table.name), table
+        )
+
+        # the table is reflected again after a schema change
+        bump_catalog_version()
+        reflected_table = sqlengine._try_loading_table_via_reflection(self.table.name)
+        self.assertIsNot(reflected_table, table)
+        self.assertEqual(reflected_table.columns.keys(), table.columns.keys())
+        # clean up
+        sqlengine.drop(self.table)
+
+    @patch("evadb.storage.sqlite_storage_engine.ZONE_MAP_CHUNK_SIZE", 8)
+    def test_should_skip_chunks_using_zone_maps(self):
+        evadb = get_evadb_for_testing()
+        catalog = evadb.catalog()
+        table = catalog.create_and_insert_table_catalog_entry(
+            TableInfo("zone_map_table"),
+            [
+                ColumnDefinition("name", ColumnType.TEXT, None, None),
+                ColumnDefinition("id", ColumnType.INTEGER, None, None),
+            ],
+        )
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(table)
+        # writes that are not aligned with the chunks
+        for start in range(0, 100, 10):
+            ids = list(range(start, start + 10))
+            sqlengine.write(
+                table, Batch(pd.DataFrame({"name": [str(i) for i in ids], "id": ids}))
+            )
+
+        # one zone map per chunk of 8 row ids, only for the integer column
+        zone_maps = sorted(
+            catalog.get_zone_map_catalog_entries(table), key=lambda z: z.chunk_id
+        )
+        self.assertEqual(len(zone_maps), 13)
+        self.assertEqual(
+            [(z.min_value, z.max_value) for z in zone_maps[:2]], [(0, 7), (8, 15)]
+        )
+        self.assertEqual(zone_maps[-1].row_count, 4)
+        self.assertEqual(zone_maps[-1].null_count, 0)
+
+        def id_predicate(etype, value):
+            return ComparisonExpression(
+                etype, TupleValueExpression(name="id"), ConstantValueExpression(value)
+            )
+
+        table_to_read = sqlengine._try_loading_table_via_reflection(table.name)
+        for predicate, expected in [
+            (id_predicate(ExpressionType.COMPARE_GEQ, 90), list(range(90, 100))),
+            (id_predicate(ExpressionType.COMPARE_EQUAL, 42), [42]),
+            (id_predicate(ExpressionType.COMPARE_GREATER, 1000), []),
+        ]:
+            self.assertIsNotNone(
+                sqlengine._get_zone_map_filter_clause(table, table_to_read, predicate)
+            )
+            read_batches = list(sqlengine.read(table, predicate=predicate))
+            ids = [id for batch in read_batches for id in batch.frames["id"]]
+            self.assertEqual(ids, expected)
+
+        # predicates on columns without zone maps cannot skip chunks
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            TupleValueExpression(name="name"),
+            ConstantValueExpression("42"),
+        )
+        self.assertIsNone(
+            sqlengine._get_zone_map_filter_clause(table, table_to_read, predicate)
+        )
+
+        # the rows are not stored if their zone maps cannot be stored
+        with patch.object(
+            sqlengine._catalog,
+            "upsert_zone_map_catalog_entries",
+            side_effect=Exception("zone map failure"),
+        ):
+            with self.assertRaises(Exception):
+                sqlengine.write(
+                    table, Batch(pd.DataFrame({"name": ["-1"], "id": [-1]}))
+                )
+        read_batches = list(sqlengine.read(table))
+        self.assertEqual(sum(len(batch) for batch in read_batches), 100)
+
+        # the zone map of the partially filled last chunk is merged with the
+        # statistics of the new rows
+        sqlengine.write(table, Batch(pd.DataFrame({"name": ["-5"], "id": [-5]})))
+        predicate = id_predicate(ExpressionType.COMPARE_EQUAL, -5)
+        read_batches = list(sqlengine.read(table, predicate=predicate))
+        self.assertEqual(
+            [id for batch in read_batches for id in batch.frames["id"]], [-5]
+        )
+        last_zone_map = max(
+            catalog.get_zone_map_catalog_entries(table), key=lambda z: z.chunk_id
+        )
+        self.assertEqual((last_zone_map.min_value, last_zone_map.max_value), (-5, 99))
+        self.assertEqual(last_zone_map.row_count, 5)
+
+        # the zone maps follow the row ids given by the database, which may
+        # leave gaps (eg. the sequences of postgres)
+        columns = sqlengine._get_zone_map_columns(table)
+        batch = Batch(pd.DataFrame({"name": ["a", "b", "c"], "id": [7, 3, 5]}))
+        entries = sqlengine._get_zone_map_entries(
+            table, columns, batch, np.array([110, 111, 120]), last_row_id=101
+        )
+        self.assertEqual(
+            [(z.chunk_id, z.min_value, z.max_value, z.row_count) for z in entries],
+            [(13, 3, 7, 2), (14, 5, 5, 1)],
+        )
+        # the chunk of the last row of the previous writes is merged
+        entries = sqlengine._get_zone_map_entries(
+            table, columns, batch, np.array([102, 103, 130]), last_row_id=101
+        )
+        self.assertEqual(
+            [(z.chunk_id, z.min_value, z.max_value, z.row_count) for z in entries],
+            [(12, -5, 99, 7), (16, 5, 5, 1)],
+        )
+
+        # the zone maps are removed with the table
+        sqlengine.drop(table)
+        catalog.delete_table_catalog_entry(table)
+        self.assertEqual(catalog.get_zone_map_catalog_entries(table), [])
+
     def test_rename(self):
         table_info = TableCatalogEntry(
             "new_name", "new_name", table_type=TableType.VIDEO_DATA
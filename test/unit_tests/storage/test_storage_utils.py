@@ -0,0 +1,104 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import threading
+import unittest
+
+import pandas as pd
+
+from evadb.models.storage.batch import Batch
+from evadb.storage.storage_utils import concat_batches, parallel_map, rows_to_batches
+from evadb.utils.generic_utils import get_size
+
+
+def _square_in_process(value: int) -> tuple:
+    return value * value, os.getpid()
+
+
+def _reciprocal(value: int) -> float:
+    return 1 / value
+
+
+class StorageUtilsTest(unittest.TestCase):
+    def test_parallel_map_should_preserve_item_order(self):
+        for num_workers in [1, 2]:
+            results = list(
+                parallel_map(_square_in_process, range(10), num_workers=num_workers)
+            )
+            self.assertEqual(
+                [value for value, _ in results], [i * i for i in range(10)]
+            )
+            pids = {pid for _, pid in results}
+            if num_workers == 1:
+                self.assertEqual(pids, {os.getpid()})
+            else:
+                self.assertNotIn(os.getpid(), pids)
+
+    def test_parallel_map_should_run_in_threads(self):
+        # the function and the results do not need to be picklable
+        results = parallel_map(
+            lambda value: (lambda: value * value, threading.get_ident()),
+            range(10),
+            num_workers=2,
+            use_threads=True,
+        )
+        results = list(results)
+        self.assertEqual(
+            [square() for square, _ in results], [i * i for i in range(10)]
+        )
+        self.assertNotIn(threading.get_ident(), {ident for _, ident in results})
+
+    def test_parallel_map_should_raise_errors(self):
+        with self.assertRaises(ZeroDivisionError):
+            list(parallel_map(_reciprocal, [1, 0], num_workers=2))
+
+    def test_parallel_map_should_stop_on_close(self):
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        results = parallel_map(_square_in_process, items(), num_workers=2, prefetch=1)
+        self.assertEqual(next(results)[0], 0)
+        results.close()
+        self.assertLess(len(consumed), 100)
+
+    def test_rows_to_batches_should_group_rows(self):
+        rows = ({"id": i, "name": str(i)} for i in range(10))
+        batches = list(rows_to_batches(rows, 1))
+        self.assertEqual([len(batch) for batch in batches], [1] * 10)
+
+        rows = [{"id": i, "name": str(i)} for i in range(10)]
+        row_size = get_size(rows[0])
+        batches = list(rows_to_batches(rows, 4 * row_size))
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+        self.assertEqual(list(Batch.concat(batches).frames["id"]), list(range(10)))
+        self.assertEqual(list(rows_to_batches([], 1)), [])
+
+    def test_concat_batches_should_merge_small_batches(self):
+        batches = [
+            Batch(pd.DataFrame({"id": range(i * 10, i * 10 + 10)})) for i in range(10)
+        ]
+        batch_size = int(batches[0].frames.memory_usage(deep=True).sum())
+
+        merged = list(concat_batches(batches, 3 * batch_size))
+        self.assertEqual([len(batch) for batch in merged], [30, 30, 30, 10])
+        self.assertEqual(list(Batch.concat(merged).frames["id"]), list(range(100)))
+
+        # larger batches are returned as they are
+        merged = list(concat_batches(batches, 1))
+        self.assertEqual([len(batch) for batch in merged], [10] * 10)
@@ -12,6 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import threading
+import time
 import unittest
 from test.util import (
     create_sample_video,
@@ -29,6 +31,7 @@ from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.models.storage.batch import Batch
 from evadb.storage.storage_engine import StorageEngine
+from evadb.storage.storage_utils import parallel_scan
 
 
 @pytest.mark.notparallel
@@ -118,3 +121,55 @@ class VideoStorageEngineTest(unittest.TestCase):
 
         with self.assertRaises(Exception):
             self.video_engine.delete(missing_table_info, None)
+
+    def test_parallel_scan_should_preserve_source_order(self):
+        def read_source(source):
+            # later sources finish first
+            for i in range(3):
+                time.sleep(0.01 * (5 - source))
+                yield (source, i)
+
+        expected = [(source, i) for source in range(5) for i in range(3)]
+        batches = list(parallel_scan(read_source, range(5), num_workers=3))
+        self.assertEqual(batches, expected)
+
+        batches = list(
+            parallel_scan(read_source, range(5), num_workers=3, ordered=False)
+        )
+        self.assertEqual(sorted(batches), expected)
+        # the batches of every source are still in order
+        for source in range(5):
+            self.assertEqual(
+                [batch for batch in batches if batch[0] == source],
+                [(source, i) for i in range(3)],
+            )
+
+    def test_parallel_scan_should_stop_workers_on_close(self):
+        read_counts = {}
+        lock = threading.Lock()
+
+        def read_source(source):
+            for i in range(1000):
+                with lock:
+                    read_counts[source] = i + 1
+                yield (source, i)
+
+        for ordered in [True, False]:
+            read_counts.clear()
+            batches = parallel_scan(
+                read_source, range(4), num_workers=2, prefetch=2, ordered=ordered
+            )
+            self.assertIsNotNone(next(batches))
+            batches.close()
+            # only the prefetched batches of the running sources were read
+            self.assertLessEqual(len(read_counts), 2)
+            self.assertTrue(all(count < 10 for count in read_counts.values()))
+
+    def test_parallel_scan_should_raise_source_errors(self):
+        def read_source(source):
+            yield source
+            if source == 1:
+                raise ValueError("corrupted video")
+
+        with self.assertRaises(ValueError):
+            list(parallel_scan(read_source, range(3), num_workers=2))